@@ -9,16 +9,18 @@ It was developed as a challenge project for the FIAP Software Architecture Post
 """
 
 import os
-from fastapi import Depends, FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.security import HTTPBearer
 
-from builder import build_db, seed_db
-from src.adapters.driven.infra.database.db import start_db
+from src.adapters.driven.infra.database.db import close_db, db_router, start_db
 from src.adapters.driver.API import (
+    health_router,
     produto_router,
     maintenance_router,
 )
+from src.adapters.driver.API.responses import FastJSONResponse
 
 auth_scheme = HTTPBearer()
 
@@ -29,8 +31,35 @@ def get_token(token: str = Depends(auth_scheme)):
     return token
 
 
+def prepare_db():
+    """Builds and seeds the database, as DB_BUILD and DB_SEED ask."""
+    # Imported lazily, the seeder depends on dev only packages
+    if int(os.getenv("DB_BUILD", 0)):
+        from builder import build_db
+
+        build_db()
+    if int(os.getenv("DB_SEED", 0)):
+        from builder import seed_db
+
+        seed_db()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start_db()
+    # The pre-fork server prepares it once in the master, not in every worker
+    if not getattr(app.state, "db_prepared", False):
+        prepare_db()
+    health_router.event_loop_lag_monitor.start()
+    yield
+    await health_router.event_loop_lag_monitor.stop()
+    close_db()
+
+
 STAGE_PREFIX = os.getenv("STAGE_PREFIX", "dev")
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     title="FastFood API - FIAP-9SOAT 🚀",
     description=__doc__,
     summary="Challenge project for FIAP Software Architecture Post Graduation 9th class.",
@@ -47,11 +76,11 @@ app = FastAPI(
     },
 )
 
-start_db()
-if int(os.getenv("DB_BUILD", 0)):
-    build_db()
-if int(os.getenv("DB_SEED", 0)):
-    seed_db()
+
+@app.middleware("http")
+async def database_request_scope(request: Request, call_next):
+    with db_router.request_scope():
+        return await call_next(request)
 
 
 @app.get(f"/{STAGE_PREFIX}/new_docs", include_in_schema=False)
@@ -71,10 +100,12 @@ async def openapijson():
 def health_check():
     """
     Request this to check on the server health.
+    For probes use /health/live and /health/ready.
     """
     return "Healthy"
 
 
+app.include_router(health_router.router, prefix=f"/{STAGE_PREFIX}")
 app.include_router(produto_router.router, prefix=f"/{STAGE_PREFIX}")
 app.include_router(
     maintenance_router.router,
@@ -1,17 +1,46 @@
 import argparse
-
-from migration.seeder.seeder import seed_data
-from migration.builder.raw_creation import create_tables
+import os
 
 
 def build_db():
+    from migration.builder.raw_creation import create_tables
+
     create_tables()
 
 
 def seed_db():
+    # faker is a dev dependency, only import the seeder when it is used
+    from migration.seeder.seeder import seed_data
+
     seed_data()
 
 
+def archive_db():
+    """Moves the soft deleted rows older than ARCHIVE_RETENTION_DAYS to the archive tables."""
+    from datetime import timedelta
+
+    from src.adapters.driven.infra.database.db import db_router
+    from src.adapters.driven.infra.persistence.soft_delete_archiver import (
+        SoftDeleteArchiver,
+    )
+
+    archiver = SoftDeleteArchiver(
+        db_router,
+        retention=timedelta(days=int(os.getenv("ARCHIVE_RETENTION_DAYS") or 30)),
+        batch_size=int(os.getenv("ARCHIVE_BATCH_SIZE") or 1000),
+    )
+    return archiver.run()
+
+
+def refresh_catalog():
+    """Rebuilds every row of the denormalized product_catalog table."""
+    from src.adapters.driven.infra.persistence.product_catalog_projection import (
+        ProductCatalogProjection,
+    )
+
+    return ProductCatalogProjection().refresh()
+
+
 def build():
     build_db()
     seed_db()
@@ -22,6 +51,15 @@ if __name__ == "__main__":
 
     parser.add_argument("-s", "--seed", action="store_true", help="Seed the database")
     parser.add_argument("-b", "--build", action="store_true", help="Build the database")
+    parser.add_argument(
+        "-a", "--archive", action="store_true", help="Archive old soft deleted rows"
+    )
+    parser.add_argument(
+        "-c",
+        "--refresh-catalog",
+        action="store_true",
+        help="Rebuild the denormalized product catalog",
+    )
 
     args = parser.parse_args()
 
@@ -30,3 +68,9 @@ if __name__ == "__main__":
 
     if args.seed:
         seed_db()
+
+    if args.archive:
+        archive_db()
+
+    if args.refresh_catalog:
+        refresh_catalog()
@@ -0,0 +1,109 @@
+import argparse
+import gc
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, NamedTuple
+
+from src.core.domain.read_models.produto_catalog import (
+    CatalogCategory,
+    CatalogCurrency,
+    CatalogProduct,
+    ProdutoCatalog,
+)
+
+
+class MemoryFootprint(NamedTuple):
+    representation: str
+    products: int
+    bytes: int
+
+    @property
+    def bytes_per_product(self) -> float:
+        return self.bytes / self.products
+
+
+def build_catalog(count: int, components_per_product: int = 2) -> ProdutoCatalog:
+    """A menu of count products, every one with its own name and timestamps."""
+    start = datetime(2024, 1, 1)
+    catalog = ProdutoCatalog()
+    catalog.currencies[1] = CatalogCurrency(1, "R$", "Real", "BRL", True, start, start)
+    catalog.categories[1] = CatalogCategory(1, "Lanches", None, False, start, start)
+    catalog.categories[2] = CatalogCategory(2, "Adicionais", None, True, start, start)
+    components = tuple(range(1, components_per_product + 1))
+    for product_id in range(1, count + 1):
+        is_component = product_id <= components_per_product
+        created_at = start + timedelta(seconds=product_id)
+        catalog.products[product_id] = CatalogProduct(
+            id=product_id,
+            name=f"Produto {product_id}",
+            category_id=2 if is_component else 1,
+            price=2.5 if is_component else 27.9,
+            currency_id=1,
+            is_active=True,
+            allow_components=not is_component,
+            version=1,
+            created_at=created_at,
+            updated_at=created_at + timedelta(seconds=1),
+            components=() if is_component else components,
+            order_count=product_id % 7,
+        )
+        catalog.ids.append(product_id)
+    return catalog
+
+
+def retained_bytes(build: Callable[[], Any]) -> int:
+    """Memory still allocated by what build returns, once its temporaries are freed."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained
+
+
+def measure(count: int, components_per_product: int = 2) -> List[MemoryFootprint]:
+    return [
+        MemoryFootprint(
+            "catalog",
+            count,
+            retained_bytes(lambda: build_catalog(count, components_per_product)),
+        ),
+        MemoryFootprint(
+            "aggregates",
+            count,
+            retained_bytes(
+                lambda: build_catalog(count, components_per_product).to_aggregates()
+            ),
+        ),
+    ]
+
+
+def build_report(footprints: List[MemoryFootprint]) -> str:
+    baseline = footprints[-1]
+    lines = [
+        f"{'representation':>14} {'products':>9} {'MB':>8} {'per product (B)':>16}"
+    ]
+    for footprint in footprints:
+        lines.append(
+            f"{footprint.representation:>14} {footprint.products:>9} "
+            f"{footprint.bytes / 1024 / 1024:>8.1f} {footprint.bytes_per_product:>16.0f}"
+            f"  {footprint.bytes / baseline.bytes:.0%}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Catalog memory footprint report.")
+
+    parser.add_argument("-p", "--products", type=int, default=100_000, help="Products")
+    parser.add_argument(
+        "-c", "--components", type=int, default=2, help="Components per product"
+    )
+
+    args = parser.parse_args()
+
+    print(build_report(measure(args.products, args.components)))
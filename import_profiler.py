@@ -0,0 +1,86 @@
+import argparse
+import re
+import subprocess
+import sys
+from typing import List, NamedTuple, Tuple
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)")
+
+
+class ImportTiming(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_import_times(output: str) -> List[ImportTiming]:
+    timings = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        timings.append(
+            ImportTiming(module, int(self_us), int(cumulative_us), len(indent) // 2)
+        )
+    return timings
+
+
+def profile_imports(module: str = "app") -> Tuple[List[ImportTiming], int]:
+    """Imports the module in a fresh interpreter, returns the timings and its peak RSS in KB."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import resource, {module}; "
+            "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_import_times(result.stderr), int(result.stdout.split()[-1])
+
+
+def build_report(timings: List[ImportTiming], max_rss_kb: int, top: int = 20) -> str:
+    total_us = sum(timing.cumulative_us for timing in timings if timing.depth == 0)
+    lines = [
+        f"Modules imported: {len(timings)}",
+        f"Total import time: {total_us / 1000:.1f} ms",
+        f"Peak RSS: {max_rss_kb / 1024:.1f} MB",
+        "",
+        f"{'cumulative (ms)':>16} {'self (ms)':>10}  module",
+    ]
+    for timing in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        lines.append(
+            f"{timing.cumulative_us / 1000:>16.1f} {timing.self_us / 1000:>10.1f}  {timing.module}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import time profiling report.")
+
+    parser.add_argument("module", nargs="?", default="app", help="Module to import")
+    parser.add_argument("-t", "--top", type=int, default=20, help="Modules to list")
+    parser.add_argument(
+        "-f",
+        "--forbid",
+        action="append",
+        default=[],
+        help="Fail if this package is imported (e.g. faker)",
+    )
+
+    args = parser.parse_args()
+
+    timings, max_rss_kb = profile_imports(args.module)
+    print(build_report(timings, max_rss_kb, args.top))
+
+    imported = {timing.module.split(".")[0] for timing in timings}
+    forbidden = sorted(set(args.forbid) & imported)
+    if forbidden:
+        print(f"\nForbidden packages imported: {', '.join(forbidden)}")
+        sys.exit(1)
@@ -0,0 +1,194 @@
+import argparse
+import gc
+from datetime import datetime
+from decimal import Decimal
+from time import perf_counter
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+from src.adapters.data_mappers.identity_map import IdentityMap
+from src.adapters.data_mappers.produto_entity_data_mapper import (
+    ProdutoEntityDataMapper,
+)
+from src.adapters.driven.infra.models.categories import Category
+from src.adapters.driven.infra.models.currencies import Currency
+from src.adapters.driven.infra.models.product_components import ProductComponent
+from src.adapters.driven.infra.models.products import Product
+from src.core.domain.entities.categoria_entity import PartialCategoriaEntity
+from src.core.domain.entities.currency_entity import PartialCurrencyEntity
+from src.core.domain.entities.produto_entity import PartialProdutoEntity
+from src.core.domain.value_objects.preco_value_object import PrecoValueObject
+
+Row = Tuple[Product, List[Product]]
+
+
+class MappingTiming(NamedTuple):
+    mapper: str
+    rows: int
+    seconds: float
+
+    @property
+    def us_per_row(self) -> float:
+        return self.seconds / self.rows * 1_000_000
+
+
+def build_rows(count: int, components_per_product: int = 2) -> List[Row]:
+    """Products with their components, as loaded by the query, without a database."""
+    now = datetime.now()
+    stamps = {"created_at": now, "updated_at": now}
+    currency = Currency(id=1, symbol="R$", name="Real", code="BRL", **stamps)
+    lanches = Category(id=1, name="Lanches", is_component=False, **stamps)
+    adicionais = Category(id=2, name="Adicionais", is_component=True, **stamps)
+    components = [
+        Product(
+            id=index + 1,
+            name=f"Adicional {index}",
+            price=2.5,
+            currency=currency,
+            category=adicionais,
+            is_active=True,
+            **stamps,
+        )
+        for index in range(components_per_product)
+    ]
+    return [
+        (
+            Product(
+                id=components_per_product + index + 1,
+                name=f"Lanche {index}",
+                price=27.9,
+                currency=currency,
+                category=lanches,
+                allow_components=True,
+                is_active=True,
+                **stamps,
+            ),
+            components,
+        )
+        for index in range(count)
+    ]
+
+
+def validated_from_db_to_domain(produto: Product, components: List[Product]):
+    """The validating construction the data mappers used before the trusted path."""
+    currency = produto.currency
+    category = produto.category
+    return PartialProdutoEntity(
+        id=produto.id,
+        name=produto.name,
+        price=PrecoValueObject(
+            value=round(Decimal(produto.price), 2),
+            currency=PartialCurrencyEntity(
+                id=currency.id,
+                name=currency.name,
+                symbol=currency.symbol,
+                code=currency.code,
+                is_active=currency.is_active,
+                created_at=currency.created_at,
+                updated_at=currency.updated_at,
+                deleted_at=currency.deleted_at,
+            ),
+        ),
+        category=PartialCategoriaEntity(
+            id=category.id,
+            name=category.name,
+            description=category.description,
+            is_component=category.is_component,
+            created_at=category.created_at,
+            updated_at=category.updated_at,
+            deleted_at=category.deleted_at,
+        ),
+        created_at=produto.created_at,
+        updated_at=produto.updated_at,
+        deleted_at=produto.deleted_at,
+        allow_components=produto.allow_components,
+        is_active=produto.is_active,
+        version=produto.version,
+        components=[validated_from_db_to_domain(comp, []) for comp in components],
+    )
+
+
+def trusted_from_db_to_domain(produto: Product, components: List[Product]):
+    return ProdutoEntityDataMapper.from_db_to_domain(
+        produto,
+        components=[
+            ProdutoEntityDataMapper.from_db_to_domain(comp, components=[])
+            for comp in components
+        ],
+    )
+
+
+def identity_mapped():
+    """Trusted mapping sharing one identity map over the result set, as the query does."""
+    identity_map = IdentityMap()
+
+    def map_component(component: Product):
+        return ProdutoEntityDataMapper.from_db_to_domain(
+            component, components=[], identity_map=identity_map
+        )
+
+    def mapper(produto: Product, components: List[Product]):
+        return ProdutoEntityDataMapper.from_db_to_domain(
+            produto,
+            components=[
+                identity_map.map(ProductComponent, comp, map_component)
+                for comp in components
+            ],
+            identity_map=identity_map,
+        )
+
+    return mapper
+
+
+# Each repetition maps the rows as a new result set
+MAPPERS: Dict[str, Callable[[], Callable]] = {
+    "validated": lambda: validated_from_db_to_domain,
+    "trusted": lambda: trusted_from_db_to_domain,
+    "identity": identity_mapped,
+}
+
+
+def measure(
+    name: str, new_mapper: Callable[[], Callable], rows: List[Row], repeat: int
+) -> MappingTiming:
+    """Best of the repetitions with the collector off, as timeit does."""
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            mapper = new_mapper()
+            start = perf_counter()
+            for produto, components in rows:
+                mapper(produto, components)
+            best = min(best, perf_counter() - start)
+    finally:
+        gc.enable()
+    return MappingTiming(name, len(rows), best)
+
+
+def build_report(timings: List[MappingTiming]) -> str:
+    baseline = timings[0]
+    lines = [f"{'mapper':>10} {'rows':>8} {'total (ms)':>11} {'per row (us)':>13}"]
+    for timing in timings:
+        lines.append(
+            f"{timing.mapper:>10} {timing.rows:>8} {timing.seconds * 1000:>11.1f} "
+            f"{timing.us_per_row:>13.2f}  x{baseline.seconds / timing.seconds:.2f}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per row data mapping benchmark.")
+
+    parser.add_argument("-r", "--rows", type=int, default=10000, help="Products")
+    parser.add_argument(
+        "-c", "--components", type=int, default=2, help="Components per product"
+    )
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="Repetitions")
+
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows, args.components)
+    timings = [
+        measure(name, mapper, rows, args.repeat) for name, mapper in MAPPERS.items()
+    ]
+    print(build_report(timings))
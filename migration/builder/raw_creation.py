@@ -1,6 +1,17 @@
-from src.adapters.driven.infra import db
+from loguru import logger
+from peewee import fn
+from playhouse.migrate import SchemaMigrator, migrate
+
+from src.adapters.driven.infra import db, db_router
+from src.adapters.driven.infra.models.archives import (
+    ArchivedProduct,
+    ArchivedPurchaseSelectedProduct,
+    ArchivedSelectedProduct,
+    ArchivedSelectedProductComponent,
+)
 from src.adapters.driven.infra.models.categories import Category
 from src.adapters.driven.infra.models.currencies import Currency
+from src.adapters.driven.infra.models.product_catalog import ProductCatalogEntry
 from src.adapters.driven.infra.models.product_components import ProductComponent
 from src.adapters.driven.infra.models.products import Product
 from src.adapters.driven.infra.models.purchase_selected_products import (
@@ -12,17 +23,75 @@ from src.adapters.driven.infra.models.select_product_components import (
     SelectedProductComponent,
 )
 
+MODELS = [
+    Category,
+    Currency,
+    ProductComponent,
+    Product,
+    PurchaseSelectedProducts,
+    SelectedProductComponent,
+    SelectedProduct,
+    ArchivedProduct,
+    ArchivedSelectedProduct,
+    ArchivedPurchaseSelectedProduct,
+    ArchivedSelectedProductComponent,
+    ProductCatalogEntry,
+]
+
 
 def create_tables():
-    db.create_tables(
-        [
-            Category,
-            Currency,
-            ProductComponent,
-            Product,
-            PurchaseSelectedProducts,
-            SelectedProductComponent,
-            SelectedProduct,
-        ],
-        safe=True,
-    )
+    database = db_router.primary
+    existing = [
+        model for model in MODELS if database.table_exists(model._meta.table_name)
+    ]
+    # Existing tables first get their new columns, then their new indexes
+    add_missing_columns(existing)
+    rename_duplicate_product_names()
+    db.create_tables(MODELS, safe=True)
+
+
+def add_missing_columns(models):
+    """Adds the columns created after a table, create_tables skips existing tables."""
+    database = db_router.primary
+    migrator = SchemaMigrator.from_database(database)
+    operations = []
+    for model in models:
+        table = model._meta.table_name
+        existing = {column.name for column in database.get_columns(table)}
+        for field in model._meta.sorted_fields:
+            if field.column_name not in existing:
+                operations.append(migrator.add_column(table, field.column_name, field))
+    migrate(*operations)
+
+
+def rename_duplicate_product_names():
+    """
+    Live products whose names differ only in case would fail the creation of
+    product_name_unique: the oldest keeps its name, the others get their id
+    appended.
+    """
+    database = db_router.primary
+    if not database.table_exists(Product._meta.table_name):
+        return
+    with db_router.use(database):
+        lowered = fn.LOWER(Product.name)
+        duplicated = (
+            Product.select(lowered).group_by(lowered).having(fn.COUNT(Product.id) > 1)
+        )
+        rows = (
+            Product.select(Product.id, Product.name)
+            .where(lowered.in_(duplicated))
+            .order_by(lowered, Product.id)
+            .tuples()
+        )
+        kept = set()
+        for product_id, name in rows:
+            if name.lower() not in kept:
+                kept.add(name.lower())
+                continue
+            renamed = f"{name} ({product_id})"
+            logger.warning(
+                f"Product {product_id} renamed from {name!r} to {renamed!r}, "
+                "the name is already used"
+            )
+            Product.update(name=renamed).where(Product.id == product_id).execute()
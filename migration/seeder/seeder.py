@@ -1,7 +1,9 @@
 from decimal import Decimal
 from typing import List, Tuple
 from faker import Faker
+from loguru import logger
 
+from src.adapters.driven.infra import db
 
 from src.adapters.driven.infra.models.categories import Category
 from src.adapters.driven.infra.models.currencies import Currency
@@ -278,12 +280,24 @@ def _seed_purchases_selected_products_selected_products_components_and_payments(
     ]
 
 
-def seed_data():
-    bebidas, lanches, acompanhamentos, adicionais = _seed_category()
-    currency = _seed_currency()
-    product_ids, components = _seed_product_and_product_components(
-        bebidas, lanches, acompanhamentos, adicionais
-    )
-    _seed_purchases_selected_products_selected_products_components_and_payments(
-        product_ids, components, currency
+def is_seeded() -> bool:
+    return any(
+        model.select_including_deleted().exists()
+        for model in (Category, Currency, Product)
     )
+
+
+def seed_data():
+    # DB_SEED runs on every start, the product names are unique
+    if is_seeded():
+        logger.info("Database already seeded, skipping")
+        return
+    with db.atomic():
+        bebidas, lanches, acompanhamentos, adicionais = _seed_category()
+        currency = _seed_currency()
+        product_ids, components = _seed_product_and_product_components(
+            bebidas, lanches, acompanhamentos, adicionais
+        )
+        _seed_purchases_selected_products_selected_products_components_and_payments(
+            product_ids, components, currency
+        )
@@ -0,0 +1,138 @@
+import argparse
+import gc
+from datetime import datetime
+from time import perf_counter
+from typing import Callable, Dict, List, NamedTuple
+
+from peewee import Database, chunked
+from playhouse.db_url import connect
+
+from src.adapters.driven.infra import db_router
+from src.adapters.driven.infra.models.categories import Category
+from src.adapters.driven.infra.models.currencies import Currency
+from src.adapters.driven.infra.models.product_components import ProductComponent
+from src.adapters.driven.infra.models.products import Product
+from src.adapters.driven.infra.models.purchase_selected_products import (
+    PurchaseSelectedProducts,
+)
+from src.adapters.driven.infra.models.select_product import SelectedProduct
+from src.adapters.driven.infra.ports.json_produto_query import JsonProductQuery
+from src.adapters.driven.infra.ports.orm_produto_query import OrmProductQuery
+from src.core.application.ports.produto_query import ProdutoQuery
+
+MODELS = [
+    Category,
+    Currency,
+    Product,
+    ProductComponent,
+    SelectedProduct,
+    PurchaseSelectedProducts,
+]
+
+
+class RenderTiming(NamedTuple):
+    query: str
+    products: int
+    bytes: int
+    seconds: float
+
+
+def seed(database: Database, count: int, components_per_product: int = 2):
+    """A menu of count products, the first ones being the components of the others."""
+    now = datetime.now()
+    stamps = {"created_at": now, "updated_at": now}
+    with db_router.use(database), database.atomic():
+        database.create_tables(MODELS)
+        currency = Currency.create(symbol="R$", name="Real", code="BRL", **stamps)
+        lanches = Category.create(name="Lanches", is_component=False, **stamps)
+        adicionais = Category.create(name="Adicionais", is_component=True, **stamps)
+        rows = [
+            {
+                "name": f"Produto {index}",
+                "price": 2.5 if index < components_per_product else 27.9,
+                "currency": currency.id,
+                "category": (
+                    adicionais.id if index < components_per_product else lanches.id
+                ),
+                "allow_components": index >= components_per_product,
+                "is_active": True,
+                **stamps,
+            }
+            for index in range(count)
+        ]
+        for batch in chunked(rows, 500):
+            Product.insert_many(batch).execute()
+        ids = [
+            product_id
+            for (product_id,) in Product.select(Product.id)
+            .order_by(Product.id)
+            .tuples()
+        ]
+        components = ids[:components_per_product]
+        links = [
+            {"product": product_id, "component": component_id, **stamps}
+            for product_id in ids[components_per_product:]
+            for component_id in components
+        ]
+        for batch in chunked(links, 500):
+            ProductComponent.insert_many(batch).execute()
+
+
+# Each one renders the whole listing to the response body
+QUERIES: Dict[str, Callable[[], ProdutoQuery]] = {
+    "orm": OrmProductQuery,
+    "json": JsonProductQuery,
+}
+
+
+def measure(
+    name: str, query: ProdutoQuery, database: Database, repeat: int
+) -> RenderTiming:
+    """Best of the repetitions with the collector off, as timeit does."""
+    best = float("inf")
+    gc.disable()
+    try:
+        with db_router.use(database):
+            for _ in range(repeat):
+                start = perf_counter()
+                body = query.render_catalog()
+                best = min(best, perf_counter() - start)
+    finally:
+        gc.enable()
+    return RenderTiming(name, body.count(b'"order_count"'), len(body), best)
+
+
+def build_report(timings: List[RenderTiming]) -> str:
+    baseline = timings[0]
+    lines = [f"{'query':>6} {'products':>9} {'body (KB)':>10} {'total (ms)':>11}"]
+    for timing in timings:
+        lines.append(
+            f"{timing.query:>6} {timing.products:>9} {timing.bytes / 1024:>10.1f} "
+            f"{timing.seconds * 1000:>11.1f}  x{baseline.seconds / timing.seconds:.2f}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Product listing rendering benchmark.")
+
+    parser.add_argument("-p", "--products", type=int, default=10000, help="Products")
+    parser.add_argument(
+        "-c", "--components", type=int, default=2, help="Components per product"
+    )
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="Repetitions")
+    parser.add_argument(
+        "-d",
+        "--database-url",
+        default="sqlite:///:memory:",
+        help="Scratch database the products are seeded into",
+    )
+
+    args = parser.parse_args()
+
+    database = connect(args.database_url)
+    seed(database, args.products, args.components)
+    timings = [
+        measure(name, query(), database, args.repeat) for name, query in QUERIES.items()
+    ]
+    print(build_report(timings))
@@ -0,0 +1,96 @@
+import gc
+import math
+import os
+from typing import Optional
+
+from gunicorn.app.base import BaseApplication
+from loguru import logger
+
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_CPU_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_CPU_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+
+def cgroup_cpu_limit(
+    cpu_max_path: str = CGROUP_V2_CPU_MAX,
+    quota_path: str = CGROUP_V1_CPU_QUOTA,
+    period_path: str = CGROUP_V1_CPU_PERIOD,
+) -> Optional[float]:
+    """Returns the container CPU quota in cores, None when it is not limited."""
+    try:
+        with open(cpu_max_path) as cpu_max:
+            quota, period = cpu_max.read().split()
+        if quota == "max":
+            return None
+        return int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        with open(quota_path) as quota_file, open(period_path) as period_file:
+            quota, period = int(quota_file.read()), int(period_file.read())
+        if quota <= 0:
+            return None
+        return quota / period
+    except (OSError, ValueError):
+        return None
+
+
+def worker_count() -> int:
+    if os.getenv("WEB_CONCURRENCY"):
+        return max(1, int(os.environ["WEB_CONCURRENCY"]))
+    cpus = os.cpu_count() or 1
+    limit = cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, math.ceil(limit))
+    return max(1, cpus)
+
+
+def build_options() -> dict:
+    return {
+        "bind": f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}",
+        "workers": worker_count(),
+        "worker_class": "uvicorn_worker.UvicornWorker",
+        "preload_app": True,
+        "max_requests": int(os.getenv("WORKER_MAX_REQUESTS") or 10000),
+        "max_requests_jitter": int(os.getenv("WORKER_MAX_REQUESTS_JITTER") or 1000),
+        "timeout": int(os.getenv("WORKER_TIMEOUT") or 30),
+        "accesslog": "-",
+    }
+
+
+def load_app():
+    from app import app, prepare_db
+    from src.adapters.driven.infra.database.db import dispose_db, start_db
+    from src.adapters.driver.API.dependencies.produto_dependencies import (
+        get_produto_container,
+    )
+
+    start_db()
+    prepare_db()
+    app.state.db_prepared = True
+    logger.info("Loading reference data before forking workers")
+    get_produto_container().warm_up()
+    # Connections, pooled ones included, must not be shared between the forked workers
+    dispose_db()
+    # Keep the preloaded objects out of the collector, so the pages stay shared
+    gc.freeze()
+    return app
+
+
+class ProductionServer(BaseApplication):
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        return load_app()
+
+
+if __name__ == "__main__":
+    options = build_options()
+    logger.info(f"Starting {options['workers']} workers on {options['bind']}")
+    ProductionServer(options).run()
@@ -1,15 +1,19 @@
 from src.adapters.driven.infra.models.categories import Category
 from src.core.domain.entities.categoria_entity import PartialCategoriaEntity
+from src.core.helpers.functions.construct_trusted import construct_trusted
 
 
 class CategoriaEntityDataMapper:
     @classmethod
     def from_db_to_domain(cls, category: Category):
-        return PartialCategoriaEntity(
-            id=category.id,
-            description=category.description,
-            is_component=category.is_component,
-            created_at=category.created_at,
-            updated_at=category.updated_at,
-            deleted_at=category.deleted_at,
+        data = category.__data__
+        return construct_trusted(
+            PartialCategoriaEntity,
+            id=data.get("id"),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+            deleted_at=data.get("deleted_at"),
+            name=data.get("name"),
+            description=data.get("description"),
+            is_component=data.get("is_component"),
         )
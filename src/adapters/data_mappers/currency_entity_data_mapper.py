@@ -1,16 +1,20 @@
 from src.adapters.driven.infra.models.currencies import Currency
 from src.core.domain.entities.currency_entity import PartialCurrencyEntity
+from src.core.helpers.functions.construct_trusted import construct_trusted
 
 
 class CurrencyEntityDataMapper:
     @classmethod
     def from_db_to_domain(cls, currency: Currency):
-        return PartialCurrencyEntity(
-            id=currency.id,
-            name=currency.name,
-            symbol=currency.symbol,
-            code=currency.code,
-            created_at=currency.created_at,
-            updated_at=currency.updated_at,
-            deleted_at=currency.deleted_at,
+        data = currency.__data__
+        return construct_trusted(
+            PartialCurrencyEntity,
+            id=data.get("id"),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+            deleted_at=data.get("deleted_at"),
+            symbol=data.get("symbol"),
+            name=data.get("name"),
+            code=data.get("code"),
+            is_active=data.get("is_active"),
         )
@@ -0,0 +1,24 @@
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from peewee import Model
+
+
+class IdentityMap:
+    """
+    Maps each database row once per result set, so the products of a listing
+    share the same category, currency and component objects.
+    """
+
+    def __init__(self):
+        self._objects: Dict[Tuple[Hashable, Any], Any] = {}
+
+    def map(self, kind: Hashable, row: Model, mapper: Callable[[Model], Any]):
+        """The object already mapped for the row, mapping it on the first lookup."""
+        key = (kind, row.get_id())
+        mapped = self._objects.get(key)
+        if mapped is None:
+            mapped = self._objects[key] = mapper(row)
+        return mapped
+
+    def __len__(self) -> int:
+        return len(self._objects)
@@ -1,19 +1,35 @@
 from typing import List, Optional
+from src.adapters.data_mappers.identity_map import IdentityMap
 from src.adapters.data_mappers.produto_entity_data_mapper import ProdutoEntityDataMapper
 from src.adapters.driven.infra.models.products import Product
 from src.core.domain.aggregates.produto_aggregate import ProdutoAggregate
+from src.core.domain.entities.produto_entity import ProdutoEntity
 from src.core.helpers.enums.compra_status import CompraStatus
+from src.core.helpers.functions.construct_trusted import construct_trusted
 
 
 class ProdutoAggregateDataMapper:
     @classmethod
-    def from_db_to_domain(cls, produto: Product):
-        purchases = []
-        for selected_product in produto.selected_product:
-            purchases.extend(
-                [purchase.purchase_id for purchase in selected_product.purchases]
-            )
-        return ProdutoAggregate(
-            orders=list(set(purchases)),
+    def from_db_to_domain(cls, produto: Product, order_count: int = 0):
+        return construct_trusted(
+            ProdutoAggregate,
             product=ProdutoEntityDataMapper.from_db_to_domain(produto),
+            order_count=order_count,
+        )
+
+    @classmethod
+    def from_loaded_db_to_domain(
+        cls,
+        produto: Product,
+        components: List[ProdutoEntity],
+        order_count: int,
+        identity_map: Optional[IdentityMap] = None,
+    ):
+        """Maps a product whose relations were already loaded, without touching the database."""
+        return construct_trusted(
+            ProdutoAggregate,
+            product=ProdutoEntityDataMapper.from_db_to_domain(
+                produto, components=components, identity_map=identity_map
+            ),
+            order_count=order_count,
         )
@@ -1,7 +1,12 @@
-from decimal import Decimal
+from typing import List, Optional
+from src.adapters.data_mappers.identity_map import IdentityMap
+from src.adapters.driven.infra.models.categories import Category
+from src.adapters.driven.infra.models.currencies import Currency
 from src.adapters.driven.infra.models.products import Product
-from src.core.domain.entities.produto_entity import PartialProdutoEntity
+from src.core.domain.entities.produto_entity import PartialProdutoEntity, ProdutoEntity
 from src.core.domain.value_objects.preco_value_object import PrecoValueObject
+from src.core.helpers.functions.construct_trusted import construct_trusted
+from src.core.helpers.functions.round_price import round_price
 from src.adapters.data_mappers.currency_entity_data_mapper import (
     CurrencyEntityDataMapper,
 )
@@ -11,36 +16,93 @@ from src.adapters.data_mappers.categoria_entity_data_mapper import (
 
 
 class ProdutoEntityDataMapper:
+    """
+    The rows come from our own database, so the entities are built without
+    validation, which stays at the API boundary, and the columns are read
+    straight from the row data instead of through the field descriptors.
+    """
+
     @classmethod
-    def from_db_to_domain(cls, produto: Product):
-        return PartialProdutoEntity(
-            id=produto.id,
-            name=produto.name,
-            price=(
-                PrecoValueObject(
-                    value=round(Decimal(produto.price), 2),
-                    currency=CurrencyEntityDataMapper.from_db_to_domain(
-                        produto.currency
-                    ),
+    def from_db_to_domain(
+        cls,
+        produto: Product,
+        components: Optional[List[ProdutoEntity]] = None,
+        identity_map: Optional[IdentityMap] = None,
+    ):
+        if identity_map is None:
+            identity_map = IdentityMap()
+        data = produto.__data__
+        return construct_trusted(
+            PartialProdutoEntity,
+            id=data.get("id"),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+            deleted_at=data.get("deleted_at"),
+            name=data.get("name"),
+            category=(
+                identity_map.map(
+                    Category,
+                    produto.category,
+                    CategoriaEntityDataMapper.from_db_to_domain,
                 )
-                if produto.price
+                if produto.category
                 else None
             ),
-            category=(
-                CategoriaEntityDataMapper.from_db_to_domain(produto.category)
-                if produto.category
+            price=(
+                construct_trusted(
+                    PrecoValueObject,
+                    value=round_price(data["price"]),
+                    currency=identity_map.map(
+                        Currency,
+                        produto.currency,
+                        CurrencyEntityDataMapper.from_db_to_domain,
+                    ),
+                )
+                if data.get("price")
                 else None
             ),
-            created_at=produto.created_at,
-            updated_at=produto.updated_at,
-            deleted_at=produto.deleted_at,
-            allow_components=produto.allow_components,
-            is_active=produto.is_active,
             components=(
-                [cls.from_db_to_domain(comp.component) for comp in produto.components]
-                if hasattr(produto, "components") and produto.components is not None
+                components
+                if components is not None
+                else (
+                    [
+                        cls.from_db_to_domain(comp.component, identity_map=identity_map)
+                        for comp in produto.components
+                    ]
+                    if hasattr(produto, "components") and produto.components is not None
+                    else None
+                )
+            ),
+            is_active=data.get("is_active"),
+            allow_components=data.get("allow_components"),
+            version=data.get("version"),
+        )
+
+    @classmethod
+    def from_db_row_to_domain(cls, produto: Product, references: ProdutoEntity):
+        """Maps only the row columns, the relations are taken from an already loaded entity."""
+        data = produto.__data__
+        return construct_trusted(
+            PartialProdutoEntity,
+            id=data.get("id"),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+            deleted_at=data.get("deleted_at"),
+            name=data.get("name"),
+            category=references.category if data.get("category") else None,
+            price=(
+                construct_trusted(
+                    PrecoValueObject,
+                    value=round_price(data["price"]),
+                    currency=references.price.currency,
+                )
+                if data.get("price")
                 else None
             ),
+            components=references.components,
+            is_active=data.get("is_active"),
+            allow_components=data.get("allow_components"),
+            version=data.get("version"),
         )
 
     @classmethod
@@ -6,6 +6,7 @@ from src.adapters.driven.events.interfaces.notification_service import (
 )
 from src.adapters.driven.events.model.notification import Notification
 from src.adapters.driver.events import internal_events
+from src.core.helpers.services.background_threads import background_threads
 
 
 class InternalNotifierService(NotificationService):
@@ -21,6 +22,7 @@ class InternalNotifierService(NotificationService):
             kwargs={"notification": notification},
         )
         thread.start()
+        background_threads.register("notifier", thread)
 
     def _send_notification(self, notification: Notification) -> None:
         logger.info(f"Sending notification {notification}")
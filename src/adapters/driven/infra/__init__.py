@@ -1 +1 @@
-from src.adapters.driven.infra.database.db import db
+from src.adapters.driven.infra.database.db import db, db_router
@@ -0,0 +1,252 @@
+import itertools
+from collections import Counter
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import monotonic, perf_counter
+from typing import Callable, Dict, List, Optional
+
+from loguru import logger
+from peewee import (
+    Database,
+    DatabaseProxy,
+    Delete,
+    Insert,
+    InterfaceError,
+    OperationalError,
+    SelectBase,
+    Update,
+)
+
+from src.core.helpers.services.background_threads import background_threads
+
+
+class _RequestScope:
+    __slots__ = ("wrote",)
+
+    def __init__(self):
+        self.wrote = False
+
+
+_current_database: ContextVar[Optional[Database]] = ContextVar(
+    "current_database", default=None
+)
+_request_scope: ContextVar[Optional[_RequestScope]] = ContextVar(
+    "db_request_scope", default=None
+)
+_statement_counter: ContextVar[Optional[Counter]] = ContextVar(
+    "db_statement_counter", default=None
+)
+
+
+def _statement_kind(query) -> str:
+    if isinstance(query, SelectBase):
+        return "select"
+    if isinstance(query, Insert):
+        return "insert"
+    if isinstance(query, Update):
+        return "update"
+    if isinstance(query, Delete):
+        return "delete"
+    return "other"
+
+
+class RoutingDatabaseProxy(DatabaseProxy):
+    """Database proxy bound to the models, resolving to whichever database the router selected."""
+
+    __slots__ = ("obj", "_callbacks", "_Model", "router")
+
+    def __init__(self, router: "DatabaseRouter"):
+        super().__init__()
+        self.router = router
+        self.initialize(router.primary)
+
+    def __getattr__(self, attr):
+        return getattr(self.router.current(), attr)
+
+    def execute(self, query, **context_options):
+        counter = _statement_counter.get()
+        if counter is not None:
+            counter[_statement_kind(query)] += 1
+        return self.router.current().execute(query, **context_options)
+
+    def __enter__(self):
+        return self.router.current().__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self.router.current().__exit__(exc_type, exc_value, traceback)
+
+
+class DatabaseRouter:
+    """
+    Sends reads to the read replicas and writes to the primary.
+
+    Once a request scope has written, every following read of that scope is
+    pinned to the primary (read-your-writes). Replicas failing the health
+    check, or failing a query, are skipped until the next check. The checks
+    run in a background thread, never on the request path.
+    """
+
+    def __init__(
+        self,
+        primary: Database,
+        replicas: Optional[List[Database]] = None,
+        health_check_interval: int = 10,
+    ):
+        self.primary = primary
+        self.replicas = replicas or []
+        self.health_check_interval = health_check_interval
+        self.proxy = RoutingDatabaseProxy(self)
+        self._healthy: Dict[int, bool] = {i: True for i in range(len(self.replicas))}
+        # Replicas are taken as healthy until the first check, one interval in
+        self._last_check: float = monotonic()
+        self._checker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._cycle = itertools.cycle(range(len(self.replicas)))
+
+    def current(self) -> Database:
+        return _current_database.get() or self.primary
+
+    @contextmanager
+    def use(self, database: Database):
+        token = _current_database.set(database)
+        try:
+            yield database
+        finally:
+            _current_database.reset(token)
+
+    @contextmanager
+    def request_scope(self):
+        token = _request_scope.set(_RequestScope())
+        try:
+            yield
+        finally:
+            _request_scope.reset(token)
+
+    @contextmanager
+    def count_statements(self):
+        """Counts, by kind, the queries the models run through the proxy."""
+        counter = Counter()
+        token = _statement_counter.set(counter)
+        try:
+            yield counter
+        finally:
+            _statement_counter.reset(token)
+
+    def reading(self, func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_database.get() is not None:
+                return func(*args, **kwargs)
+            replica = self.pick_replica()
+            if replica is None:
+                with self.use(self.primary):
+                    return func(*args, **kwargs)
+            try:
+                with self.use(replica):
+                    return func(*args, **kwargs)
+            except (OperationalError, InterfaceError) as e:
+                logger.warning(f"Read replica failed, falling back to primary: {e}")
+                self.mark_unhealthy(replica)
+                with self.use(self.primary):
+                    return func(*args, **kwargs)
+
+        return wrapper
+
+    def writing(self, func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            scope = _request_scope.get()
+            if scope is not None:
+                scope.wrote = True
+            with self.use(self.primary):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def pick_replica(self) -> Optional[Database]:
+        if not self.replicas:
+            return None
+        scope = _request_scope.get()
+        if scope is not None and scope.wrote:
+            return None
+        if monotonic() - self._last_check >= self.health_check_interval:
+            self.schedule_check()
+        with self._lock:
+            for _ in range(len(self.replicas)):
+                index = next(self._cycle)
+                if self._healthy[index]:
+                    return self.replicas[index]
+        return None
+
+    def schedule_check(self) -> bool:
+        """Starts check_replicas in a background thread, unless one is running."""
+        with self._lock:
+            if self._checker is not None and self._checker.is_alive():
+                return False
+            self._last_check = monotonic()
+            self._checker = threading.Thread(target=self.check_replicas, daemon=True)
+            self._checker.start()
+        background_threads.register("replica_health_check", self._checker)
+        return True
+
+    def check_replicas(self) -> Dict[int, bool]:
+        for index, replica in enumerate(self.replicas):
+            try:
+                self.ping(replica)
+                self._healthy[index] = True
+            except Exception as e:
+                logger.warning(f"Read replica {index} is unhealthy: {e}")
+                self._healthy[index] = False
+                if not replica.is_closed():
+                    replica.close()
+        self._last_check = monotonic()
+        return dict(self._healthy)
+
+    def mark_unhealthy(self, replica: Database):
+        for index, candidate in enumerate(self.replicas):
+            if candidate is replica:
+                self._healthy[index] = False
+
+    def ping(self, database: Database) -> float:
+        """
+        Round trip of a trivial query, in milliseconds. A connection opened for
+        the ping is closed again, so pinging threads do not hold pooled ones.
+        """
+        opened = database.is_closed()
+        try:
+            start = perf_counter()
+            database.execute_sql("SELECT 1")
+            return (perf_counter() - start) * 1000
+        finally:
+            if opened and not database.is_closed():
+                database.close()
+
+    def status(self) -> dict:
+        return {
+            "primary": self._database_status(self.primary),
+            "replicas": [
+                {"healthy": self._healthy[index], **self._database_status(replica)}
+                for index, replica in enumerate(self.replicas)
+            ],
+        }
+
+    def _database_status(self, database: Database) -> dict:
+        status = {}
+        try:
+            status["latency_ms"] = round(self.ping(database), 3)
+            status["reachable"] = True
+        except Exception as e:
+            status["reachable"] = False
+            status["error"] = str(e)
+        # Private counters of playhouse.pool.PooledDatabase, no public API exposes them
+        if hasattr(database, "_in_use"):
+            in_use = len(database._in_use)
+            status["pool"] = {
+                "in_use": in_use,
+                "idle": len(database._connections),
+                "max_connections": database._max_connections,
+                "saturation": round(in_use / database._max_connections, 4),
+            }
+        return status
@@ -0,0 +1,62 @@
+from peewee import (
+    BooleanField,
+    CharField,
+    DateTimeField,
+    FloatField,
+    IntegerField,
+    Model,
+)
+
+from src.adapters.driven.infra import db
+
+
+class ArchiveModel(Model):
+    """
+    Soft deleted rows moved out of the hot tables. Same columns as the live
+    table, references are plain integers since their targets may be archived.
+    """
+
+    id = IntegerField(primary_key=True)
+    created_at = DateTimeField()
+    updated_at = DateTimeField()
+    deleted_at = DateTimeField()
+    archived_at = DateTimeField()
+
+    class Meta:
+        database = db
+
+
+class ArchivedProduct(ArchiveModel):
+    class Meta:
+        db_table = "product_archive"
+
+    name = CharField()
+    category = IntegerField(column_name="category_id", null=True)
+    price = FloatField(null=True)
+    currency = IntegerField(column_name="currency_id", null=True)
+    allow_components = BooleanField()
+    is_active = BooleanField()
+    version = IntegerField(default=1)
+
+
+class ArchivedSelectedProduct(ArchiveModel):
+    class Meta:
+        db_table = "selected_product_archive"
+
+    product = IntegerField(column_name="product_id")
+
+
+class ArchivedPurchaseSelectedProduct(ArchiveModel):
+    class Meta:
+        db_table = "purchase_selected_product_archive"
+
+    product = IntegerField(column_name="product_id")
+    purchase_id = IntegerField(index=True)
+
+
+class ArchivedSelectedProductComponent(ArchiveModel):
+    class Meta:
+        db_table = "selected_product_component_archive"
+
+    selected_product = IntegerField(column_name="selected_product_id")
+    component = IntegerField(column_name="component_id")
@@ -24,6 +24,11 @@ class BaseModel(Model):
     def select(cls, *fields):
         return super().select(*fields).where(cls.deleted_at.is_null())
 
+    @classmethod
+    def select_including_deleted(cls, *fields):
+        """Plain select, also seeing the soft deleted rows."""
+        return super().select(*fields)
+
     @classmethod
     def get(cls, *query, **kwargs):
         query = (cls.deleted_at.is_null(), *query)
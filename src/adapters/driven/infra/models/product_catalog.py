@@ -0,0 +1,62 @@
+import json
+
+from peewee import (
+    BooleanField,
+    CharField,
+    DateTimeField,
+    Field,
+    FloatField,
+    IntegerField,
+    Model,
+)
+
+from src.adapters.driven.infra import db
+
+
+class JSONBField(Field):
+    """JSONB on PostgreSQL, the driver already decodes it; JSON text elsewhere."""
+
+    field_type = "JSONB"
+
+    def db_value(self, value):
+        return None if value is None else json.dumps(value)
+
+    def python_value(self, value):
+        if isinstance(value, (str, bytes)):
+            return json.loads(value)
+        return value
+
+
+class ProductCatalogEntry(Model):
+    """
+    Denormalized read model, one row per live product with its category and
+    currency inlined and its components as a JSON array. Kept current by the
+    repository writes, see ProductCatalogProjection.
+    """
+
+    id = IntegerField(primary_key=True)
+    name = CharField()
+    price = FloatField(null=True, index=True)
+    is_active = BooleanField()
+    allow_components = BooleanField()
+    version = IntegerField()
+    created_at = DateTimeField()
+    updated_at = DateTimeField()
+    category_id = IntegerField(null=True)
+    category_name = CharField(null=True)
+    category_description = CharField(null=True)
+    category_is_component = BooleanField(null=True)
+    category_created_at = DateTimeField(null=True)
+    category_updated_at = DateTimeField(null=True)
+    currency_id = IntegerField(null=True)
+    currency_symbol = CharField(null=True)
+    currency_name = CharField(null=True)
+    currency_code = CharField(null=True)
+    currency_is_active = BooleanField(null=True)
+    currency_created_at = DateTimeField(null=True)
+    currency_updated_at = DateTimeField(null=True)
+    components = JSONBField(default=list)
+
+    class Meta:
+        database = db
+        db_table = "product_catalog"
@@ -1,4 +1,11 @@
-from peewee import CharField, FloatField, ForeignKeyField, BooleanField
+from peewee import (
+    BooleanField,
+    CharField,
+    FloatField,
+    ForeignKeyField,
+    IntegerField,
+    fn,
+)
 from playhouse.signals import pre_save
 
 from src.adapters.driven.infra.models.base_model import BaseModel
@@ -13,6 +20,32 @@ class Product(BaseModel):
     currency = ForeignKeyField(Currency, backref="products", null=True)
     allow_components = BooleanField(default=False)
     is_active = BooleanField(default=False)
+    # Bumped by every UPDATE, compared by the product update to detect lost updates
+    version = IntegerField(default=1)
+
+    @classmethod
+    def update(cls, *args, **kwargs):
+        kwargs.setdefault("version", cls.version + 1)
+        return super().update(*args, **kwargs)
+
+
+# Names are unique among the live products, regardless of case
+Product.add_index(
+    Product.index(
+        fn.LOWER(Product.name),
+        unique=True,
+        where=Product.deleted_at.is_null(),
+        name="product_name_unique",
+    )
+)
+# Partial indexes only hold the live rows, the soft deleted ones are archived
+Product.add_index(
+    Product.index(
+        Product.category,
+        where=Product.deleted_at.is_null(),
+        name="product_live_category",
+    )
+)
 
 
 @pre_save(sender=Product)
@@ -10,3 +10,19 @@ class PurchaseSelectedProducts(BaseModel):
 
     product = ForeignKeyField(SelectedProduct, backref="purchases")
     purchase_id = IntegerField()
+
+
+PurchaseSelectedProducts.add_index(
+    PurchaseSelectedProducts.index(
+        PurchaseSelectedProducts.purchase_id,
+        where=PurchaseSelectedProducts.deleted_at.is_null(),
+        name="purchase_selected_product_live_purchase",
+    )
+)
+PurchaseSelectedProducts.add_index(
+    PurchaseSelectedProducts.index(
+        PurchaseSelectedProducts.product,
+        where=PurchaseSelectedProducts.deleted_at.is_null(),
+        name="purchase_selected_product_live_product",
+    )
+)
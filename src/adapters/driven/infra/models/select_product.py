@@ -9,3 +9,12 @@ class SelectedProduct(BaseModel):
         db_table = "selected_product"
 
     product = ForeignKeyField(Product, backref="selected_product")
+
+
+SelectedProduct.add_index(
+    SelectedProduct.index(
+        SelectedProduct.product,
+        where=SelectedProduct.deleted_at.is_null(),
+        name="selected_product_live_product",
+    )
+)
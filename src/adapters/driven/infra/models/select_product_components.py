@@ -12,3 +12,12 @@ class SelectedProductComponent(BaseModel):
 
     selected_product = ForeignKeyField(SelectedProduct, backref="added_components")
     component = ForeignKeyField(Product, backref="selected_product_component")
+
+
+SelectedProductComponent.add_index(
+    SelectedProductComponent.index(
+        SelectedProductComponent.selected_product,
+        where=SelectedProductComponent.deleted_at.is_null(),
+        name="selected_product_component_live_selected_product",
+    )
+)
@@ -0,0 +1,51 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict
+
+from loguru import logger
+
+from src.adapters.driven.infra.database.db_router import DatabaseRouter
+from src.core.domain.base.unit_of_work import UnitOfWork
+
+
+class PeeweeUnitOfWork(UnitOfWork):
+    """
+    Runs each command in a single transaction on the primary, so its
+    statements share one commit instead of autocommitting one by one.
+    """
+
+    def __init__(self, router: DatabaseRouter):
+        super().__init__()
+        self.router = router
+        self._stats: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def transaction(self, command: str):
+        with self.router.count_statements() as counter:
+            with self.router.use(self.router.primary):
+                with self.router.primary.atomic():
+                    yield
+            self._record(command, counter)
+
+    def _record(self, command: str, counter: Dict[str, int]):
+        statements = sum(counter.values())
+        logger.debug(f"{command} committed {statements} statements {dict(counter)}")
+        with self._lock:
+            stats = self._stats.setdefault(
+                command, {"commits": 0, "statements": 0, "max_statements": 0}
+            )
+            stats["commits"] += 1
+            stats["statements"] += statements
+            stats["max_statements"] = max(stats["max_statements"], statements)
+            stats["last"] = dict(counter)
+
+    def stats(self) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                command: {
+                    **stats,
+                    "avg_statements": round(stats["statements"] / stats["commits"], 2),
+                }
+                for command, stats in self._stats.items()
+            }
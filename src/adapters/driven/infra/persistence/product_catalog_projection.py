@@ -0,0 +1,116 @@
+from datetime import datetime
+from typing import Iterable, Optional
+
+from peewee import chunked
+
+from src.adapters.driven.infra import db, db_router
+from src.adapters.driven.infra.models.product_catalog import ProductCatalogEntry
+from src.adapters.driven.infra.models.product_components import ProductComponent
+from src.adapters.driven.infra.models.products import Product
+from src.adapters.driven.infra.ports.orm_produto_query import OrmProductQuery
+from src.core.domain.read_models.produto_catalog import CatalogProduct, ProdutoCatalog
+
+# Every column but the key, overwritten by a refresh of an existing row
+UPSERT_COLUMNS = [
+    field
+    for field in ProductCatalogEntry._meta.sorted_fields
+    if field is not ProductCatalogEntry.id
+]
+
+
+def catalog_entry(catalog: ProdutoCatalog, product: CatalogProduct) -> dict:
+    """Columns of the product_catalog row of the product, without its components."""
+    category = catalog.categories.get(product.category_id)
+    currency = catalog.currencies.get(product.currency_id)
+    return {
+        "id": product.id,
+        "name": product.name,
+        "price": product.price,
+        "is_active": product.is_active,
+        "allow_components": product.allow_components,
+        "version": product.version,
+        "created_at": product.created_at,
+        "updated_at": product.updated_at,
+        "category_id": category.id if category else None,
+        "category_name": category.name if category else None,
+        "category_description": category.description if category else None,
+        "category_is_component": category.is_component if category else None,
+        "category_created_at": category.created_at if category else None,
+        "category_updated_at": category.updated_at if category else None,
+        "currency_id": currency.id if currency else None,
+        "currency_symbol": currency.symbol if currency else None,
+        "currency_name": currency.name if currency else None,
+        "currency_code": currency.code if currency else None,
+        "currency_is_active": currency.is_active if currency else None,
+        "currency_created_at": currency.created_at if currency else None,
+        "currency_updated_at": currency.updated_at if currency else None,
+    }
+
+
+def _to_json(entry: dict) -> dict:
+    return {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in entry.items()
+    }
+
+
+class ProductCatalogProjection:
+    """
+    Rebuilds the product_catalog rows of the products a write touched, and of
+    the products embedding them as components, in the transaction of the write.
+    Rows are upserted, so concurrent writes refreshing the same product do not
+    collide on its primary key, and only the products gone are deleted.
+    """
+
+    def __init__(self, product_query: Optional[OrmProductQuery] = None):
+        self.product_query = product_query or OrmProductQuery()
+
+    @db_router.writing
+    def refresh(self, product_ids: Optional[Iterable[int]] = None) -> int:
+        """Rebuilds the rows of the products, every row when no ids are given."""
+        with db.atomic():
+            if product_ids is None:
+                ids = None
+                conditions = []
+            else:
+                ids = set(product_ids)
+                if not ids:
+                    return 0
+                ids |= {
+                    product_id
+                    for (product_id,) in ProductComponent.select(
+                        ProductComponent.product
+                    )
+                    .where(ProductComponent.component.in_(sorted(ids)))
+                    .tuples()
+                }
+                conditions = [Product.id.in_(sorted(ids))]
+            catalog = self.product_query.load_catalog(conditions)
+            gone = ProductCatalogEntry.delete().where(
+                ProductCatalogEntry.id.not_in(
+                    Product.select(Product.id).where(*conditions)
+                )
+            )
+            if ids is not None:
+                gone = gone.where(ProductCatalogEntry.id.in_(sorted(ids)))
+            gone.execute()
+            rows = []
+            for product_id in catalog.ids:
+                product = catalog.products[product_id]
+                rows.append(
+                    {
+                        **catalog_entry(catalog, product),
+                        "components": [
+                            _to_json(
+                                catalog_entry(catalog, catalog.products[component])
+                            )
+                            for component in product.components
+                        ],
+                    }
+                )
+            for batch in chunked(rows, 500):
+                ProductCatalogEntry.insert_many(batch).on_conflict(
+                    conflict_target=[ProductCatalogEntry.id],
+                    preserve=UPSERT_COLUMNS,
+                ).execute()
+        return len(rows)
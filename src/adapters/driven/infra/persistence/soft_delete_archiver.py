@@ -0,0 +1,133 @@
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+from loguru import logger
+from peewee import Value, fn
+
+from src.adapters.driven.infra.database.db_router import DatabaseRouter
+from src.adapters.driven.infra.models.archives import (
+    ArchiveModel,
+    ArchivedProduct,
+    ArchivedPurchaseSelectedProduct,
+    ArchivedSelectedProduct,
+    ArchivedSelectedProductComponent,
+)
+from src.adapters.driven.infra.models.base_model import BaseModel
+from src.adapters.driven.infra.models.product_components import ProductComponent
+from src.adapters.driven.infra.models.products import Product
+from src.adapters.driven.infra.models.purchase_selected_products import (
+    PurchaseSelectedProducts,
+)
+from src.adapters.driven.infra.models.select_product import SelectedProduct
+from src.adapters.driven.infra.models.select_product_components import (
+    SelectedProductComponent,
+)
+
+
+def _not_referenced(*references) -> Callable[[Type[BaseModel]], list]:
+    """Rows still referenced by any row, deleted or not, must stay for the foreign keys."""
+
+    def conditions(model: Type[BaseModel]) -> list:
+        return [
+            ~fn.EXISTS(
+                reference.model.select_including_deleted(reference.model.id).where(
+                    reference == model.id
+                )
+            )
+            for reference in references
+        ]
+
+    return conditions
+
+
+# Children before their parents, so a run can free the rows it archives next
+ARCHIVES: List[Tuple[Type[BaseModel], Type[ArchiveModel], Callable]] = [
+    (PurchaseSelectedProducts, ArchivedPurchaseSelectedProduct, _not_referenced()),
+    (SelectedProductComponent, ArchivedSelectedProductComponent, _not_referenced()),
+    (
+        SelectedProduct,
+        ArchivedSelectedProduct,
+        _not_referenced(
+            PurchaseSelectedProducts.product, SelectedProductComponent.selected_product
+        ),
+    ),
+    (
+        Product,
+        ArchivedProduct,
+        _not_referenced(
+            SelectedProduct.product,
+            SelectedProductComponent.component,
+            ProductComponent.product,
+            ProductComponent.component,
+        ),
+    ),
+]
+
+
+class SoftDeleteArchiver:
+    """
+    Moves the rows soft deleted before the retention horizon into the archive
+    tables. Each batch is its own short transaction on the primary, so the
+    locks it takes are bounded by the batch size.
+    """
+
+    def __init__(self, router: DatabaseRouter, retention: timedelta, batch_size: int):
+        self.router = router
+        self.retention = retention
+        self.batch_size = batch_size
+
+    def run(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        now = now or datetime.now()
+        horizon = now - self.retention
+        archived = {}
+        for model, archive, guard in ARCHIVES:
+            archived[model._meta.table_name] = self.archive(
+                model, archive, guard, horizon, now
+            )
+        logger.info(f"Archived rows soft deleted before {horizon}: {archived}")
+        return archived
+
+    def archive(
+        self,
+        model: Type[BaseModel],
+        archive: Type[ArchiveModel],
+        guard: Callable,
+        horizon: datetime,
+        archived_at: datetime,
+    ) -> int:
+        moved = 0
+        while True:
+            batch = self._archive_batch(model, archive, guard, horizon, archived_at)
+            moved += batch
+            if batch < self.batch_size:
+                return moved
+
+    def _archive_batch(
+        self,
+        model: Type[BaseModel],
+        archive: Type[ArchiveModel],
+        guard: Callable,
+        horizon: datetime,
+        archived_at: datetime,
+    ) -> int:
+        fields = model._meta.sorted_fields
+        columns = [archive._meta.fields[field.name] for field in fields]
+        with self.router.use(self.router.primary), self.router.primary.atomic():
+            ids = [
+                row_id
+                for (row_id,) in model.select_including_deleted(model.id)
+                .where(model.deleted_at < horizon, *guard(model))
+                .order_by(model.id)
+                .limit(self.batch_size)
+                .tuples()
+            ]
+            if not ids:
+                return 0
+            archive.insert_from(
+                model.select_including_deleted(*fields, Value(archived_at)).where(
+                    model.id.in_(ids)
+                ),
+                [*columns, archive.archived_at],
+            ).execute()
+            model.delete().where(model.id.in_(ids)).execute()
+        return len(ids)
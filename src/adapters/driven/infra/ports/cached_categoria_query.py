@@ -0,0 +1,60 @@
+from time import monotonic
+from typing import Dict, Optional, Union
+
+from src.core.application.ports.categoria_query import CategoriaQuery
+from src.core.domain.entities.categoria_entity import (
+    CategoriaEntity,
+    PartialCategoriaEntity,
+)
+from src.core.helpers.interfaces.chace_service import CacheService
+
+
+class CachedCategoriaQuery(CategoriaQuery):
+    """
+    Categories are reference data, they are loaded once and kept in memory.
+    The API has no category writes: changes made to the database are picked
+    up once ttl expires (never with 0), or right away through invalidate.
+    """
+
+    CACHE_KEY = "categories"
+
+    def __init__(
+        self, category_query: CategoriaQuery, cache: CacheService, ttl: int = 0
+    ):
+        self.category_query = category_query
+        self.cache = cache
+        self.ttl = ttl
+        self._by_id: Optional[Dict[int, CategoriaEntity]] = None
+        self._expires_at: Optional[float] = None
+
+    def warm_up(self) -> list[CategoriaEntity]:
+        categories = self.category_query.get_all()
+        self.cache.set(self.CACHE_KEY, categories, self.ttl)
+        self._by_id = {category.id: category for category in categories}
+        self._expires_at = monotonic() + self.ttl if self.ttl else None
+        return categories
+
+    def invalidate(self):
+        """Drops the loaded categories, the next lookup reads them again."""
+        self.cache.delete(self.CACHE_KEY)
+        self._by_id = None
+
+    def get(self, item_id: int) -> Union[CategoriaEntity, None]:
+        if self._by_id is None or (
+            self._expires_at is not None and monotonic() >= self._expires_at
+        ):
+            self.warm_up()
+        category = self._by_id.get(item_id)
+        if category is not None:
+            # Callers may change what they get, the indexed one stays untouched
+            return category.model_copy(deep=True)
+        return self.category_query.get(item_id)
+
+    def get_all(self) -> list[CategoriaEntity]:
+        categories = self.cache.get(self.CACHE_KEY)
+        if categories is None:
+            categories = self.warm_up()
+        return categories
+
+    def find(self, query_options: PartialCategoriaEntity) -> list[CategoriaEntity]:
+        return self.category_query.find(query_options)
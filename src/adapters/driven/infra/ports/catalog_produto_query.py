@@ -0,0 +1,140 @@
+from datetime import datetime
+from typing import List, Optional, Union
+
+from src.adapters.driven.infra import db_router
+from src.adapters.driven.infra.models.product_catalog import ProductCatalogEntry
+from src.adapters.driven.infra.ports.orm_produto_query import OrmProductQuery
+from src.core.domain.aggregates.produto_aggregate import ProdutoAggregate
+from src.core.domain.read_models.produto_catalog import (
+    CatalogCategory,
+    CatalogCurrency,
+    CatalogProduct,
+    ProdutoCatalog,
+)
+from src.core.helpers.options.produto_find_options import ProdutoFindOptions
+
+DATETIME_KEYS = (
+    "created_at",
+    "updated_at",
+    "category_created_at",
+    "category_updated_at",
+    "currency_created_at",
+    "currency_updated_at",
+)
+
+
+def entry_conditions(query_options: ProdutoFindOptions) -> list:
+    conditions = []
+    if query_options.name:
+        conditions.append(ProductCatalogEntry.name.contains(query_options.name))
+    if query_options.category:
+        conditions.append(
+            ProductCatalogEntry.category_name.contains(query_options.category)
+        )
+    if any(query_options.price_range or []):
+        conditions.append(ProductCatalogEntry.price.between(*query_options.price_range))
+    return conditions
+
+
+def add_entry(catalog: ProdutoCatalog, entry: dict) -> CatalogProduct:
+    category_id = entry["category_id"]
+    if category_id is not None and category_id not in catalog.categories:
+        catalog.categories[category_id] = CatalogCategory(
+            id=category_id,
+            name=entry["category_name"],
+            description=entry["category_description"],
+            is_component=entry["category_is_component"],
+            created_at=entry["category_created_at"],
+            updated_at=entry["category_updated_at"],
+        )
+    currency_id = entry["currency_id"]
+    if currency_id is not None and currency_id not in catalog.currencies:
+        catalog.currencies[currency_id] = CatalogCurrency(
+            id=currency_id,
+            symbol=entry["currency_symbol"],
+            name=entry["currency_name"],
+            code=entry["currency_code"],
+            is_active=entry["currency_is_active"],
+            created_at=entry["currency_created_at"],
+            updated_at=entry["currency_updated_at"],
+        )
+    return CatalogProduct(
+        id=entry["id"],
+        name=entry["name"],
+        category_id=category_id,
+        price=entry["price"],
+        currency_id=currency_id,
+        is_active=entry["is_active"],
+        allow_components=entry["allow_components"],
+        version=entry["version"],
+        created_at=entry["created_at"],
+        updated_at=entry["updated_at"],
+    )
+
+
+def _from_json(entry: dict) -> dict:
+    return {
+        **entry,
+        **{
+            key: datetime.fromisoformat(entry[key])
+            for key in DATETIME_KEYS
+            if entry[key] is not None
+        },
+    }
+
+
+class CatalogProductQuery(OrmProductQuery):
+    """
+    Serves the product reads from the denormalized product_catalog table: one
+    single table scan, plus the order counts. The other queries are the ORM ones.
+    """
+
+    @db_router.reading
+    def get(self, item_id: int) -> Union[ProdutoAggregate, None]:
+        aggregates = self._read([ProductCatalogEntry.id == item_id]).to_aggregates()
+        if not aggregates:
+            return None
+        return aggregates[0]
+
+    @db_router.reading
+    def get_all(self) -> List[ProdutoAggregate]:
+        return self._read([]).to_aggregates()
+
+    @db_router.reading
+    def find(self, query_options: ProdutoFindOptions) -> List[ProdutoAggregate]:
+        return self._read(entry_conditions(query_options)).to_aggregates()
+
+    @db_router.reading
+    def get_all_ids(self, items: List[int]) -> List[ProdutoAggregate]:
+        if not items:
+            return []
+        return self._read([ProductCatalogEntry.id.in_(items)]).to_aggregates()
+
+    @db_router.reading
+    def get_catalog(
+        self, query_options: Optional[ProdutoFindOptions] = None
+    ) -> ProdutoCatalog:
+        return self._read(entry_conditions(query_options) if query_options else [])
+
+    def _read(self, conditions: list) -> ProdutoCatalog:
+        catalog = ProdutoCatalog()
+        query = ProductCatalogEntry.select().order_by(ProductCatalogEntry.id)
+        if conditions:
+            query = query.where(*conditions)
+        for entry in query.dicts():
+            components = entry.pop("components")
+            product = catalog.products[entry["id"]] = add_entry(catalog, entry)
+            component_ids = []
+            for component in components:
+                # A listed product keeps its own entry, with its components
+                if component["id"] not in catalog.products:
+                    catalog.products[component["id"]] = add_entry(
+                        catalog, _from_json(component)
+                    )
+                component_ids.append(component["id"])
+            product.components = tuple(component_ids)
+            catalog.ids.append(product.id)
+        order_counts = self.count_orders(catalog.ids)
+        for product_id in catalog.ids:
+            catalog.products[product_id].order_count = order_counts.get(product_id, 0)
+        return catalog
@@ -0,0 +1,271 @@
+from typing import Optional
+
+from peewee import (
+    JOIN,
+    SQL,
+    Case,
+    EnclosedNodeList,
+    PostgresqlDatabase,
+    Select,
+    fn,
+)
+
+from src.adapters.driven.infra import db, db_router
+from src.adapters.driven.infra.models.categories import Category
+from src.adapters.driven.infra.models.currencies import Currency
+from src.adapters.driven.infra.models.product_components import ProductComponent
+from src.adapters.driven.infra.models.products import Product
+from src.adapters.driven.infra.models.purchase_selected_products import (
+    PurchaseSelectedProducts,
+)
+from src.adapters.driven.infra.models.select_product import SelectedProduct
+from src.adapters.driven.infra.ports.orm_produto_query import (
+    OrmProductQuery,
+    find_conditions,
+)
+from src.core.helpers.options.produto_find_options import ProdutoFindOptions
+
+
+class PostgresJson:
+    """json_build_object and json_agg, the column types already map to JSON."""
+
+    empty_array = SQL("'[]'::json")
+
+    @staticmethod
+    def object(*pairs):
+        return fn.json_build_object(*pairs)
+
+    @staticmethod
+    def embed(value):
+        return value
+
+    @classmethod
+    def array(cls, query, value, order_by):
+        return query.select(
+            fn.COALESCE(fn.json_agg(value).order_by(order_by), cls.empty_array)
+        )
+
+    @classmethod
+    def document(cls, query, value, order_by):
+        # As text, or the driver would decode it back into Python objects
+        return query.select(
+            fn.COALESCE(fn.json_agg(value).order_by(order_by), cls.empty_array).cast(
+                "text"
+            )
+        )
+
+    @staticmethod
+    def boolean(column):
+        return column
+
+    @staticmethod
+    def timestamp(column):
+        return column
+
+    @staticmethod
+    def money(column):
+        # 15 significant digits, halves away from zero, as round_price does
+        return fn.round(column.cast("numeric"), 2).cast("text")
+
+
+class SqliteJson:
+    """json_object and json_group_array, aggregated over an ordered derived table."""
+
+    empty_array = fn.json("[]")
+
+    @staticmethod
+    def object(*pairs):
+        return fn.json_object(*pairs)
+
+    @staticmethod
+    def embed(value):
+        # Keeps a nested document typed as JSON, not quoted as a string
+        return fn.json(EnclosedNodeList([value]))
+
+    @staticmethod
+    def array(query, value, order_by):
+        ordered = query.select(value.alias("item")).order_by(order_by)
+        return Select([ordered], [fn.json_group_array(fn.json(ordered.c.item))])
+
+    document = array
+
+    @staticmethod
+    def boolean(column):
+        # Stored as integers
+        return Case(None, [(column, fn.json("true")), (~column, fn.json("false"))])
+
+    @staticmethod
+    def timestamp(column):
+        # Stored as "YYYY-MM-DD HH:MM:SS[.ffffff]", pydantic renders the ISO form
+        return fn.replace(column, " ", "T")
+
+    @staticmethod
+    def money(column):
+        # Rounds as round_price does too
+        return fn.printf("%.2f", column)
+
+
+def _category_object(json, category):
+    return Case(
+        None,
+        [(category.id.is_null(), None)],
+        json.object(
+            "id",
+            category.id,
+            "created_at",
+            json.timestamp(category.created_at),
+            "updated_at",
+            json.timestamp(category.updated_at),
+            "deleted_at",
+            None,
+            "name",
+            category.name,
+            "description",
+            category.description,
+            "is_component",
+            json.boolean(category.is_component),
+        ),
+    )
+
+
+def _price_object(json, product, currency):
+    currency_object = Case(
+        None,
+        [(currency.id.is_null(), None)],
+        json.object(
+            "id",
+            currency.id,
+            "created_at",
+            json.timestamp(currency.created_at),
+            "updated_at",
+            json.timestamp(currency.updated_at),
+            "deleted_at",
+            None,
+            "symbol",
+            currency.symbol,
+            "name",
+            currency.name,
+            "code",
+            currency.code,
+            "is_active",
+            json.boolean(currency.is_active),
+        ),
+    )
+    # A zero price is mapped to no price, as the data mappers do
+    return Case(
+        None,
+        [((product.price.is_null()) | (product.price == 0), None)],
+        json.object("value", json.money(product.price), "currency", currency_object),
+    )
+
+
+def _product_object(json, product, category, currency, components):
+    return json.object(
+        "id",
+        product.id,
+        "created_at",
+        json.timestamp(product.created_at),
+        "updated_at",
+        json.timestamp(product.updated_at),
+        "deleted_at",
+        None,
+        "name",
+        product.name,
+        "category",
+        _category_object(json, category),
+        "price",
+        _price_object(json, product, currency),
+        "components",
+        components,
+        "is_active",
+        json.boolean(product.is_active),
+        "allow_components",
+        json.boolean(product.allow_components),
+        "version",
+        product.version,
+    )
+
+
+class JsonProductQuery(OrmProductQuery):
+    """
+    Renders the product listing to JSON inside the database, in one statement
+    whose single value is the response body: no row is mapped or serialized in
+    Python. PostgreSQL builds it with json_build_object and json_agg, SQLite
+    with json_object and json_group_array. The other queries are the ORM ones.
+    """
+
+    @db_router.reading
+    def render_catalog(
+        self, query_options: Optional[ProdutoFindOptions] = None
+    ) -> bytes:
+        json = (
+            PostgresJson
+            if isinstance(db_router.current(), PostgresqlDatabase)
+            else SqliteJson
+        )
+        query = (
+            Product.select()
+            .join(Currency, join_type=JOIN.LEFT_OUTER)
+            .switch(Product)
+            .join(Category, join_type=JOIN.LEFT_OUTER)
+        )
+        if query_options:
+            conditions = find_conditions(query_options)
+            if conditions:
+                query = query.where(*conditions)
+        item = json.object(
+            "product",
+            _product_object(
+                json,
+                Product,
+                Category,
+                Currency,
+                json.embed(self._components_array(json)),
+            ),
+            "order_count",
+            self._order_count(),
+        )
+        return json.document(query, item, Product.id).scalar(db).encode()
+
+    def _components_array(self, json):
+        Component = Product.alias()
+        ComponentCategory = Category.alias()
+        ComponentCurrency = Currency.alias()
+        query = (
+            ProductComponent.select()
+            .join(Component, on=ProductComponent.component)
+            .join(
+                ComponentCategory,
+                on=Component.category,
+                join_type=JOIN.LEFT_OUTER,
+            )
+            .switch(Component)
+            .join(
+                ComponentCurrency,
+                on=Component.currency,
+                join_type=JOIN.LEFT_OUTER,
+            )
+            .where(
+                ProductComponent.product == Product.id,
+                Component.deleted_at.is_null(),
+            )
+        )
+        component = _product_object(
+            json, Component, ComponentCategory, ComponentCurrency, json.empty_array
+        )
+        return json.array(query, component, ProductComponent.id)
+
+    def _order_count(self):
+        return (
+            SelectedProduct.select(
+                fn.COUNT(PurchaseSelectedProducts.purchase_id.distinct())
+            )
+            .join(
+                PurchaseSelectedProducts,
+                on=(PurchaseSelectedProducts.product == SelectedProduct.id),
+            )
+            .where(
+                SelectedProduct.product == Product.id,
+                PurchaseSelectedProducts.deleted_at.is_null(),
+            )
+        )
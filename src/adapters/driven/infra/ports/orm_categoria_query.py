@@ -1,6 +1,7 @@
 from src.adapters.data_mappers.categoria_entity_data_mapper import (
     CategoriaEntityDataMapper,
 )
+from src.adapters.driven.infra import db_router
 from src.adapters.driven.infra.models.categories import Category
 from src.core.application.ports.categoria_query import CategoriaQuery
 from src.core.domain.entities.categoria_entity import (
@@ -10,6 +11,7 @@ from src.core.domain.entities.categoria_entity import (
 
 
 class OrmCategoriaQuery(CategoriaQuery):
+    @db_router.reading
     def get(self, item_id: int) -> CategoriaEntity:
         product: Category = Category.select().where(Category.id == item_id)
         parsed_result = [
@@ -19,6 +21,7 @@ class OrmCategoriaQuery(CategoriaQuery):
             return parsed_result[0]
         return None
 
+    @db_router.reading
     def get_all(self) -> list[CategoriaEntity]:
         product: Category = Category.select()
         parsed_result = [
@@ -1,3 +1,8 @@
+from src.adapters.data_mappers.currency_entity_data_mapper import (
+    CurrencyEntityDataMapper,
+)
+from src.adapters.driven.infra import db_router
+from src.adapters.driven.infra.models.currencies import Currency
 from src.core.application.ports.currency_query import CurrencyQuery
 from src.core.domain.entities.currency_entity import (
     CurrencyEntity,
@@ -6,12 +11,23 @@ from src.core.domain.entities.currency_entity import (
 
 
 class OrmCurrencyQuery(CurrencyQuery):
+    @db_router.reading
     def get(self, item_id: int) -> CurrencyEntity:
-        #
-        raise NotImplementedError()
+        currency: Currency = Currency.select().where(Currency.id == item_id)
+        parsed_result = [
+            CurrencyEntityDataMapper.from_db_to_domain(res) for res in currency
+        ]
+        if len(parsed_result) == 1:
+            return parsed_result[0]
+        return None
 
+    @db_router.reading
     def get_all(self) -> list[CurrencyEntity]:
-        raise NotImplementedError()
+        currencies: Currency = Currency.select()
+        parsed_result = [
+            CurrencyEntityDataMapper.from_db_to_domain(res) for res in currencies
+        ]
+        return parsed_result
 
     def find(self, query_options: PartialCurrencyEntity) -> list[CurrencyEntity]:
         raise NotImplementedError()
@@ -1,9 +1,13 @@
-from peewee import JOIN
-from typing import List, Union
+from collections import defaultdict
+from peewee import JOIN, fn
+from pydantic_core import to_json
+from typing import Dict, List, Optional, Set, Union
+from src.adapters.data_mappers.identity_map import IdentityMap
 from src.adapters.data_mappers.produto_aggregate_data_mapper import (
     ProdutoAggregateDataMapper,
 )
 from src.adapters.data_mappers.produto_entity_data_mapper import ProdutoEntityDataMapper
+from src.adapters.driven.infra import db_router
 from src.adapters.driven.infra.models.categories import Category
 from src.adapters.driven.infra.models.currencies import Currency
 from src.adapters.driven.infra.models.product_components import ProductComponent
@@ -12,16 +16,84 @@ from src.adapters.driven.infra.models.purchase_selected_products import (
     PurchaseSelectedProducts,
 )
 from src.adapters.driven.infra.models.select_product import SelectedProduct
-from src.adapters.driven.infra.models.select_product_components import (
-    SelectedProductComponent,
-)
 from src.core.application.ports.produto_query import ProdutoQuery
 from src.core.domain.aggregates.produto_aggregate import ProdutoAggregate
 from src.core.domain.entities.produto_entity import ProdutoEntity
+from src.core.domain.read_models.produto_catalog import (
+    CatalogCategory,
+    CatalogCurrency,
+    CatalogProduct,
+    ProdutoCatalog,
+)
+from src.core.domain.value_objects.produto_state_value_object import (
+    ProdutoStateValueObject,
+)
+from src.core.helpers.options.produto_bulk_options import ProdutoBulkOptions
 from src.core.helpers.options.produto_find_options import ProdutoFindOptions
 
 
+def bulk_conditions(query_options: ProdutoBulkOptions) -> list:
+    """WHERE conditions on the product table alone, usable by UPDATE statements."""
+    conditions = [Product.deleted_at.is_null()]
+    if query_options.ids:
+        conditions.append(Product.id.in_(query_options.ids))
+    if query_options.name:
+        conditions.append(Product.name.contains(query_options.name))
+    if query_options.category:
+        conditions.append(
+            Product.category.in_(
+                Category.select(Category.id).where(
+                    Category.name.contains(query_options.category)
+                )
+            )
+        )
+    min_price, max_price = query_options.price_range or (None, None)
+    if min_price is not None:
+        conditions.append(Product.price >= min_price)
+    if max_price is not None and max_price != float("inf"):
+        conditions.append(Product.price <= max_price)
+    return conditions
+
+
+def find_conditions(query_options: ProdutoFindOptions) -> list:
+    """WHERE conditions of a search, on the product joined with its category."""
+    conditions = []
+    if query_options.name:
+        conditions.append(Product.name.contains(query_options.name))
+    if query_options.category:
+        conditions.append(Category.name.contains(query_options.category))
+    if any(query_options.price_range or []):
+        conditions.append(Product.price.between(*query_options.price_range))
+    return conditions
+
+
+CATALOG_COLUMNS = [
+    Product.id,
+    Product.name,
+    Product.price,
+    Product.is_active,
+    Product.allow_components,
+    Product.version,
+    Product.created_at,
+    Product.updated_at,
+    Category.id,
+    Category.name,
+    Category.description,
+    Category.is_component,
+    Category.created_at,
+    Category.updated_at,
+    Currency.id,
+    Currency.symbol,
+    Currency.name,
+    Currency.code,
+    Currency.is_active,
+    Currency.created_at,
+    Currency.updated_at,
+]
+
+
 class OrmProductQuery(ProdutoQuery):
+    @db_router.reading
     def get_only_entity(self, item_id: int) -> Union[ProdutoEntity, None]:
         product: Product = (
             Product.select()
@@ -49,68 +121,123 @@ class OrmProductQuery(ProdutoQuery):
             return None
         return parsed_result[0]
 
+    @db_router.reading
     def get(self, item_id: int) -> Union[ProdutoAggregate, None]:
-        product: Product = (
-            Product.select()
-            .join(
-                Category,
-                join_type=JOIN.LEFT_OUTER,
-            )
-            .switch(Product)
-            .join(
-                ProductComponent,
-                on=(ProductComponent.product == Product.id),
-                join_type=JOIN.LEFT_OUTER,
-            )
-            .switch(Product)
-            .join(
-                Currency,
-                join_type=JOIN.LEFT_OUTER,
-            )
-            .where(Product.id == item_id)
+        parsed_result = self._to_aggregates(
+            self._select_products().where(Product.id == item_id)
         )
-        parsed_result = [
-            ProdutoAggregateDataMapper.from_db_to_domain(res) for res in product
-        ]
         if not parsed_result:
             return None
         return parsed_result[0]
 
+    @db_router.reading
     def get_all(self) -> List[ProdutoAggregate]:
-        result: Product = (
-            Product.select()
-            .join(
-                Category,
-                join_type=JOIN.LEFT_OUTER,
+        return self._to_aggregates(self._select_products())
+
+    @db_router.reading
+    def find(self, query_options: ProdutoFindOptions) -> List[ProdutoAggregate]:
+        return self._to_aggregates(
+            self._select_products().where(*find_conditions(query_options))
+        )
+
+    @db_router.reading
+    def get_all_ids(self, items: List[int]) -> List[ProdutoAggregate]:
+        """Loads the aggregates with three queries, whatever the number of ids."""
+        if not items:
+            return []
+        return self._to_aggregates(self._select_products().where(Product.id.in_(items)))
+
+    @db_router.reading
+    def get_catalog(
+        self, query_options: Optional[ProdutoFindOptions] = None
+    ) -> ProdutoCatalog:
+        """
+        The listing as the compact read model, read as plain tuples without
+        building a model instance per row, in three to four queries.
+        """
+        catalog = self.load_catalog(
+            find_conditions(query_options) if query_options else []
+        )
+        order_counts = self.count_orders(catalog.ids)
+        for product_id in catalog.ids:
+            catalog.products[product_id].order_count = order_counts.get(product_id, 0)
+        return catalog
+
+    def render_catalog(
+        self, query_options: Optional[ProdutoFindOptions] = None
+    ) -> bytes:
+        """The listing as the JSON body of the API."""
+        return to_json(self.get_catalog(query_options).to_aggregates())
+
+    def load_catalog(self, conditions: list) -> ProdutoCatalog:
+        """The products matching the conditions with their components, without the order counts."""
+        catalog = ProdutoCatalog()
+        catalog.ids = self._add_catalog_rows(catalog, conditions)
+        if not catalog.ids:
+            return catalog
+        Component = Product.alias()
+        components = defaultdict(list)
+        for product_id, component_id in (
+            ProductComponent.select(
+                ProductComponent.product, ProductComponent.component
             )
-            .switch(Product)
-            .join(
-                ProductComponent,
-                on=(ProductComponent.product == Product.id),
-                join_type=JOIN.LEFT_OUTER,
+            .join(Component, on=ProductComponent.component)
+            .where(
+                ProductComponent.product.in_(catalog.ids),
+                Component.deleted_at.is_null(),
             )
-            .switch(Product)
-            .join(
-                Currency,
-                join_type=JOIN.LEFT_OUTER,
+            .order_by(ProductComponent.id)
+            .tuples()
+        ):
+            components[product_id].append(component_id)
+        missing = {
+            component_id
+            for component_ids in components.values()
+            for component_id in component_ids
+            if component_id not in catalog.products
+        }
+        if missing:
+            self._add_catalog_rows(catalog, [Product.id.in_(missing)])
+        for product_id in catalog.ids:
+            catalog.products[product_id].components = tuple(
+                components.get(product_id, ())
             )
+        return catalog
+
+    def _add_catalog_rows(self, catalog: ProdutoCatalog, conditions: list) -> List[int]:
+        ids = []
+        query = (
+            Product.select(*CATALOG_COLUMNS)
+            .join(Currency, join_type=JOIN.LEFT_OUTER)
+            .switch(Product)
+            .join(Category, join_type=JOIN.LEFT_OUTER)
+            .where(*conditions)
+            .order_by(Product.id)
         )
-        parsed_result = [
-            ProdutoAggregateDataMapper.from_db_to_domain(res) for res in result
-        ]
-        return parsed_result
+        for row in query.tuples():
+            category_id, currency_id = row[8], row[14]
+            if category_id is not None and category_id not in catalog.categories:
+                catalog.categories[category_id] = CatalogCategory(*row[8:14])
+            if currency_id is not None and currency_id not in catalog.currencies:
+                catalog.currencies[currency_id] = CatalogCurrency(*row[14:21])
+            catalog.products[row[0]] = CatalogProduct(
+                id=row[0],
+                name=row[1],
+                category_id=category_id,
+                price=row[2],
+                currency_id=currency_id,
+                is_active=row[3],
+                allow_components=row[4],
+                version=row[5],
+                created_at=row[6],
+                updated_at=row[7],
+            )
+            ids.append(row[0])
+        return ids
 
-    def find(self, query_options: ProdutoFindOptions) -> List[ProdutoAggregate]:
-        queries = []
-        if query_options.name:
-            queries.append(Product.name.contains(query_options.name))
-        if query_options.category:
-            queries.append(Category.name.contains(query_options.category))
-        if query_options.price_range:
-            queries.append(Product.price.between(*query_options.price_range))
-
-        result = (
-            Product.select()
+    def _select_products(self):
+        return (
+            Product.select(Product, Currency, Category)
             .join(
                 Currency,
                 join_type=JOIN.LEFT_OUTER,
@@ -120,77 +247,192 @@ class OrmProductQuery(ProdutoQuery):
                 Category,
                 join_type=JOIN.LEFT_OUTER,
             )
-            .switch(Product)
-            .join(
-                ProductComponent,
-                on=(ProductComponent.product == Product.id),
-                join_type=JOIN.LEFT_OUTER,
-            )
-            .where(*queries)
+            .order_by(Product.id)
         )
-        parsed_result = [
-            ProdutoAggregateDataMapper.from_db_to_domain(res) for res in result
+
+    def _to_aggregates(self, query) -> List[ProdutoAggregate]:
+        """Completes the products with their components and order counts, in two more queries."""
+        products = list(query)
+        if not products:
+            return []
+        product_ids = [product.id for product in products]
+        identity_map = IdentityMap()
+        components = self._load_components(product_ids, identity_map)
+        order_counts = self.count_orders(product_ids)
+        return [
+            ProdutoAggregateDataMapper.from_loaded_db_to_domain(
+                product,
+                components[product.id],
+                order_counts.get(product.id, 0),
+                identity_map,
+            )
+            for product in products
         ]
-        return parsed_result
 
-    def get_all_ids(self, items: List[int]) -> List[ProdutoAggregate]:
-        result = (
-            Product.select()
+    def _load_components(
+        self, product_ids: List[int], identity_map: IdentityMap
+    ) -> Dict[int, List[ProdutoEntity]]:
+        Component = Product.alias()
+        ComponentCategory = Category.alias()
+        ComponentCurrency = Currency.alias()
+        components = defaultdict(list)
+
+        def map_component(component: Product) -> ProdutoEntity:
+            return ProdutoEntityDataMapper.from_db_to_domain(
+                component, components=[], identity_map=identity_map
+            )
+
+        for product_component in (
+            ProductComponent.select(
+                ProductComponent, Component, ComponentCategory, ComponentCurrency
+            )
+            .join(Component, on=ProductComponent.component)
             .join(
-                Currency,
+                ComponentCategory,
+                on=Component.category,
                 join_type=JOIN.LEFT_OUTER,
             )
-            .switch(Product)
+            .switch(Component)
             .join(
-                Category,
+                ComponentCurrency,
+                on=Component.currency,
                 join_type=JOIN.LEFT_OUTER,
             )
-            .where(Product.id.in_(items))
-        )
-        parsed_result = [
-            ProdutoAggregateDataMapper.from_db_to_domain(res) for res in result
-        ]
-        return parsed_result
+            .where(
+                ProductComponent.product.in_(product_ids),
+                Component.deleted_at.is_null(),
+            )
+            .order_by(ProductComponent.id)
+        ):
+            # A component offered by many products is mapped once, keyed apart
+            # from the listed products, which carry their own components
+            components[product_component.product_id].append(
+                identity_map.map(
+                    ProductComponent, product_component.component, map_component
+                )
+            )
+        return components
 
-    def get_by_purchase_id(self, purchase_id: int) -> List[ProdutoAggregate]:
-        result = (
-            Product.select()
-            .join(
-                Currency,
-                join_type=JOIN.LEFT_OUTER,
+    @db_router.reading
+    def count_orders(self, product_ids: List[int]) -> Dict[int, int]:
+        if not product_ids:
+            return {}
+        return dict(
+            SelectedProduct.select(
+                SelectedProduct.product,
+                fn.COUNT(PurchaseSelectedProducts.purchase_id.distinct()),
             )
-            .switch(Product)
             .join(
-                Category,
-                join_type=JOIN.LEFT_OUTER,
+                PurchaseSelectedProducts,
+                on=(PurchaseSelectedProducts.product == SelectedProduct.id),
             )
-            .switch(Product)
-            .join(
-                ProductComponent,
-                on=(ProductComponent.product == Product.id),
-                join_type=JOIN.LEFT_OUTER,
+            .where(
+                SelectedProduct.product.in_(product_ids),
+                PurchaseSelectedProducts.deleted_at.is_null(),
+            )
+            .group_by(SelectedProduct.product)
+            .tuples()
+        )
+
+    @db_router.reading
+    def get_order_ids(
+        self, product_id: int, after: Optional[int] = None, limit: int = 100
+    ) -> List[int]:
+        """Purchase ids of the product in ascending order, keyset paginated by after."""
+        conditions = [
+            SelectedProduct.product == product_id,
+            PurchaseSelectedProducts.deleted_at.is_null(),
+        ]
+        if after is not None:
+            conditions.append(PurchaseSelectedProducts.purchase_id > after)
+        return [
+            purchase_id
+            for (purchase_id,) in PurchaseSelectedProducts.select(
+                PurchaseSelectedProducts.purchase_id
             )
-            .switch(Product)
             .join(
                 SelectedProduct,
-                on=(SelectedProduct.id == Product.id),
-                join_type=JOIN.LEFT_OUTER,
+                on=(PurchaseSelectedProducts.product == SelectedProduct.id),
             )
+            .where(*conditions)
+            .distinct()
+            .order_by(PurchaseSelectedProducts.purchase_id)
+            .limit(limit)
+            .tuples()
+        ]
+
+    @db_router.reading
+    def get_by_purchase_id(self, purchase_id: int) -> List[ProdutoAggregate]:
+        return self._to_aggregates(
+            self._select_products()
+            .switch(Product)
+            .join(SelectedProduct, on=(SelectedProduct.product == Product.id))
             .join(
                 PurchaseSelectedProducts,
                 on=(PurchaseSelectedProducts.product == SelectedProduct.id),
-                join_type=JOIN.LEFT_OUTER,
             )
-            .switch(PurchaseSelectedProducts)
-            .join(
-                SelectedProductComponent,
-                on=(SelectedProductComponent.selected_product == SelectedProduct.id),
-                join_type=JOIN.LEFT_OUTER,
+            .where(
+                PurchaseSelectedProducts.purchase_id == purchase_id,
+                PurchaseSelectedProducts.deleted_at.is_null(),
+                SelectedProduct.deleted_at.is_null(),
             )
-            .where(PurchaseSelectedProducts.purchase_id == purchase_id)
             .distinct()
         )
-        parsed_result = [
-            ProdutoAggregateDataMapper.from_db_to_domain(res) for res in result
+
+    @db_router.reading
+    def get_all_names(self) -> Set[str]:
+        return {
+            name
+            for (name,) in Product.select(Product.name)
+            .where(Product.deleted_at.is_null())
+            .tuples()
+        }
+
+    @db_router.reading
+    def find_states(
+        self, query_options: ProdutoBulkOptions
+    ) -> List[ProdutoStateValueObject]:
+        return [
+            ProdutoStateValueObject(
+                id=product_id,
+                is_active=is_active,
+                has_category=category_id is not None,
+                has_price=price is not None,
+                has_currency=currency_id is not None,
+            )
+            for product_id, is_active, category_id, price, currency_id in Product.select(
+                Product.id,
+                Product.is_active,
+                Product.category,
+                Product.price,
+                Product.currency,
+            )
+            .where(*bulk_conditions(query_options))
+            .tuples()
+        ]
+
+    @db_router.reading
+    def exists_by_name(self, name: str, exclude_id: Optional[int] = None) -> bool:
+        """Case insensitive match, answered by the product_name_unique index."""
+        conditions = [
+            fn.LOWER(Product.name) == name.lower(),
+            Product.deleted_at.is_null(),
         ]
-        return parsed_result
+        if exclude_id is not None:
+            conditions.append(Product.id != exclude_id)
+        return Product.select(Product.id).where(*conditions).exists()
+
+    @db_router.reading
+    def has_orders(self, product_id: int) -> bool:
+        return (
+            SelectedProduct.select(SelectedProduct.id)
+            .join(
+                PurchaseSelectedProducts,
+                on=(PurchaseSelectedProducts.product == SelectedProduct.id),
+            )
+            .where(
+                SelectedProduct.product == product_id,
+                PurchaseSelectedProducts.deleted_at.is_null(),
+            )
+            .exists()
+        )
@@ -1,9 +1,10 @@
+from collections import Counter, defaultdict
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional
+from peewee import IntegrityError, fn
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from src.adapters.data_mappers.produto_entity_data_mapper import ProdutoEntityDataMapper
-from src.adapters.data_mappers.produto_aggregate_data_mapper import (
-    ProdutoAggregateDataMapper,
-)
+from src.adapters.driven.infra import db, db_router
 from src.adapters.driven.infra.models.product_components import ProductComponent
 from src.adapters.driven.infra.models.products import Product
 from src.adapters.driven.infra.models.purchase_selected_products import (
@@ -13,77 +14,345 @@ from src.adapters.driven.infra.models.select_product import SelectedProduct
 from src.adapters.driven.infra.models.select_product_components import (
     SelectedProductComponent,
 )
-from src.adapters.driven.infra.ports.orm_produto_query import OrmProductQuery
+from src.adapters.driven.infra.persistence.product_catalog_projection import (
+    ProductCatalogProjection,
+)
+from src.adapters.driven.infra.ports.orm_produto_query import (
+    OrmProductQuery,
+    bulk_conditions,
+)
 from src.adapters.driven.infra.repositories.orm_repository import OrmRepository
 from src.core.domain.aggregates.produto_aggregate import ProdutoAggregate
 from src.core.domain.entities.produto_entity import PartialProdutoEntity, ProdutoEntity
 from src.core.domain.repositories.produto_repository import ProdutoRepository
+from src.core.helpers.exceptions.concurrency_conflict_error import (
+    ConcurrencyConflictError,
+)
+from src.core.helpers.options.add_purchase_options import AddPurchaseOptions
+from src.core.helpers.options.produto_bulk_options import ProdutoBulkOptions
 from src.core.helpers.options.produto_find_options import ProdutoFindOptions
 
 
+@contextmanager
+def unique_product_name():
+    """Reports a concurrent duplicate name, caught by product_name_unique, as the guard would."""
+    try:
+        yield
+    except IntegrityError as e:
+        if "product_name_unique" not in str(e):
+            raise
+        raise ValueError("Já existe um produto com esse nome") from e
+
+
 class OrmProdutoRepository(OrmRepository, ProdutoRepository):
+    def __init__(
+        self,
+        product_query: Optional[OrmProductQuery] = None,
+        catalog_projection: Optional[ProductCatalogProjection] = None,
+    ):
+        self.product_query = product_query or OrmProductQuery()
+        self.catalog_projection = catalog_projection
 
+    def _project(self, product_ids: Iterable[int]):
+        """Keeps the denormalized catalog current, when one is read."""
+        if self.catalog_projection is not None:
+            self.catalog_projection.refresh(product_ids)
+
+    @db_router.writing
     def create(self, produto: PartialProdutoEntity) -> ProdutoAggregate:
+        """
+        Single INSERT ... RETURNING, the category, currency and components of
+        the aggregate are the ones the entity already holds.
+        """
         db_item = ProdutoEntityDataMapper.from_domain_to_db(produto)
-        product: Product = Product.create(**db_item)
-        product.save()
-        return ProdutoAggregateDataMapper.from_db_to_domain(product)
+        db_item.pop("id")
+        db_item.pop("components")
+        with unique_product_name():
+            row = Product.insert(**db_item).returning(Product).execute()[0]
+        self._project([row.id])
+        return ProdutoAggregate(
+            product=ProdutoEntityDataMapper.from_db_row_to_domain(row, produto)
+        )
 
+    @db_router.writing
+    def bulk_create(self, produtos: List[PartialProdutoEntity]) -> List[int]:
+        """Inserts every product with a single multi-row INSERT ... RETURNING id."""
+        if not produtos:
+            return []
+        rows = []
+        for produto in produtos:
+            db_item = ProdutoEntityDataMapper.from_domain_to_db(produto)
+            db_item.pop("id")
+            db_item.pop("components")
+            rows.append(db_item)
+        ids = [
+            row[0]
+            for row in Product.insert_many(rows)
+            .returning(Product.id)
+            .tuples()
+            .execute()
+        ]
+        self._project(ids)
+        return ids
+
+    @db_router.writing
     def update(self, produto: ProdutoEntity) -> ProdutoAggregate:
         db_item = ProdutoEntityDataMapper.from_domain_to_db(produto)
-        new_component = db_item.pop("components", [])
-
-        update_query: Product = Product.update(**db_item).where(
-            Product.id == db_item["id"]
+        db_item.pop("components", None)
+        conditions = [Product.id == produto.id]
+        if produto.version is not None:
+            # Compare and swap, the update only applies to the version it was based on
+            conditions.append(Product.version == produto.version)
+        with unique_product_name(), db.atomic():
+            updated = (
+                Product.update(**db_item)
+                .where(*conditions)
+                .returning(Product)
+                .execute()
+            )
+            if updated:
+                self._sync_components(
+                    produto.id,
+                    {component.id for component in produto.components or []},
+                )
+                self._project([produto.id])
+        if not updated:
+            current = self.product_query.get(produto.id)
+            if not current:
+                raise ValueError("Produto não encontrado")
+            raise ConcurrencyConflictError(
+                "Produto alterado por outra requisição", current=current
+            )
+        return ProdutoAggregate(
+            product=ProdutoEntityDataMapper.from_db_row_to_domain(updated[0], produto)
         )
-        update_query.execute()
 
-        ProductComponent.delete().where(
-            ProductComponent.product == produto.id
-        ).execute()
+    def _sync_components(self, produto_id: int, component_ids: Set[int]):
+        current_ids = {
+            component_id
+            for (component_id,) in ProductComponent.select(ProductComponent.component)
+            .where(ProductComponent.product == produto_id)
+            .tuples()
+        }
+        removed_ids = current_ids - component_ids
+        added_ids = component_ids - current_ids
+        if removed_ids:
+            ProductComponent.delete().where(
+                ProductComponent.product == produto_id,
+                ProductComponent.component.in_(sorted(removed_ids)),
+            ).execute()
+        if added_ids:
+            ProductComponent.insert_many(
+                [
+                    {"product": produto_id, "component": component_id}
+                    for component_id in sorted(added_ids)
+                ]
+            ).execute()
 
-        for component in new_component or []:
-            ProductComponent.create(
-                product=component["product"], component=component["component"]
+    @db_router.writing
+    def set_active_in_bulk(
+        self, query_options: ProdutoBulkOptions, is_active: bool
+    ) -> List[int]:
+        conditions = bulk_conditions(query_options)
+        if is_active:
+            conditions += [
+                Product.is_active == False,
+                Product.category.is_null(False),
+                Product.price.is_null(False),
+            ]
+        else:
+            conditions.append(Product.is_active == True)
+        ids = [
+            row[0]
+            for row in Product.update(is_active=is_active)
+            .where(*conditions)
+            .returning(Product.id)
+            .tuples()
+            .execute()
+        ]
+        self._project(ids)
+        return ids
+
+    @db_router.writing
+    def reprice_in_bulk(
+        self,
+        query_options: ProdutoBulkOptions,
+        value: Optional[float] = None,
+        percentage: Optional[float] = None,
+    ) -> List[int]:
+        conditions = bulk_conditions(query_options)
+        conditions += [Product.price.is_null(False), Product.currency.is_null(False)]
+        if value is not None:
+            price = value
+        else:
+            price = fn.ROUND(
+                (Product.price * (1 + percentage / 100)).cast("numeric"), 2
             )
-        return ProdutoAggregateDataMapper.from_db_to_domain(
-            Product.get(Product.id == db_item["id"])
-        )
+        ids = [
+            row[0]
+            for row in Product.update(price=price)
+            .where(*conditions)
+            .returning(Product.id)
+            .tuples()
+            .execute()
+        ]
+        self._project(ids)
+        return ids
 
+    @db_router.writing
     def delete(self, produto_id: int):
         update_query: Product = Product.update(deleted_at=datetime.now()).where(
             Product.id == produto_id
         )
         update_query.execute()
+        self._project([produto_id])
 
     def get_by_product_id(self, produto_id: int) -> ProdutoAggregate:
-        return OrmProductQuery().get(produto_id)
+        return self.product_query.get(produto_id)
 
     def find(self, query_options: ProdutoFindOptions) -> list[ProdutoAggregate]:
-        return OrmProductQuery().find(query_options)
+        return self.product_query.find(query_options)
 
-    def set_selected_product_and_components(
+    @db_router.writing
+    def set_selected_products_and_components(
         self,
-        produto_id: int,
         purchase_id: int,
-        component_ids: Optional[List[int]] = None,
-    ) -> ProdutoAggregate:
-        selected_product = SelectedProduct.create(product=produto_id)
-        selected_product.save()
-
-        purchase_selected_product = PurchaseSelectedProducts.create(
-            purchase=purchase_id,
-            product=selected_product,
-        )
-        purchase_selected_product.save()
+        products: List[AddPurchaseOptions],
+    ) -> List[int]:
+        """
+        Replaces the lines of the purchase, returning their selected product ids.
+
+        The current lines are diffed against the requested ones: identical lines
+        are kept, lines of the same product only get their components adjusted,
+        and only the remaining delta is soft deleted or inserted.
+        """
+        with db.atomic():
+            current_lines = self._get_purchase_lines(purchase_id)
+
+            unmatched_lines = defaultdict(list)
+            for selected_product_id, (product_id, components) in current_lines.items():
+                key = (product_id, tuple(sorted(c for _, c in components)))
+                unmatched_lines[key].append(selected_product_id)
+
+            line_ids: List[Optional[int]] = [None] * len(products)
+            for index, product in enumerate(products):
+                key = (product.product_id, tuple(sorted(product.components or [])))
+                if unmatched_lines.get(key):
+                    line_ids[index] = unmatched_lines[key].pop(0)
 
-        for component_id in component_ids or []:
-            selected_product_component = SelectedProductComponent.create(
-                selected_product=selected_product,
-                product_component={"id": component_id},
+            removed_lines = sorted(
+                line_id for ids in unmatched_lines.values() for line_id in ids
             )
-            selected_product_component.save()
+            removed_components: List[int] = []
+            new_components: List[Tuple[int, int]] = []
+            for index, product in enumerate(products):
+                if line_ids[index] is not None:
+                    continue
+                line_id = next(
+                    (
+                        line_id
+                        for line_id in removed_lines
+                        if current_lines[line_id][0] == product.product_id
+                    ),
+                    None,
+                )
+                if line_id is None:
+                    continue
+                removed_lines.remove(line_id)
+                line_ids[index] = line_id
+                wanted = Counter(product.components or [])
+                for component_row_id, component_id in current_lines[line_id][1]:
+                    if wanted[component_id] > 0:
+                        wanted[component_id] -= 1
+                    else:
+                        removed_components.append(component_row_id)
+                new_components.extend(
+                    (line_id, component_id) for component_id in wanted.elements()
+                )
 
-        return ProdutoAggregateDataMapper.from_db_to_domain(
-            Product.get(Product.id == produto_id)
-        )
+            now = datetime.now()
+            if removed_lines:
+                PurchaseSelectedProducts.update(deleted_at=now).where(
+                    PurchaseSelectedProducts.purchase_id == purchase_id,
+                    PurchaseSelectedProducts.product.in_(removed_lines),
+                ).execute()
+                SelectedProduct.update(deleted_at=now).where(
+                    SelectedProduct.id.in_(removed_lines)
+                ).execute()
+            if removed_lines or removed_components:
+                SelectedProductComponent.update(deleted_at=now).where(
+                    SelectedProductComponent.deleted_at.is_null()
+                    & (
+                        SelectedProductComponent.selected_product.in_(removed_lines)
+                        | SelectedProductComponent.id.in_(removed_components)
+                    )
+                ).execute()
+
+            new_lines = [
+                (index, product)
+                for index, product in enumerate(products)
+                if line_ids[index] is None
+            ]
+            if new_lines:
+                inserted_ids = [
+                    row[0]
+                    for row in SelectedProduct.insert_many(
+                        [{"product": product.product_id} for _, product in new_lines]
+                    )
+                    .returning(SelectedProduct.id)
+                    .tuples()
+                    .execute()
+                ]
+                PurchaseSelectedProducts.insert_many(
+                    [
+                        {"product": line_id, "purchase_id": purchase_id}
+                        for line_id in inserted_ids
+                    ]
+                ).execute()
+                for line_id, (index, product) in zip(inserted_ids, new_lines):
+                    line_ids[index] = line_id
+                    new_components.extend(
+                        (line_id, component_id)
+                        for component_id in product.components or []
+                    )
+            if new_components:
+                SelectedProductComponent.insert_many(
+                    [
+                        {"selected_product": line_id, "component": component_id}
+                        for line_id, component_id in new_components
+                    ]
+                ).execute()
+        return line_ids
+
+    def _get_purchase_lines(
+        self, purchase_id: int
+    ) -> Dict[int, Tuple[int, List[Tuple[int, int]]]]:
+        """Maps each selected product of the purchase to its product and (row id, component) pairs."""
+        lines = {
+            selected_product_id: (product_id, [])
+            for selected_product_id, product_id in SelectedProduct.select(
+                SelectedProduct.id, SelectedProduct.product
+            )
+            .join(
+                PurchaseSelectedProducts,
+                on=(PurchaseSelectedProducts.product == SelectedProduct.id),
+            )
+            .where(
+                PurchaseSelectedProducts.purchase_id == purchase_id,
+                PurchaseSelectedProducts.deleted_at.is_null(),
+            )
+            .order_by(SelectedProduct.id)
+            .tuples()
+        }
+        if lines:
+            for component_row_id, selected_product_id, component_id in (
+                SelectedProductComponent.select(
+                    SelectedProductComponent.id,
+                    SelectedProductComponent.selected_product,
+                    SelectedProductComponent.component,
+                )
+                .where(SelectedProductComponent.selected_product.in_(list(lines)))
+                .tuples()
+            ):
+                lines[selected_product_id][1].append((component_row_id, component_id))
+        return lines
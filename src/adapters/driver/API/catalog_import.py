@@ -0,0 +1,129 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Dict, List, Tuple, Union
+
+from pydantic import ValidationError
+
+from src.adapters.driver.API.schemas.import_product_schema import (
+    ImportProductSchema,
+)
+from src.core.domain.entities.categoria_entity import PartialCategoriaEntity
+from src.core.domain.entities.currency_entity import PartialCurrencyEntity
+from src.core.domain.entities.produto_entity import PartialProdutoEntity
+from src.core.domain.value_objects.preco_value_object import PrecoValueObject
+
+CSV_MEDIA_TYPES = {"text/csv"}
+NDJSON_MEDIA_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+
+Record = Tuple[int, Union[Dict[str, str], str]]
+ProductRow = Tuple[int, Union[PartialProdutoEntity, str]]
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Splits a stream of UTF-8 chunks into lines, without buffering the whole body."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[Record]:
+    header = None
+    row = 0
+    record = ""
+    async for line in lines:
+        record = f"{record}\n{line}" if record else line
+        # A quoted field may span lines, the record ends once the quotes balance
+        if record.count('"') % 2:
+            continue
+        if not record.strip():
+            record = ""
+            continue
+        values = next(csv.reader([record]))
+        record = ""
+        if header is None:
+            header = [column.strip() for column in values]
+            continue
+        row += 1
+        if len(values) != len(header):
+            yield row, f"Esperadas {len(header)} colunas, encontradas {len(values)}"
+            continue
+        yield row, {
+            column: value.strip()
+            for column, value in zip(header, values)
+            if value.strip()
+        }
+    if record:
+        yield row + 1, "Aspas não fechadas"
+
+
+async def iter_ndjson_records(lines: AsyncIterator[str]) -> AsyncIterator[Record]:
+    row = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield row, f"JSON inválido: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield row, "Cada linha deve ser um objeto JSON"
+            continue
+        yield row, record
+
+
+def to_product(record: Union[Dict[str, str], str]) -> Union[PartialProdutoEntity, str]:
+    if isinstance(record, str):
+        return record
+    try:
+        produto = ImportProductSchema(**record)
+    except ValidationError as e:
+        return "; ".join(
+            f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+            for error in e.errors()
+        )
+    return PartialProdutoEntity(
+        name=produto.name,
+        allow_components=produto.allow_components,
+        price=PrecoValueObject(
+            value=produto.value,
+            currency=PartialCurrencyEntity(id=produto.currency_id),
+        ),
+        category=PartialCategoriaEntity(id=produto.category_id),
+    )
+
+
+def iter_product_batches(
+    chunks: AsyncIterator[bytes], media_type: str, batch_size: int
+) -> AsyncIterator[List[ProductRow]]:
+    if media_type in CSV_MEDIA_TYPES:
+        records = iter_csv_records(iter_lines(chunks))
+    elif media_type in NDJSON_MEDIA_TYPES:
+        records = iter_ndjson_records(iter_lines(chunks))
+    else:
+        raise ValueError(
+            "Formato não suportado, envie text/csv ou application/x-ndjson"
+        )
+    return _batched(records, batch_size)
+
+
+async def _batched(
+    records: AsyncIterator[Record], batch_size: int
+) -> AsyncIterator[List[ProductRow]]:
+    batch: List[ProductRow] = []
+    async for row, record in records:
+        batch.append((row, to_product(record)))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
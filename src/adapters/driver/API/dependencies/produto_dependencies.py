@@ -0,0 +1,155 @@
+import os
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+
+from fastapi import Depends
+
+from src.adapters.driven.infra import db_router
+from src.adapters.driven.infra.persistence.peewee_unit_of_work import PeeweeUnitOfWork
+from src.adapters.driven.infra.persistence.product_catalog_projection import (
+    ProductCatalogProjection,
+)
+from src.adapters.driven.infra.ports.cached_categoria_query import (
+    CachedCategoriaQuery,
+)
+from src.adapters.driven.infra.ports.catalog_produto_query import CatalogProductQuery
+from src.adapters.driven.infra.ports.json_produto_query import JsonProductQuery
+from src.adapters.driven.infra.ports.orm_categoria_query import OrmCategoriaQuery
+from src.adapters.driven.infra.ports.orm_currency_query import OrmCurrencyQuery
+from src.adapters.driven.infra.ports.orm_produto_query import OrmProductQuery
+from src.adapters.driven.infra.repositories.orm_produto_repository import (
+    OrmProdutoRepository,
+)
+from src.adapters.driver.API.rendered_response_cache import RenderedResponseCache
+from src.core.application.ports.categoria_query import CategoriaQuery
+from src.core.application.ports.currency_query import CurrencyQuery
+from src.core.application.ports.produto_query import ProdutoQuery
+from src.core.application.services.produto_service_command import ProductServiceCommand
+from src.core.application.services.produto_service_query import ProdutoServiceQuery
+from src.core.domain.base.unit_of_work import UnitOfWork
+from src.core.domain.repositories.produto_repository import ProdutoRepository
+from src.core.helpers.interfaces.chace_service import CacheService
+from src.core.helpers.services.in_memory_cache import InMemoryCacheService
+
+# Kept short, other workers only see a write once their copy expires
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL") or 5)
+# Categories are only written to the database directly, so they are reloaded periodically
+CATEGORY_CACHE_TTL = int(os.getenv("CATEGORY_CACHE_TTL") or 300)
+
+
+class ProdutoContainer:
+    """Composition root of the product module, built once per process."""
+
+    def __init__(
+        self,
+        product_repository: ProdutoRepository,
+        product_query: ProdutoQuery,
+        category_query: CategoriaQuery,
+        currency_query: CurrencyQuery,
+        caches: Optional[Dict[str, CacheService]] = None,
+        unit_of_work: Optional[UnitOfWork] = None,
+    ):
+        self.product_repository = product_repository
+        self.product_query = product_query
+        self.category_query = category_query
+        self.currency_query = currency_query
+        response_cache = InMemoryCacheService(start_cleaner_deamon=False)
+        self.caches = {**(caches or {}), "responses": response_cache}
+        self.unit_of_work = unit_of_work or UnitOfWork()
+        self.rendered_responses = RenderedResponseCache(
+            response_cache, RESPONSE_CACHE_TTL
+        )
+        self.unit_of_work.add_commit_listener(
+            lambda command: self.rendered_responses.clear()
+        )
+        self.product_service_command = ProductServiceCommand(
+            product_repository,
+            product_query,
+            category_query,
+            currency_query,
+            self.unit_of_work,
+        )
+        self.product_service_query = ProdutoServiceQuery(
+            product_query,
+            category_query,
+            currency_query,
+        )
+
+    def warm_up(self):
+        """Loads the reference data, so pre-forked workers share it copy-on-write."""
+        self.product_service_query.list_categories()
+
+
+def build_orm_container() -> ProdutoContainer:
+    product_query = OrmProductQuery()
+    category_cache = InMemoryCacheService(start_cleaner_deamon=False)
+    return ProdutoContainer(
+        OrmProdutoRepository(product_query),
+        product_query,
+        CachedCategoriaQuery(OrmCategoriaQuery(), category_cache, CATEGORY_CACHE_TTL),
+        OrmCurrencyQuery(),
+        caches={"categories": category_cache},
+        unit_of_work=PeeweeUnitOfWork(db_router),
+    )
+
+
+def build_catalog_container() -> ProdutoContainer:
+    """Reads the products from the denormalized product_catalog table, kept by the writes."""
+    product_query = CatalogProductQuery()
+    category_cache = InMemoryCacheService(start_cleaner_deamon=False)
+    return ProdutoContainer(
+        OrmProdutoRepository(product_query, ProductCatalogProjection()),
+        product_query,
+        CachedCategoriaQuery(OrmCategoriaQuery(), category_cache, CATEGORY_CACHE_TTL),
+        OrmCurrencyQuery(),
+        caches={"categories": category_cache},
+        unit_of_work=PeeweeUnitOfWork(db_router),
+    )
+
+
+def build_json_container() -> ProdutoContainer:
+    """Renders the product listing to JSON in the database."""
+    product_query = JsonProductQuery()
+    category_cache = InMemoryCacheService(start_cleaner_deamon=False)
+    return ProdutoContainer(
+        OrmProdutoRepository(product_query),
+        product_query,
+        CachedCategoriaQuery(OrmCategoriaQuery(), category_cache, CATEGORY_CACHE_TTL),
+        OrmCurrencyQuery(),
+        caches={"categories": category_cache},
+        unit_of_work=PeeweeUnitOfWork(db_router),
+    )
+
+
+# Adapter strategies selectable through PRODUCT_ADAPTER
+container_builders: Dict[str, Callable[[], ProdutoContainer]] = {
+    "orm": build_orm_container,
+    "catalog": build_catalog_container,
+    "json": build_json_container,
+}
+
+
+@lru_cache
+def get_produto_container() -> ProdutoContainer:
+    strategy = os.getenv("PRODUCT_ADAPTER", "orm")
+    if strategy not in container_builders:
+        raise NotImplementedError(f"Product adapter '{strategy}' not found.")
+    return container_builders[strategy]()
+
+
+def get_product_service_command(
+    container: ProdutoContainer = Depends(get_produto_container),
+) -> ProductServiceCommand:
+    return container.product_service_command
+
+
+def get_produto_service_query(
+    container: ProdutoContainer = Depends(get_produto_container),
+) -> ProdutoServiceQuery:
+    return container.product_service_query
+
+
+def get_rendered_responses(
+    container: ProdutoContainer = Depends(get_produto_container),
+) -> RenderedResponseCache:
+    return container.rendered_responses
@@ -0,0 +1,57 @@
+import os
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from src.adapters.driven.infra.database.db import db_router
+from src.adapters.driver.API.dependencies.produto_dependencies import (
+    ProdutoContainer,
+    get_produto_container,
+)
+from src.core.helpers.services.background_threads import background_threads
+from src.core.helpers.services.event_loop_lag_monitor import EventLoopLagMonitor
+
+MAX_EVENT_LOOP_LAG_MS = float(os.getenv("MAX_EVENT_LOOP_LAG_MS") or 500)
+
+event_loop_lag_monitor = EventLoopLagMonitor()
+
+router = APIRouter(
+    prefix="/health",
+    tags=["health"],
+)
+
+
+@router.get("/live")
+async def liveness():
+    """
+    Cheap check, answers as long as the event loop is serving requests.
+    """
+    return {"status": "alive"}
+
+
+@router.get("/ready")
+def readiness(container: ProdutoContainer = Depends(get_produto_container)):
+    """
+    Detailed check of the database, caches, event loop and background threads,
+    with the statements each command committed.
+    """
+    database = db_router.status()
+    event_loop = event_loop_lag_monitor.status()
+    threads = background_threads.status()
+    checks = {
+        "database": database["primary"]["reachable"],
+        "event_loop": event_loop["lag_ms"] <= MAX_EVENT_LOOP_LAG_MS,
+        "background_threads": all(thread["healthy"] for thread in threads.values()),
+    }
+    ready = all(checks.values())
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "not_ready",
+            "checks": checks,
+            "database": database,
+            "event_loop": event_loop,
+            "caches": {name: cache.stats() for name, cache in container.caches.items()},
+            "commands": container.unit_of_work.stats(),
+            "background_threads": threads,
+        },
+    )
@@ -1,6 +1,18 @@
-from fastapi import APIRouter, HTTPException
+import os
+from typing import Any, Callable, Dict
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from loguru import logger
-from builder import build_db, seed_db
+
+from src.adapters.driven.infra.database.db import close_db
+from src.adapters.driver.API.catalog_import import iter_product_batches
+from src.adapters.driver.API.dependencies.produto_dependencies import (
+    get_product_service_command,
+)
+from src.core.application.services.produto_import import ProdutoImportReport
+from src.core.application.services.produto_service_command import ProductServiceCommand
+
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE") or 500)
 
 router = APIRouter(
     prefix="/maintenance",
@@ -8,9 +20,26 @@ router = APIRouter(
 )
 
 
+async def run_in_db_thread(func: Callable, *args) -> Any:
+    """
+    Runs func in the threadpool and closes the connections it opened there, so
+    the worker threads do not keep pooled connections checked out.
+    """
+
+    def call():
+        try:
+            return func(*args)
+        finally:
+            close_db()
+
+    return await run_in_threadpool(call)
+
+
 @router.post("/build_db", include_in_schema=False)
 async def build_db_api() -> bool:
     try:
+        from builder import build_db
+
         build_db()
         return True
     except (ValueError, AttributeError) as e:
@@ -24,6 +53,8 @@ async def build_db_api() -> bool:
 @router.post("/seed_db", include_in_schema=False)
 async def seed_db_api() -> bool:
     try:
+        from builder import seed_db
+
         seed_db()
         return True
     except (ValueError, AttributeError) as e:
@@ -32,3 +63,56 @@ async def seed_db_api() -> bool:
     except Exception as e:
         logger.exception(e)
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/archive_db", include_in_schema=False)
+async def archive_db_api() -> Dict[str, int]:
+    try:
+        from builder import archive_db
+
+        return await run_in_db_thread(archive_db)
+    except (ValueError, AttributeError) as e:
+        logger.exception(e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception(e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/refresh_catalog", include_in_schema=False)
+async def refresh_catalog_api() -> int:
+    try:
+        from builder import refresh_catalog
+
+        return await run_in_db_thread(refresh_catalog)
+    except (ValueError, AttributeError) as e:
+        logger.exception(e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception(e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/import_products")
+async def import_products(
+    request: Request,
+    command: ProductServiceCommand = Depends(get_product_service_command),
+) -> ProdutoImportReport:
+    """
+    Bulk catalog import from a streamed CSV (with a header row) or NDJSON body,
+    with the columns name, value, currency_id, category_id and allow_components.
+    Rows are validated and inserted in batches, the invalid ones are reported.
+    """
+    try:
+        media_type = request.headers.get("content-type", "").split(";")[0].strip()
+        batches = iter_product_batches(request.stream(), media_type, IMPORT_BATCH_SIZE)
+        catalog_import = await run_in_db_thread(command.start_import)
+        async for batch in batches:
+            await run_in_db_thread(catalog_import.add_batch, batch)
+        return catalog_import.finish()
+    except (ValueError, AttributeError) as e:
+        logger.exception(e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception(e)
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,15 +1,24 @@
 from typing import List, Optional, Union
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
 from loguru import logger
-from src.adapters.driven.infra.ports.orm_categoria_query import OrmCategoriaQuery
-from src.adapters.driven.infra.ports.orm_currency_query import OrmCurrencyQuery
-from src.adapters.driven.infra.ports.orm_produto_query import OrmProductQuery
-from src.adapters.driven.infra.repositories.orm_produto_repository import (
-    OrmProdutoRepository,
+from src.adapters.driver.API.dependencies.produto_dependencies import (
+    get_product_service_command,
+    get_produto_service_query,
+    get_rendered_responses,
 )
+from src.adapters.driver.API.rendered_response_cache import RenderedResponseCache
+from src.adapters.driver.API.responses import rendered_response
 from src.adapters.driver.API.schemas.add_purchase_schema import AddPurchaseSchema
 from src.adapters.driver.API.schemas.create_product_schema import CreateProductSchema
+from src.adapters.driver.API.schemas.bulk_product_schema import (
+    BulkProductSchema,
+    BulkRepriceSchema,
+)
 from src.adapters.driver.API.schemas.update_product_schema import UpdateProductSchema
+from src.core.application.services.produto_bulk_transition import (
+    BulkTransitionReport,
+)
 from src.core.application.services.produto_service_command import ProductServiceCommand
 from src.core.application.services.produto_service_query import (
     ProdutoServiceQuery,
@@ -24,6 +33,12 @@ from src.core.domain.entities.currency_entity import (
 )
 from src.core.domain.entities.produto_entity import PartialProdutoEntity, ProdutoEntity
 from src.core.domain.value_objects.preco_value_object import PrecoValueObject
+from src.core.domain.value_objects.produto_orders_page_value_object import (
+    ProdutoOrdersPageValueObject,
+)
+from src.core.helpers.exceptions.concurrency_conflict_error import (
+    ConcurrencyConflictError,
+)
 from src.core.helpers.functions.structure_value_range import structure_value_range
 from src.core.helpers.options.produto_find_options import ProdutoFindOptions
 
@@ -34,12 +49,15 @@ router = APIRouter(
 
 
 @router.get("/categories")
-async def list_categories() -> Union[List[CategoriaEntity], None]:
+async def list_categories(
+    request: Request,
+    query: ProdutoServiceQuery = Depends(get_produto_service_query),
+    rendered: RenderedResponseCache = Depends(get_rendered_responses),
+) -> Union[List[CategoriaEntity], None]:
     try:
-        query = ProdutoServiceQuery(
-            OrmProductQuery(), OrmCategoriaQuery(), OrmCurrencyQuery()
+        return rendered_response(
+            request, rendered.get_or_render("categories", query.list_categories)
         )
-        return query.list_categories()
     except (ValueError, AttributeError) as e:
         logger.exception(e)
         raise HTTPException(status_code=400, detail=str(e))
@@ -50,22 +68,26 @@ async def list_categories() -> Union[List[CategoriaEntity], None]:
 
 @router.get("/index")
 async def list_itens(
+    request: Request,
     name: Optional[str] = None,
     category: Optional[str] = None,
     min_price: Optional[float] = None,
     max_price: Optional[float] = None,
+    query: ProdutoServiceQuery = Depends(get_produto_service_query),
+    rendered: RenderedResponseCache = Depends(get_rendered_responses),
 ) -> Union[List[ProdutoAggregate], None]:
     try:
-        query = ProdutoServiceQuery(
-            OrmProductQuery(), OrmCategoriaQuery(), OrmCurrencyQuery()
-        )
         query_options = None
         if any([name, category, min_price, max_price]):
             price_range = structure_value_range(min_price, max_price)
             query_options = ProdutoFindOptions(
                 name=name, category=category, price_range=price_range
             )
-        return query.index(query_options)
+        key = f"index:{query_options.cache_key() if query_options else ''}"
+        return rendered_response(
+            request,
+            rendered.get_or_store(key, lambda: query.rendered_catalog(query_options)),
+        )
     except (ValueError, AttributeError) as e:
         logger.exception(e)
         raise HTTPException(status_code=400, detail=str(e))
@@ -75,13 +97,34 @@ async def list_itens(
 
 
 @router.get("/{item_id}")
-async def get_item(item_id: int) -> Union[ProdutoAggregate, None]:
+async def get_item(
+    request: Request,
+    item_id: int,
+    query: ProdutoServiceQuery = Depends(get_produto_service_query),
+    rendered: RenderedResponseCache = Depends(get_rendered_responses),
+) -> Union[ProdutoAggregate, None]:
     try:
-        query = ProdutoServiceQuery(
-            OrmProductQuery(), OrmCategoriaQuery(), OrmCurrencyQuery()
+        return rendered_response(
+            request,
+            rendered.get_or_render(f"item:{item_id}", lambda: query.get(item_id)),
         )
-        result = query.get(item_id)
-        return result
+    except (ValueError, AttributeError) as e:
+        logger.exception(e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception(e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{item_id}/orders")
+async def list_item_orders(
+    item_id: int,
+    after: Optional[int] = None,
+    limit: int = Query(default=100, ge=1, le=1000),
+    query: ProdutoServiceQuery = Depends(get_produto_service_query),
+) -> ProdutoOrdersPageValueObject:
+    try:
+        return query.orders(item_id, after, limit)
     except (ValueError, AttributeError) as e:
         logger.exception(e)
         raise HTTPException(status_code=400, detail=str(e))
@@ -91,14 +134,11 @@ async def get_item(item_id: int) -> Union[ProdutoAggregate, None]:
 
 
 @router.post("/", status_code=201)
-async def create_item(produto: CreateProductSchema) -> ProdutoAggregate:
+async def create_item(
+    produto: CreateProductSchema,
+    command: ProductServiceCommand = Depends(get_product_service_command),
+) -> ProdutoAggregate:
     try:
-        command = ProductServiceCommand(
-            OrmProdutoRepository(),
-            OrmProductQuery(),
-            OrmCategoriaQuery(),
-            OrmCurrencyQuery(),
-        )
         product = PartialProdutoEntity(
             name=produto.name,
             allow_components=produto.allow_components,
@@ -119,14 +159,11 @@ async def create_item(produto: CreateProductSchema) -> ProdutoAggregate:
 
 
 @router.put("/")
-async def update_item(produto: UpdateProductSchema) -> ProdutoAggregate:
+async def update_item(
+    produto: UpdateProductSchema,
+    command: ProductServiceCommand = Depends(get_product_service_command),
+) -> ProdutoAggregate:
     try:
-        command = ProductServiceCommand(
-            OrmProdutoRepository(),
-            OrmProductQuery(),
-            OrmCategoriaQuery(),
-            OrmCurrencyQuery(),
-        )
         product = PartialProdutoEntity(
             id=produto.id,
             name=produto.name,
@@ -140,8 +177,15 @@ async def update_item(produto: UpdateProductSchema) -> ProdutoAggregate:
                 PartialProdutoEntity(id=component_id)
                 for component_id in produto.component_ids
             ],
+            version=produto.version,
         )
         return command.update_product(product)
+    except ConcurrencyConflictError as e:
+        logger.warning(e)
+        raise HTTPException(
+            status_code=409,
+            detail={"message": str(e), "current": jsonable_encoder(e.current)},
+        )
     except (ValueError, AttributeError) as e:
         logger.exception(e)
         raise HTTPException(status_code=400, detail=str(e))
@@ -151,14 +195,11 @@ async def update_item(produto: UpdateProductSchema) -> ProdutoAggregate:
 
 
 @router.delete("/{item_id}")
-async def delete_item(item_id: int):
+async def delete_item(
+    item_id: int,
+    command: ProductServiceCommand = Depends(get_product_service_command),
+):
     try:
-        command = ProductServiceCommand(
-            OrmProdutoRepository(),
-            OrmProductQuery(),
-            OrmCategoriaQuery(),
-            OrmCurrencyQuery(),
-        )
         command.delete_product(item_id)
     except (ValueError, AttributeError) as e:
         logger.exception(e)
@@ -168,56 +209,102 @@ async def delete_item(item_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.patch("/bulk/activate")
+async def activate_items(
+    options: BulkProductSchema,
+    command: ProductServiceCommand = Depends(get_product_service_command),
+) -> BulkTransitionReport:
+    try:
+        return command.activate_products(options.to_options())
+    except (ValueError, AttributeError) as e:
+        logger.exception(e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception(e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.patch("/bulk/deactivate")
+async def deactivate_items(
+    options: BulkProductSchema,
+    command: ProductServiceCommand = Depends(get_product_service_command),
+) -> BulkTransitionReport:
+    try:
+        return command.deactivate_products(options.to_options())
+    except (ValueError, AttributeError) as e:
+        logger.exception(e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception(e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.patch("/bulk/reprice")
+async def reprice_items(
+    options: BulkRepriceSchema,
+    command: ProductServiceCommand = Depends(get_product_service_command),
+) -> BulkTransitionReport:
+    try:
+        return command.reprice_products(
+            options.to_options(), options.value, options.percentage
+        )
+    except (ValueError, AttributeError) as e:
+        logger.exception(e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception(e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.patch("/activate/{item_id}")
-async def activate_item(item_id: int) -> ProdutoAggregate:
-    command = ProductServiceCommand(
-        OrmProdutoRepository(),
-        OrmProductQuery(),
-        OrmCategoriaQuery(),
-        OrmCurrencyQuery(),
-    )
-    return command.activate_product(item_id)
+async def activate_item(
+    item_id: int,
+    command: ProductServiceCommand = Depends(get_product_service_command),
+) -> ProdutoAggregate:
+    try:
+        return command.activate_product(item_id)
+    except (ValueError, AttributeError) as e:
+        logger.exception(e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception(e)
+        raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.patch("/deactivate/{item_id}")
-async def deactivate_item(item_id: int) -> ProdutoAggregate:
-    command = ProductServiceCommand(
-        OrmProdutoRepository(),
-        OrmProductQuery(),
-        OrmCategoriaQuery(),
-        OrmCurrencyQuery(),
-    )
-    return command.deactivate_product(item_id)
+async def deactivate_item(
+    item_id: int,
+    command: ProductServiceCommand = Depends(get_product_service_command),
+) -> ProdutoAggregate:
+    try:
+        return command.deactivate_product(item_id)
+    except (ValueError, AttributeError) as e:
+        logger.exception(e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception(e)
+        raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.patch("/purchase/{purchase_id}", include_in_schema=False)
-async def get_all_by_purchase(purchase_id: int) -> ProdutoAggregate:
-    command = ProductServiceCommand(
-        OrmProdutoRepository(),
-        OrmProductQuery(),
-        OrmCategoriaQuery(),
-        OrmCurrencyQuery(),
-    )
+async def get_all_by_purchase(
+    purchase_id: int,
+    command: ProductServiceCommand = Depends(get_product_service_command),
+) -> ProdutoAggregate:
     return command.get_all_by_purchase(purchase_id)
 
 
 @router.patch("/add_purchase/", include_in_schema=False)
-async def add_purchase(options: AddPurchaseSchema) -> ProdutoAggregate:
-    command = ProductServiceCommand(
-        OrmProdutoRepository(),
-        OrmProductQuery(),
-        OrmCategoriaQuery(),
-        OrmCurrencyQuery(),
-    )
+async def add_purchase(
+    options: AddPurchaseSchema,
+    command: ProductServiceCommand = Depends(get_product_service_command),
+) -> ProdutoAggregate:
     return command.add_purchase(options.purchase_id, options.products)
 
 
 @router.get("/get_entity/{produto_id}", include_in_schema=False)
-async def get_entity(produto_id: int) -> ProdutoEntity:
-    command = ProductServiceCommand(
-        OrmProdutoRepository(),
-        OrmProductQuery(),
-        OrmCategoriaQuery(),
-        OrmCurrencyQuery(),
-    )
+async def get_entity(
+    produto_id: int,
+    command: ProductServiceCommand = Depends(get_product_service_command),
+) -> ProdutoEntity:
     return command.get_entity(produto_id)
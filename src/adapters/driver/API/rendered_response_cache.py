@@ -0,0 +1,51 @@
+import gzip
+import hashlib
+from typing import Any, Callable, NamedTuple
+
+from pydantic_core import to_json
+
+from src.core.helpers.interfaces.chace_service import CacheService
+
+
+class RenderedBody(NamedTuple):
+    body: bytes
+    gzipped: bytes
+    etag: str
+
+
+def rendered_body(body: bytes) -> RenderedBody:
+    return RenderedBody(
+        body=body,
+        gzipped=gzip.compress(body, mtime=0),
+        etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+    )
+
+
+class RenderedResponseCache:
+    """
+    Keeps response bodies already rendered to JSON, plain and gzipped, with
+    their ETag, so a hit is served without rebuilding, serializing or
+    compressing the models again.
+    """
+
+    def __init__(self, cache: CacheService, ttl: int, max_entries: int = 1000):
+        self.cache = cache
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    def get_or_render(self, key: str, produce: Callable[[], Any]) -> RenderedBody:
+        return self.get_or_store(key, lambda: to_json(produce()))
+
+    def get_or_store(self, key: str, produce: Callable[[], bytes]) -> RenderedBody:
+        """As get_or_render, for a body produce already rendered to JSON."""
+        rendered = self.cache.get(key)
+        if rendered is None:
+            rendered = rendered_body(produce())
+            # Filtered searches can make up any number of keys
+            if self.cache.stats()["size"] >= self.max_entries:
+                self.cache.clear()
+            self.cache.set(key, rendered, self.ttl)
+        return rendered
+
+    def clear(self):
+        self.cache.clear()
@@ -0,0 +1,37 @@
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from pydantic_core import to_json
+
+from src.adapters.driver.API.rendered_response_cache import RenderedBody
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Default response class, serializing with pydantic-core. FastAPI still
+    validates the returned values and runs jsonable_encoder on them, only the
+    final json.dumps is replaced. The hot reads skip all of it by returning
+    the already rendered bodies (rendered_response).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+class RenderedJSONResponse(Response):
+    """Body already rendered to JSON bytes, sent as is."""
+
+    media_type = "application/json"
+
+
+def rendered_response(request: Request, rendered: RenderedBody) -> Response:
+    """Answers 304 to a matching If-None-Match, else the body the client can decode."""
+    headers = {"ETag": rendered.etag, "Vary": "Accept-Encoding"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if rendered.etag in if_none_match or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return RenderedJSONResponse(rendered.gzipped, headers=headers)
+    return RenderedJSONResponse(rendered.body, headers=headers)
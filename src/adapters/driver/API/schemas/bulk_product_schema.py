@@ -0,0 +1,26 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+from src.core.helpers.functions.structure_value_range import structure_value_range
+from src.core.helpers.options.produto_bulk_options import ProdutoBulkOptions
+
+
+class BulkProductSchema(BaseModel):
+    ids: Optional[List[int]] = None
+    name: Optional[str] = None
+    category: Optional[str] = None
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+
+    def to_options(self) -> ProdutoBulkOptions:
+        return ProdutoBulkOptions(
+            ids=self.ids,
+            name=self.name,
+            category=self.category,
+            price_range=structure_value_range(self.min_price, self.max_price),
+        )
+
+
+class BulkRepriceSchema(BulkProductSchema):
+    value: Optional[float] = None
+    percentage: Optional[float] = None
@@ -0,0 +1,5 @@
+from src.adapters.driver.API.schemas.create_product_schema import CreateProductSchema
+
+
+class ImportProductSchema(CreateProductSchema):
+    allow_components: bool = False
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -9,3 +11,4 @@ class UpdateProductSchema(BaseModel):
     value: float
     category_id: int
     component_ids: list[int]
+    version: Optional[int] = None
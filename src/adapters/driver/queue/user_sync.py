@@ -3,6 +3,8 @@ import time
 import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 
+from src.core.helpers.services.background_threads import background_threads
+
 
 class UserSync:
     def __init__(self, queue_url, db_handler, interval=10):
@@ -48,6 +50,7 @@ class UserSync:
         """
         self.thread = threading.Thread(target=self._process_messages, daemon=True)
         self.thread.start()
+        background_threads.register("user_sync", self.thread, long_running=True)
 
     def stop(self):
         """
@@ -55,3 +58,4 @@ class UserSync:
         """
         self.stop_event.set()
         self.thread.join()
+        background_threads.unregister("user_sync")
@@ -1,13 +1,18 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 from src.core.application.ports.categoria_query import CategoriaQuery
+from src.core.application.services.produto_bulk_transition import (
+    BulkTransitionReport,
+)
 from src.core.application.ports.currency_query import CurrencyQuery
 from src.core.application.ports.produto_query import ProdutoQuery
 from src.core.domain.aggregates.produto_aggregate import ProdutoAggregate
+from src.core.domain.base.unit_of_work import UnitOfWork
 from src.core.domain.entities.produto_entity import PartialProdutoEntity, ProdutoEntity
 from src.core.domain.repositories.produto_repository import ProdutoRepository
 from src.core.helpers.options.add_purchase_options import AddPurchaseOptions
+from src.core.helpers.options.produto_bulk_options import ProdutoBulkOptions
 
 
 class IProductCommand(ABC):
@@ -18,7 +23,9 @@ class IProductCommand(ABC):
         product_query: ProdutoQuery,
         category_query: CategoriaQuery,
         currency_query: CurrencyQuery,
+        unit_of_work: Optional[UnitOfWork] = None,
     ):
+        self.unit_of_work = unit_of_work or UnitOfWork()
         self.product_repository = product_repository
         self.product_query = product_query
         self.currency_query = currency_query
@@ -28,6 +35,10 @@ class IProductCommand(ABC):
     def create_product(self, produto: PartialProdutoEntity) -> ProdutoAggregate:
         raise NotImplementedError()
 
+    @abstractmethod
+    def create_products(self, produtos: List[PartialProdutoEntity]) -> List[int]:
+        raise NotImplementedError()
+
     @abstractmethod
     def activate_product(self, product_id: int) -> ProdutoAggregate:
         raise NotImplementedError()
@@ -36,6 +47,27 @@ class IProductCommand(ABC):
     def deactivate_product(self, product_id: int) -> ProdutoAggregate:
         raise NotImplementedError()
 
+    @abstractmethod
+    def activate_products(
+        self, query_options: ProdutoBulkOptions
+    ) -> BulkTransitionReport:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def deactivate_products(
+        self, query_options: ProdutoBulkOptions
+    ) -> BulkTransitionReport:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def reprice_products(
+        self,
+        query_options: ProdutoBulkOptions,
+        value: Optional[float] = None,
+        percentage: Optional[float] = None,
+    ) -> BulkTransitionReport:
+        raise NotImplementedError()
+
     @abstractmethod
     def delete_product(self, product_id: int):
         raise NotImplementedError()
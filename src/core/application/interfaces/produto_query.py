@@ -6,6 +6,10 @@ from src.core.application.ports.categoria_query import CategoriaQuery
 from src.core.application.ports.currency_query import CurrencyQuery
 from src.core.domain.aggregates.produto_aggregate import ProdutoAggregate
 from src.core.domain.entities.categoria_entity import CategoriaEntity
+from src.core.domain.read_models.produto_catalog import ProdutoCatalog
+from src.core.domain.value_objects.produto_orders_page_value_object import (
+    ProdutoOrdersPageValueObject,
+)
 from src.core.helpers.options.produto_find_options import ProdutoFindOptions
 
 
@@ -30,6 +34,20 @@ class IProdutoQuery(ABC):
     ) -> List[ProdutoAggregate]:
         raise NotImplementedError()
 
+    @abstractmethod
+    def catalog(self, options: Optional[ProdutoFindOptions] = None) -> ProdutoCatalog:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def rendered_catalog(self, options: Optional[ProdutoFindOptions] = None) -> bytes:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def orders(
+        self, product_id: int, after: Optional[int] = None, limit: int = 100
+    ) -> ProdutoOrdersPageValueObject:
+        raise NotImplementedError()
+
     @abstractmethod
     def list_categories(self) -> List[CategoriaEntity]:
         raise NotImplementedError()
@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List, Optional, Set
 
 from src.core.domain.aggregates.produto_aggregate import ProdutoAggregate
 from src.core.domain.entities.produto_entity import ProdutoEntity
+from src.core.domain.read_models.produto_catalog import ProdutoCatalog
+from src.core.domain.value_objects.produto_state_value_object import (
+    ProdutoStateValueObject,
+)
+from src.core.helpers.options.produto_bulk_options import ProdutoBulkOptions
 from src.core.helpers.options.produto_find_options import ProdutoFindOptions
 
 
@@ -23,10 +28,50 @@ class ProdutoQuery(ABC):
     def find(self, query_options: ProdutoFindOptions) -> List[ProdutoAggregate]:
         raise NotImplementedError()
 
+    @abstractmethod
+    def get_catalog(
+        self, query_options: Optional[ProdutoFindOptions] = None
+    ) -> ProdutoCatalog:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def render_catalog(
+        self, query_options: Optional[ProdutoFindOptions] = None
+    ) -> bytes:
+        raise NotImplementedError()
+
     @abstractmethod
     def get_all_ids(self, items: List[int]) -> List[ProdutoAggregate]:
         raise NotImplementedError()
 
+    @abstractmethod
+    def count_orders(self, product_ids: List[int]) -> Dict[int, int]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_order_ids(
+        self, product_id: int, after: Optional[int] = None, limit: int = 100
+    ) -> List[int]:
+        raise NotImplementedError()
+
     @abstractmethod
     def get_by_purchase_id(self, purchase_id: int) -> List[ProdutoAggregate]:
         raise NotImplementedError()
+
+    @abstractmethod
+    def get_all_names(self) -> Set[str]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def find_states(
+        self, query_options: ProdutoBulkOptions
+    ) -> List[ProdutoStateValueObject]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def exists_by_name(self, name: str, exclude_id: Optional[int] = None) -> bool:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def has_orders(self, product_id: int) -> bool:
+        raise NotImplementedError()
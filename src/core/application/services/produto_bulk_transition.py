@@ -0,0 +1,68 @@
+from typing import Callable, Iterable, List, Optional
+
+from pydantic import BaseModel
+
+from src.core.domain.value_objects.produto_state_value_object import (
+    ProdutoStateValueObject,
+)
+
+RejectionRule = Callable[[ProdutoStateValueObject], Optional[str]]
+
+
+class BulkRejection(BaseModel):
+    id: int
+    reason: str
+
+
+class BulkTransitionReport(BaseModel):
+    changed: List[int] = []
+    rejected: List[BulkRejection] = []
+
+
+def activation_rejection(state: ProdutoStateValueObject) -> Optional[str]:
+    if state.is_active:
+        return "Produto já está ativo"
+    if not state.has_category:
+        return "Produto não possui categoria"
+    if not state.has_price:
+        return "Produto não possui preço"
+    return None
+
+
+def deactivation_rejection(state: ProdutoStateValueObject) -> Optional[str]:
+    if not state.is_active:
+        return "Produto já está inativo"
+    return None
+
+
+def reprice_rejection(state: ProdutoStateValueObject) -> Optional[str]:
+    if not state.has_price:
+        return "Produto não possui preço"
+    if not state.has_currency:
+        return "Produto não possui moeda"
+    return None
+
+
+def build_report(
+    changed: List[int],
+    states: Iterable[ProdutoStateValueObject],
+    rule: RejectionRule,
+    requested_ids: Optional[List[int]] = None,
+) -> BulkTransitionReport:
+    """Explains, with the rule the UPDATE applied, why the other targeted products were left untouched."""
+    changed_ids = set(changed)
+    rejected = {
+        state.id: rule(state) or "Produto não alterado"
+        for state in states
+        if state.id not in changed_ids
+    }
+    for product_id in requested_ids or []:
+        if product_id not in changed_ids and product_id not in rejected:
+            rejected[product_id] = "Produto não encontrado"
+    return BulkTransitionReport(
+        changed=sorted(changed_ids),
+        rejected=[
+            BulkRejection(id=product_id, reason=reason)
+            for product_id, reason in sorted(rejected.items())
+        ],
+    )
@@ -0,0 +1,103 @@
+from time import perf_counter
+from typing import List, Tuple, Union
+
+from loguru import logger
+from pydantic import BaseModel
+
+from src.core.application.interfaces.produto_command import IProductCommand
+from src.core.domain.entities.produto_entity import PartialProdutoEntity
+
+
+class ImportRowError(BaseModel):
+    row: int
+    error: str
+
+
+class ProdutoImportReport(BaseModel):
+    received: int = 0
+    created: int = 0
+    failed: int = 0
+    errors: List[ImportRowError] = []
+    elapsed_ms: float = 0
+    rows_per_second: float = 0
+
+
+def normalize_name(name: str) -> str:
+    return " ".join(name.split()).casefold()
+
+
+class ProdutoImport:
+    """
+    Bulk import of a catalog.
+
+    Product names and reference data are loaded once, each batch is checked
+    against them in memory and its valid rows inserted with one statement.
+    """
+
+    def __init__(self, command: IProductCommand):
+        self.command = command
+        self.names = {
+            normalize_name(name) for name in command.product_query.get_all_names()
+        }
+        self.categories = {
+            category.id: category for category in command.category_query.get_all()
+        }
+        self.currencies = {
+            currency.id: currency for currency in command.currency_query.get_all()
+        }
+        self.report = ProdutoImportReport()
+        self._started = perf_counter()
+
+    def add_batch(self, rows: List[Tuple[int, Union[PartialProdutoEntity, str]]]):
+        """Rows are (row number, product), or (row number, error) when it could not be parsed."""
+        accepted: List[Tuple[int, PartialProdutoEntity]] = []
+        for row, produto in rows:
+            self.report.received += 1
+            error = produto if isinstance(produto, str) else self.validate(produto)
+            if error:
+                self._fail(row, error)
+                continue
+            self.names.add(normalize_name(produto.name))
+            accepted.append((row, produto))
+        if not accepted:
+            return
+        try:
+            self.command.create_products([produto for _, produto in accepted])
+            self.report.created += len(accepted)
+        except Exception as e:
+            logger.exception(e)
+            for row, produto in accepted:
+                self.names.discard(normalize_name(produto.name))
+                self._fail(row, f"Falha ao inserir o lote: {e}")
+
+    def validate(self, produto: PartialProdutoEntity) -> Union[str, None]:
+        if normalize_name(produto.name) in self.names:
+            return "Já existe um produto com esse nome"
+        if produto.price.value < 0:
+            return "Preço não pode ser negativo"
+        if produto.price.value == 0:
+            return "Preço não pode ser zero"
+        if produto.price.currency.id not in self.currencies:
+            return "Moeda não encontrada"
+        category = self.categories.get(produto.category.id)
+        if not category:
+            return "Categoria não encontrada"
+        if produto.allow_components and category.is_component:
+            return "Um Acompanhamento não permite ter outros acompanhamentos"
+        return None
+
+    def finish(self) -> ProdutoImportReport:
+        elapsed = perf_counter() - self._started
+        self.report.elapsed_ms = round(elapsed * 1000, 3)
+        self.report.rows_per_second = (
+            round(self.report.received / elapsed, 1) if elapsed else 0
+        )
+        logger.info(
+            f"Catalog import: {self.report.created} created, {self.report.failed} "
+            f"failed, {self.report.rows_per_second} rows/s"
+        )
+        return self.report
+
+    def _fail(self, row: int, error: str):
+        self.report.failed += 1
+        self.report.errors.append(ImportRowError(row=row, error=error))
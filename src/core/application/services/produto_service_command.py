@@ -1,68 +1,158 @@
-from typing import List
+from typing import List, Optional
 from src.core.application.interfaces.produto_command import IProductCommand
+from src.core.application.services.produto_bulk_transition import (
+    BulkTransitionReport,
+    RejectionRule,
+    activation_rejection,
+    build_report,
+    deactivation_rejection,
+    reprice_rejection,
+)
+from src.core.application.services.produto_import import ProdutoImport
 from src.core.domain.aggregates.produto_aggregate import ProdutoAggregate
+from src.core.domain.base.unit_of_work import transactional
 from src.core.domain.entities.produto_entity import PartialProdutoEntity, ProdutoEntity
+from src.core.helpers.exceptions.concurrency_conflict_error import (
+    ConcurrencyConflictError,
+)
 from src.core.helpers.exceptions.incorrect_product_error import IncorrectProductError
 from src.core.helpers.exceptions.item_not_found_error import ItemNotFoundError
 from src.core.helpers.options.add_purchase_options import AddPurchaseOptions
-from src.core.helpers.options.produto_find_options import ProdutoFindOptions
+from src.core.helpers.options.produto_bulk_options import ProdutoBulkOptions
 
 
 class ProductServiceCommand(IProductCommand):
 
+    @transactional
     def create_product(self, produto: PartialProdutoEntity) -> ProdutoAggregate:
         if not isinstance(produto, PartialProdutoEntity):
             raise TypeError("produto must be an instance of PartialProdutoEntity")
-        options = ProdutoFindOptions(
-            name=produto.name,
-        )
-        existing_products = self.product_query.find(options)
-        if existing_products:
+        if self.product_query.exists_by_name(produto.name):
             raise ValueError("Já existe um produto com esse nome")
+        if produto.category:
+            category = self.category_query.get(produto.category.id)
+            if not category:
+                raise ValueError("Categoria não encontrada")
+            produto.category = category
+        if produto.price:
+            currency = self.currency_query.get(produto.price.currency.id)
+            if not currency:
+                raise ValueError("Moeda não encontrada")
+            produto.price.currency = currency
         produto.is_active = False
+        produto.components = []
         return self.product_repository.create(produto)
 
+    @transactional
+    def create_products(self, produtos: List[PartialProdutoEntity]) -> List[int]:
+        """Inserts products already validated by a ProdutoImport."""
+        for produto in produtos:
+            produto.is_active = False
+        return self.product_repository.bulk_create(produtos)
+
+    def start_import(self) -> ProdutoImport:
+        return ProdutoImport(self)
+
+    @transactional
     def activate_product(self, product_id: int) -> ProdutoAggregate:
-        product = self.product_query.get(product_id)
-        if not product:
-            raise ValueError("Produto não encontrado")
-        product = product.product
-        if not product:
-            raise ValueError("Produto não encontrado")
-        if product.is_active:
-            raise ValueError("Produto já está ativo")
-        if product.category is None:
-            raise ValueError("Produto não possui categoria")
-        if product.price is None:
-            raise ValueError("Produto não possui preço")
-        product.is_active = True
-        return self.product_repository.update(product)
-
-    def deactivate_product(self, product_id: int) -> ProdutoEntity:
-        product = self.product_query.get(product_id)
-        if not product:
-            raise ValueError("Produto não encontrado")
-        product = product.product
-        if product.is_active is False:
-            raise ValueError("Produto já está inativo")
-        product.is_active = False
-        return self.product_repository.update(product)
+        return self._set_active(product_id, True, activation_rejection)
+
+    @transactional
+    def deactivate_product(self, product_id: int) -> ProdutoAggregate:
+        return self._set_active(product_id, False, deactivation_rejection)
+
+    def _set_active(
+        self, product_id: int, is_active: bool, rule: RejectionRule
+    ) -> ProdutoAggregate:
+        """Guarded UPDATE, the product state is only read to explain a rejection."""
+        options = ProdutoBulkOptions(ids=[product_id])
+        if not self.product_repository.set_active_in_bulk(options, is_active):
+            states = self.product_query.find_states(options)
+            if not states:
+                raise ValueError("Produto não encontrado")
+            raise ValueError(rule(states[0]) or "Produto não alterado")
+        return self.product_query.get(product_id)
+
+    @transactional
+    def activate_products(
+        self, query_options: ProdutoBulkOptions
+    ) -> BulkTransitionReport:
+        self._check_bulk_options(query_options)
+        changed = self.product_repository.set_active_in_bulk(query_options, True)
+        return self._bulk_report(query_options, changed, activation_rejection)
+
+    @transactional
+    def deactivate_products(
+        self, query_options: ProdutoBulkOptions
+    ) -> BulkTransitionReport:
+        self._check_bulk_options(query_options)
+        changed = self.product_repository.set_active_in_bulk(query_options, False)
+        return self._bulk_report(query_options, changed, deactivation_rejection)
 
+    @transactional
+    def reprice_products(
+        self,
+        query_options: ProdutoBulkOptions,
+        value: Optional[float] = None,
+        percentage: Optional[float] = None,
+    ) -> BulkTransitionReport:
+        self._check_bulk_options(query_options)
+        if (value is None) == (percentage is None):
+            raise ValueError("Informe o novo preço ou o percentual de reajuste")
+        if value is not None and value <= 0:
+            raise ValueError("Preço deve ser maior que zero")
+        if percentage is not None and percentage <= -100:
+            raise ValueError("Reajuste deve ser maior que -100%")
+        changed = self.product_repository.reprice_in_bulk(
+            query_options, value, percentage
+        )
+        return self._bulk_report(query_options, changed, reprice_rejection)
+
+    def _check_bulk_options(self, query_options: ProdutoBulkOptions):
+        if query_options.is_empty():
+            raise ValueError("Informe os ids ou um filtro dos produtos")
+
+    def _bulk_report(
+        self,
+        query_options: ProdutoBulkOptions,
+        changed: List[int],
+        rule: RejectionRule,
+    ) -> BulkTransitionReport:
+        if query_options.ids and set(changed) == set(query_options.ids):
+            return build_report(changed, [], rule)
+        states = self.product_query.find_states(query_options)
+        return build_report(changed, states, rule, query_options.ids)
+
+    @transactional
     def delete_product(self, product_id: int):
-        product_aggregate = self.product_repository.get_by_product_id(product_id)
-        if not product_aggregate:
+        states = self.product_query.find_states(ProdutoBulkOptions(ids=[product_id]))
+        if not states:
             raise ValueError("Produto não encontrado")
-        if product_aggregate.product.is_active:
+        if states[0].is_active:
             raise ValueError("Produto ativo, impossível deletar!")
-        if product_aggregate.orders:
+        if self.product_query.has_orders(product_id):
             raise ValueError("Produto possui pedidos associados, impossível deletar!")
         self.product_repository.delete(product_id)
 
+    @transactional
     def update_product(self, produto: ProdutoEntity) -> ProdutoEntity:
-        current_product = self.product_query.get(produto.id)
-        if not current_product:
+        component_ids = [comp.id for comp in produto.components or []]
+        loaded = {
+            aggregate.product.id: aggregate
+            for aggregate in self.product_query.get_all_ids(
+                list({produto.id, *component_ids})
+            )
+        }
+        current_aggregate = loaded.get(produto.id)
+        if not current_aggregate:
             raise ValueError("Produto não encontrado")
-        current_product = current_product.product
+        current_product = current_aggregate.product
+        if produto.version is None:
+            produto.version = current_product.version
+        elif produto.version != current_product.version:
+            raise ConcurrencyConflictError(
+                "Produto alterado por outra requisição", current=current_aggregate
+            )
         produto.is_active = current_product.is_active
         if produto.price.value < 0:
             raise ValueError("Preço não pode ser negativo")
@@ -70,14 +160,26 @@ class ProductServiceCommand(IProductCommand):
             raise ValueError("Preço não pode ser zero")
 
         if current_product.name != produto.name:
-            if self.product_query.find(
-                query_options=ProdutoFindOptions(name=produto.name)
-            ):
+            if self.product_query.exists_by_name(produto.name, exclude_id=produto.id):
                 raise ValueError("Já existe um produto com esse nome")
 
-        if current_product.category != produto.category:
-            if not self.category_query.get(current_product.category.id):
+        if produto.category and (
+            not current_product.category
+            or produto.category.id != current_product.category.id
+        ):
+            category = self.category_query.get(produto.category.id)
+            if not category:
                 raise ValueError("Categoria não encontrada")
+            produto.category = category
+        if produto.price.currency and (
+            not current_product.price
+            or produto.price.currency.id != current_product.price.currency.id
+        ):
+            currency = self.currency_query.get(produto.price.currency.id)
+            if not currency:
+                raise ValueError("Moeda não encontrada")
+            produto.price.currency = currency
+        self._reuse_loaded_references(produto, current_product)
         if produto.allow_components and produto.category.is_component:
             raise ValueError("Um Acompanhamento não permite ter outros acompanhamentos")
         if not produto.allow_components and produto.components:
@@ -101,20 +203,39 @@ class ProductServiceCommand(IProductCommand):
             )
             if produto.id in new_component_ids:
                 raise ValueError("Um produto não pode ser componente de si mesmo")
+            known_components = {
+                comp.id: comp for comp in current_product.components or []
+            }
             for new_component_id in new_component_ids:
-                component = self.product_query.get_only_entity(new_component_id)
-                if not component:
+                if new_component_id not in loaded:
                     raise ValueError("Acompanhamento não encontrado")
+                component = loaded[new_component_id].product
                 if not component.category.is_component:
                     raise ValueError(
                         "Apenas produtos do tipo 'Acompanhamento' podem ser acompanhamentos"
                     )
-        return self.product_repository.update(produto)
+                known_components[new_component_id] = component
+            produto.components = [
+                known_components.get(comp.id, comp) for comp in produto.components
+            ]
+        updated = self.product_repository.update(produto)
+        return updated.model_copy(update={"order_count": current_aggregate.order_count})
+
+    @staticmethod
+    def _reuse_loaded_references(produto: ProdutoEntity, current: ProdutoEntity):
+        """The repository builds its result from these, so unchanged references keep their details."""
+        if produto.category and current.category:
+            if produto.category.id == current.category.id:
+                produto.category = current.category
+        if produto.price and current.price:
+            if produto.price.currency.id == current.price.currency.id:
+                produto.price.currency = current.price.currency
 
     def get_all_by_purchase(self, purchase_id: int) -> List[ProdutoAggregate]:
         products = self.product_query.get_by_purchase_id(purchase_id)
         return products or []
 
+    @transactional
     def add_purchase(
         self, purchase_id: int, products: List[AddPurchaseOptions]
     ) -> List[ProdutoAggregate]:
@@ -144,10 +265,12 @@ class ProductServiceCommand(IProductCommand):
                 f"Um ou mais produtos não encontrados, missing IDs: {', '.join(str(i) for i in missing_product_ids)}"
             )
 
+        existing_by_id = {
+            existing_product.product.id: existing_product
+            for existing_product in existing_products
+        }
         for product in products:
-            product_aggr = [
-                p for p in existing_products if product.product_id == p.product.id
-            ][0]
+            product_aggr = existing_by_id[product.product_id]
             if product.components and not product_aggr.product.allow_components:
                 raise IncorrectProductError(
                     "Acompanhamento selecionado, mas produto não permite acompanhamentos"
@@ -164,20 +287,19 @@ class ProductServiceCommand(IProductCommand):
                     "Acompanhamento não encontrado ou não permitido para este produto"
                 )
 
-        current_purchases = self.product_query.get_by_purchase_id(purchase_id)
-
-        for current_purchase in current_purchases or []:
-            self.product_repository.delete(current_purchase.product.id)
+        self.product_repository.set_selected_products_and_components(
+            purchase_id, products
+        )
 
-        product_aggregates: List[ProdutoAggregate] = []
-        for product in products:
-            product_aggregates.append(
-                self.product_repository.set_selected_product_and_components(
-                    product.product_id, purchase_id, product.components
-                )
+        order_counts = self.product_query.count_orders(
+            list({product.product_id for product in products})
+        )
+        return [
+            existing_by_id[product.product_id].model_copy(
+                update={"order_count": order_counts.get(product.product_id, 0)}
             )
-
-        return product_aggregates
+            for product in products
+        ]
 
     def get_entity(self, produto_id: int) -> ProdutoEntity:
         product = self.product_query.get_only_entity(produto_id)
@@ -2,6 +2,10 @@ from typing import List, Optional
 from src.core.application.interfaces.produto_query import IProdutoQuery
 from src.core.domain.aggregates.produto_aggregate import ProdutoAggregate
 from src.core.domain.entities.categoria_entity import CategoriaEntity
+from src.core.domain.read_models.produto_catalog import ProdutoCatalog
+from src.core.domain.value_objects.produto_orders_page_value_object import (
+    ProdutoOrdersPageValueObject,
+)
 from src.core.helpers.options.produto_find_options import ProdutoFindOptions
 
 
@@ -20,5 +24,25 @@ class ProdutoServiceQuery(IProdutoQuery):
             return self.product_query.get_all()
         return self.product_query.find(options)
 
+    def catalog(self, options: Optional[ProdutoFindOptions] = None) -> ProdutoCatalog:
+        return self.product_query.get_catalog(options)
+
+    def rendered_catalog(self, options: Optional[ProdutoFindOptions] = None) -> bytes:
+        return self.product_query.render_catalog(options)
+
+    def orders(
+        self, product_id: int, after: Optional[int] = None, limit: int = 100
+    ) -> ProdutoOrdersPageValueObject:
+        if limit < 1:
+            raise ValueError("Limite deve ser maior que zero")
+        order_ids = self.product_query.get_order_ids(product_id, after, limit)
+        order_count = self.product_query.count_orders([product_id]).get(product_id, 0)
+        return ProdutoOrdersPageValueObject(
+            product_id=product_id,
+            order_count=order_count,
+            orders=order_ids,
+            next_after=order_ids[-1] if len(order_ids) == limit else None,
+        )
+
     def list_categories(self) -> List[CategoriaEntity]:
         return self.category_query.get_all()
@@ -0,0 +1,67 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Dict, List, Optional
+
+_pending_callbacks: ContextVar[Optional[List[Callable[[], None]]]] = ContextVar(
+    "unit_of_work_callbacks", default=None
+)
+
+
+class UnitOfWork:
+    """
+    Groups every write of a command, so they are committed or discarded together.
+
+    Commands started inside another one join the outer unit. Callbacks queued
+    with on_commit only run once the outermost unit has committed. This base
+    class has no persistence behind it, adapters override transaction.
+    """
+
+    def __init__(self):
+        self._commit_listeners: List[Callable[[str], None]] = []
+
+    @contextmanager
+    def begin(self, command: str):
+        if _pending_callbacks.get() is not None:
+            yield
+            return
+        callbacks: List[Callable[[], None]] = []
+        token = _pending_callbacks.set(callbacks)
+        try:
+            with self.transaction(command):
+                yield
+        finally:
+            _pending_callbacks.reset(token)
+        for callback in callbacks:
+            callback()
+        for listener in self._commit_listeners:
+            listener(command)
+
+    def on_commit(self, callback: Callable[[], None]):
+        callbacks = _pending_callbacks.get()
+        if callbacks is None:
+            callback()
+        else:
+            callbacks.append(callback)
+
+    def add_commit_listener(self, listener: Callable[[str], None]):
+        """Called with the command name after every outermost commit."""
+        self._commit_listeners.append(listener)
+
+    @contextmanager
+    def transaction(self, command: str):
+        yield
+
+    def stats(self) -> Dict[str, dict]:
+        return {}
+
+
+def transactional(func: Callable) -> Callable:
+    """Runs the service method inside its unit_of_work, named after the method."""
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self.unit_of_work.begin(func.__name__):
+            return func(self, *args, **kwargs)
+
+    return wrapper
@@ -13,6 +13,7 @@ class ProdutoEntity(Entity):
     components: Optional[List["ProdutoEntity"]] = None
     is_active: bool = Field(default=False)
     allow_components: bool = Field(default=False)
+    version: Optional[int] = None
 
 
 class PartialProdutoEntity(PartialEntity, ProdutoEntity):
@@ -0,0 +1,155 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from src.core.domain.aggregates.produto_aggregate import ProdutoAggregate
+from src.core.domain.entities.categoria_entity import PartialCategoriaEntity
+from src.core.domain.entities.currency_entity import PartialCurrencyEntity
+from src.core.domain.entities.produto_entity import PartialProdutoEntity
+from src.core.domain.value_objects.preco_value_object import PrecoValueObject
+from src.core.helpers.functions.construct_trusted import construct_trusted
+from src.core.helpers.functions.round_price import round_price
+
+
+@dataclass(slots=True)
+class CatalogCategory:
+    id: int
+    name: str
+    description: Optional[str]
+    is_component: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(slots=True)
+class CatalogCurrency:
+    id: int
+    symbol: str
+    name: str
+    code: str
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(slots=True)
+class CatalogProduct:
+    """Live product, its relations are ids into the catalog."""
+
+    id: int
+    name: str
+    category_id: Optional[int]
+    price: Optional[float]
+    currency_id: Optional[int]
+    is_active: bool
+    allow_components: bool
+    version: int
+    created_at: datetime
+    updated_at: datetime
+    components: Tuple[int, ...] = ()
+    order_count: int = 0
+
+
+@dataclass(slots=True)
+class ProdutoCatalog:
+    """
+    Compact read model of a product listing. Categories and currencies are
+    held once, components are ids, and the pydantic aggregates are only
+    built at the HTTP edge.
+    """
+
+    ids: List[int] = field(default_factory=list)
+    products: Dict[int, CatalogProduct] = field(default_factory=dict)
+    categories: Dict[int, CatalogCategory] = field(default_factory=dict)
+    currencies: Dict[int, CatalogCurrency] = field(default_factory=dict)
+
+    def to_aggregates(self) -> List[ProdutoAggregate]:
+        """The listed products, in order, as the ORM query maps them."""
+        categories = {
+            category_id: self._category_entity(category)
+            for category_id, category in self.categories.items()
+        }
+        currencies = {
+            currency_id: self._currency_entity(currency)
+            for currency_id, currency in self.currencies.items()
+        }
+        components: Dict[int, PartialProdutoEntity] = {}
+
+        def component_entity(product_id: int) -> PartialProdutoEntity:
+            entity = components.get(product_id)
+            if entity is None:
+                entity = components[product_id] = self._product_entity(
+                    self.products[product_id], categories, currencies, []
+                )
+            return entity
+
+        return [
+            construct_trusted(
+                ProdutoAggregate,
+                product=self._product_entity(
+                    product,
+                    categories,
+                    currencies,
+                    [component_entity(component) for component in product.components],
+                ),
+                order_count=product.order_count,
+            )
+            for product in map(self.products.__getitem__, self.ids)
+        ]
+
+    @staticmethod
+    def _category_entity(category: CatalogCategory) -> PartialCategoriaEntity:
+        return construct_trusted(
+            PartialCategoriaEntity,
+            id=category.id,
+            created_at=category.created_at,
+            updated_at=category.updated_at,
+            deleted_at=None,
+            name=category.name,
+            description=category.description,
+            is_component=category.is_component,
+        )
+
+    @staticmethod
+    def _currency_entity(currency: CatalogCurrency) -> PartialCurrencyEntity:
+        return construct_trusted(
+            PartialCurrencyEntity,
+            id=currency.id,
+            created_at=currency.created_at,
+            updated_at=currency.updated_at,
+            deleted_at=None,
+            symbol=currency.symbol,
+            name=currency.name,
+            code=currency.code,
+            is_active=currency.is_active,
+        )
+
+    @staticmethod
+    def _product_entity(
+        product: CatalogProduct,
+        categories: Dict[int, PartialCategoriaEntity],
+        currencies: Dict[int, PartialCurrencyEntity],
+        components: List[PartialProdutoEntity],
+    ) -> PartialProdutoEntity:
+        return construct_trusted(
+            PartialProdutoEntity,
+            id=product.id,
+            created_at=product.created_at,
+            updated_at=product.updated_at,
+            deleted_at=None,
+            name=product.name,
+            category=categories.get(product.category_id),
+            price=(
+                construct_trusted(
+                    PrecoValueObject,
+                    value=round_price(product.price),
+                    currency=currencies.get(product.currency_id),
+                )
+                if product.price
+                else None
+            ),
+            components=components,
+            is_active=product.is_active,
+            allow_components=product.allow_components,
+            version=product.version,
+        )
@@ -4,6 +4,8 @@ from typing import Any, List, Optional
 from src.core.domain.aggregates.produto_aggregate import ProdutoAggregate
 from src.core.domain.base.repository import Repository
 from src.core.domain.entities.produto_entity import PartialProdutoEntity, ProdutoEntity
+from src.core.helpers.options.add_purchase_options import AddPurchaseOptions
+from src.core.helpers.options.produto_bulk_options import ProdutoBulkOptions
 from src.core.helpers.options.produto_find_options import ProdutoFindOptions
 
 
@@ -13,10 +15,29 @@ class ProdutoRepository(Repository, ABC):
     def create(self, produto: PartialProdutoEntity) -> ProdutoAggregate:
         raise NotImplementedError()
 
+    @abstractmethod
+    def bulk_create(self, produtos: List[PartialProdutoEntity]) -> List[int]:
+        raise NotImplementedError()
+
     @abstractmethod
     def update(self, produto: ProdutoEntity) -> ProdutoAggregate:
         raise NotImplementedError()
 
+    @abstractmethod
+    def set_active_in_bulk(
+        self, query_options: ProdutoBulkOptions, is_active: bool
+    ) -> List[int]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def reprice_in_bulk(
+        self,
+        query_options: ProdutoBulkOptions,
+        value: Optional[float] = None,
+        percentage: Optional[float] = None,
+    ) -> List[int]:
+        raise NotImplementedError()
+
     @abstractmethod
     def delete(self, produto_id: int) -> None:
         raise NotImplementedError()
@@ -30,10 +51,9 @@ class ProdutoRepository(Repository, ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def set_selected_product_and_components(
+    def set_selected_products_and_components(
         self,
-        produto_id: int,
         purchase_id: int,
-        component_ids: Optional[List[int]] = None,
-    ) -> ProdutoAggregate:
+        products: List[AddPurchaseOptions],
+    ) -> List[int]:
         raise NotImplementedError()
@@ -0,0 +1,12 @@
+from typing import List, Optional
+
+from src.core.domain.base.value_object import ValueObject
+
+
+class ProdutoOrdersPageValueObject(ValueObject):
+    """A page of the purchase ids of a product, next_after is the cursor of the next page."""
+
+    product_id: int
+    order_count: int
+    orders: List[int]
+    next_after: Optional[int] = None
@@ -0,0 +1,11 @@
+from src.core.domain.base.value_object import ValueObject
+
+
+class ProdutoStateValueObject(ValueObject):
+    """Only the columns the state transition rules look at."""
+
+    id: int
+    is_active: bool
+    has_category: bool
+    has_price: bool
+    has_currency: bool
@@ -0,0 +1,8 @@
+class ConcurrencyConflictError(Exception):
+    """
+    Exception raised when an item changed since the version the update was based on.
+    """
+
+    def __init__(self, message: str, current=None):
+        super().__init__(message)
+        self.current = current
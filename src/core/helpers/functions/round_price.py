@@ -0,0 +1,12 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+CENTS = Decimal("0.01")
+
+
+def round_price(price: float) -> Decimal:
+    """
+    Rounds a stored price to cents as PostgreSQL round(price::numeric, 2) does:
+    from the 15 significant digits of the float, halves away from zero.
+    The listing rendered by the database must carry the same values.
+    """
+    return Decimal(f"{price:.15g}").quantize(CENTS, rounding=ROUND_HALF_UP)
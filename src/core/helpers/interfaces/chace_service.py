@@ -17,3 +17,7 @@ class CacheService(ABC):
     @abstractmethod
     def clear(self) -> None:
         pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        pass
@@ -0,0 +1,12 @@
+from typing import List, Optional
+
+from src.core.helpers.options.produto_find_options import ProdutoFindOptions
+
+
+class ProdutoBulkOptions(ProdutoFindOptions):
+    ids: Optional[List[int]] = None
+
+    def is_empty(self) -> bool:
+        return not any(
+            [self.ids, self.name, self.category, any(self.price_range or [])]
+        )
@@ -1,3 +1,4 @@
+import json
 from typing import Optional, Tuple
 from src.core.helpers.base.repository_options import RepositoryOptions
 
@@ -6,3 +7,24 @@ class ProdutoFindOptions(RepositoryOptions):
     name: Optional[str] = None
     category: Optional[str] = None
     price_range: Optional[Tuple[Optional[float], Optional[float]]] = None
+
+    def cache_key(self) -> str:
+        """
+        Canonical form of the filters, the same for every spelling of one
+        search. Text filters match case insensitively, so they are lowercased.
+        """
+        price_range = None
+        if any(self.price_range or []):
+            min_price, max_price = self.price_range
+            price_range = [
+                float(min_price or 0),
+                float("inf") if max_price is None else float(max_price),
+            ]
+        return json.dumps(
+            {
+                "category": self.category.lower() if self.category else None,
+                "name": self.name.lower() if self.name else None,
+                "price_range": price_range,
+            },
+            sort_keys=True,
+        )
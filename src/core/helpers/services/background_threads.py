@@ -0,0 +1,42 @@
+import threading
+from typing import Dict, List
+
+
+class BackgroundThreads:
+    """Registry of the background threads, so their liveness can be reported."""
+
+    def __init__(self):
+        self._threads: Dict[str, List[threading.Thread]] = {}
+        self._long_running: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self, name: str, thread: threading.Thread, long_running: bool = False
+    ) -> None:
+        with self._lock:
+            self._threads.setdefault(name, []).append(thread)
+            self._long_running[name] = long_running
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._threads.pop(name, None)
+            self._long_running.pop(name, None)
+
+    def status(self) -> Dict[str, dict]:
+        with self._lock:
+            status = {}
+            for name, threads in self._threads.items():
+                alive = [thread for thread in threads if thread.is_alive()]
+                long_running = self._long_running[name]
+                if not long_running:
+                    # Short lived threads are dropped once they finish
+                    self._threads[name] = alive
+                status[name] = {
+                    "alive": len(alive),
+                    "long_running": long_running,
+                    "healthy": bool(alive) or not long_running,
+                }
+            return status
+
+
+background_threads = BackgroundThreads()
@@ -0,0 +1,43 @@
+import asyncio
+from time import perf_counter
+from typing import Optional
+
+
+class EventLoopLagMonitor:
+    """Measures how late the event loop wakes up a sleeping task."""
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.lag_ms: float = 0
+        self.max_lag_ms: float = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def status(self) -> dict:
+        return {
+            "running": self.running,
+            "lag_ms": round(self.lag_ms, 3),
+            "max_lag_ms": round(self.max_lag_ms, 3),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            start = perf_counter()
+            await asyncio.sleep(self.interval)
+            self.lag_ms = max(0, (perf_counter() - start - self.interval) * 1000)
+            self.max_lag_ms = max(self.max_lag_ms, self.lag_ms)
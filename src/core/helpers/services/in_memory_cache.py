@@ -11,6 +11,8 @@ from src.core.helpers.interfaces.chace_service import CacheService
 class InMemoryCacheService(CacheService):
     def __init__(self, start_cleaner_deamon: bool = True, cleaner_interval: int = 10):
         self.cache = {}
+        self.hits = 0
+        self.misses = 0
         self.exit_event: threading.Event = None
         if start_cleaner_deamon:
             self.start_cleaner(cleaner_interval)
@@ -20,10 +22,15 @@ class InMemoryCacheService(CacheService):
         self.cache[key] = (value, expiration)
 
     def get(self, key: str) -> any:
-        value, expiration = self.cache.get(key, (None, None))
+        if key not in self.cache:
+            self.misses += 1
+            return None
+        value, expiration = self.cache[key]
         if expiration and datetime.now() > expiration:
             self.delete(key)
+            self.misses += 1
             return None
+        self.hits += 1
         return deepcopy(value)
 
     def delete(self, key: str) -> None:
@@ -33,6 +40,15 @@ class InMemoryCacheService(CacheService):
     def clear(self) -> None:
         self.cache.clear()
 
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
     def start_cleaner(self, interval: int = 10):
         self._start_cache_cleaner(interval)
 
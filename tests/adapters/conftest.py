@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+from peewee import SqliteDatabase
+import pytest
+
+from src.adapters.driven.infra import db_router
+from src.adapters.driven.infra.models.archives import (
+    ArchivedProduct,
+    ArchivedPurchaseSelectedProduct,
+    ArchivedSelectedProduct,
+    ArchivedSelectedProductComponent,
+)
+from src.adapters.driven.infra.models.categories import Category
+from src.adapters.driven.infra.models.currencies import Currency
+from src.adapters.driven.infra.models.product_catalog import ProductCatalogEntry
+from src.adapters.driven.infra.models.product_components import ProductComponent
+from src.adapters.driven.infra.models.products import Product
+from src.adapters.driven.infra.models.purchase_selected_products import (
+    PurchaseSelectedProducts,
+)
+from src.adapters.driven.infra.models.select_product import SelectedProduct
+from src.adapters.driven.infra.models.select_product_components import (
+    SelectedProductComponent,
+)
+
+MODELS = [
+    Category,
+    Currency,
+    Product,
+    ProductComponent,
+    SelectedProduct,
+    PurchaseSelectedProducts,
+    SelectedProductComponent,
+    ArchivedProduct,
+    ArchivedSelectedProduct,
+    ArchivedPurchaseSelectedProduct,
+    ArchivedSelectedProductComponent,
+    ProductCatalogEntry,
+]
+
+
+@pytest.fixture
+def database(monkeypatch, tmp_path):
+    """SQLite file standing in for the primary database, shared between threads."""
+    database = SqliteDatabase(str(tmp_path / "primary.db"))
+    monkeypatch.setattr(db_router, "primary", database)
+    database.create_tables(MODELS)
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def executed_sql(database, monkeypatch):
+    executed = []
+    execute_sql = database.execute_sql
+
+    def counting_execute_sql(sql, *args, **kwargs):
+        executed.append(sql)
+        return execute_sql(sql, *args, **kwargs)
+
+    monkeypatch.setattr(database, "execute_sql", counting_execute_sql)
+    return executed
+
+
+@pytest.fixture
+def catalog(database):
+    currency = Currency.create(symbol="R$", name="Real", code="BRL")
+    lanches = Category.create(name="Lanches", is_component=False)
+    adicionais = Category.create(name="Adicionais", is_component=True)
+    queijo = Product.create(
+        name="Queijo", price=2.5, currency=currency, category=adicionais, is_active=True
+    )
+    bacon = Product.create(
+        name="Bacon", price=4, currency=currency, category=adicionais, is_active=True
+    )
+    burger = Product.create(
+        name="Big Lanche",
+        price=27.9,
+        currency=currency,
+        category=lanches,
+        allow_components=True,
+        is_active=True,
+    )
+    ProductComponent.create(product=burger, component=queijo)
+    ProductComponent.create(product=burger, component=bacon)
+    return SimpleNamespace(
+        currency=currency,
+        lanches=lanches,
+        adicionais=adicionais,
+        queijo=queijo,
+        bacon=bacon,
+        burger=burger,
+    )
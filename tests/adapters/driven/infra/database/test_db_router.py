@@ -0,0 +1,123 @@
+import threading
+
+from peewee import CharField, Model, SqliteDatabase
+import pytest
+
+from src.adapters.driven.infra.database.db_router import DatabaseRouter
+
+
+class TestDatabaseRouter:
+    @pytest.fixture
+    def primary(self, tmp_path):
+        return SqliteDatabase(str(tmp_path / "primary.db"))
+
+    @pytest.fixture
+    def replica(self, tmp_path):
+        return SqliteDatabase(str(tmp_path / "replica.db"))
+
+    @pytest.fixture
+    def router(self, primary, replica):
+        router = DatabaseRouter(primary, [replica], health_check_interval=60)
+
+        class Marker(Model):
+            origin = CharField()
+
+            class Meta:
+                database = router.proxy
+
+        for database, origin in ((primary, "primary"), (replica, "replica")):
+            with router.use(database):
+                Marker.create_table()
+                Marker.create(origin=origin)
+        router.Marker = Marker
+        return router
+
+    def read_origin(self, router: DatabaseRouter):
+        @router.reading
+        def read():
+            return [marker.origin for marker in router.Marker.select()]
+
+        return read()
+
+    def test_reads_go_to_replica(self, router: DatabaseRouter):
+        with router.request_scope():
+            assert self.read_origin(router) == ["replica"]
+
+    def test_writes_go_to_primary(self, router: DatabaseRouter):
+        @router.writing
+        def write():
+            router.Marker.create(origin="written")
+
+        with router.request_scope():
+            write()
+        with router.use(router.primary):
+            origins = [marker.origin for marker in router.Marker.select()]
+        assert origins == ["primary", "written"]
+
+    def test_reads_after_write_in_same_scope_go_to_primary(
+        self, router: DatabaseRouter
+    ):
+        @router.writing
+        def write():
+            router.Marker.create(origin="written")
+
+        with router.request_scope():
+            write()
+            assert self.read_origin(router) == ["primary", "written"]
+        with router.request_scope():
+            assert self.read_origin(router) == ["replica"]
+
+    def test_unhealthy_replica_falls_back_to_primary(
+        self, router: DatabaseRouter, tmp_path
+    ):
+        router.replicas[0].init(str(tmp_path / "missing" / "replica.db"))
+        router.replicas[0].close()
+
+        assert router.check_replicas() == {0: False}
+        with router.request_scope():
+            assert self.read_origin(router) == ["primary"]
+
+    def test_failing_replica_query_retries_on_primary(self, router: DatabaseRouter):
+        with router.use(router.replicas[0]):
+            router.Marker.drop_table()
+
+        with router.request_scope():
+            assert self.read_origin(router) == ["primary"]
+        assert router.pick_replica() is None
+
+    def test_health_check_runs_off_the_request_path(
+        self, router: DatabaseRouter, monkeypatch
+    ):
+        answered = threading.Event()
+
+        def blackholed_ping(database):
+            answered.wait(5)
+            raise OSError("timeout expired")
+
+        monkeypatch.setattr(router, "ping", blackholed_ping)
+        router._last_check = 0
+
+        assert router.pick_replica() is router.replicas[0]
+        assert router.pick_replica() is router.replicas[0]
+        assert not router.schedule_check()
+        answered.set()
+        router._checker.join(5)
+
+        assert router.pick_replica() is None
+
+    def test_without_replicas_everything_goes_to_primary(self, primary):
+        router = DatabaseRouter(primary)
+
+        assert router.pick_replica() is None
+        assert router.current() is primary
+
+    def test_ping_returns_the_connection_it_opened(self, primary):
+        router = DatabaseRouter(primary)
+
+        assert router.ping(primary) >= 0
+        assert primary.is_closed()
+
+        primary.connect()
+        router.ping(primary)
+        assert not primary.is_closed()
+        primary.close()
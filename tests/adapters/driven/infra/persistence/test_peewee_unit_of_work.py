@@ -0,0 +1,124 @@
+import pytest
+
+from src.adapters.driven.infra import db_router
+from src.adapters.driven.infra.models.products import Product
+from src.adapters.driven.infra.persistence.peewee_unit_of_work import (
+    PeeweeUnitOfWork,
+)
+from src.adapters.driven.infra.ports.cached_categoria_query import (
+    CachedCategoriaQuery,
+)
+from src.adapters.driven.infra.ports.orm_categoria_query import OrmCategoriaQuery
+from src.adapters.driven.infra.ports.orm_currency_query import OrmCurrencyQuery
+from src.adapters.driven.infra.ports.orm_produto_query import OrmProductQuery
+from src.adapters.driven.infra.repositories.orm_produto_repository import (
+    OrmProdutoRepository,
+)
+from src.core.application.services.produto_service_command import ProductServiceCommand
+from src.core.helpers.options.add_purchase_options import AddPurchaseOptions
+from src.core.helpers.services.in_memory_cache import InMemoryCacheService
+
+
+class TestPeeweeUnitOfWork:
+    @pytest.fixture
+    def unit_of_work(self, database):
+        return PeeweeUnitOfWork(db_router)
+
+    @pytest.fixture
+    def command(self, unit_of_work):
+        product_query = OrmProductQuery()
+        return ProductServiceCommand(
+            OrmProdutoRepository(product_query),
+            product_query,
+            CachedCategoriaQuery(
+                OrmCategoriaQuery(), InMemoryCacheService(start_cleaner_deamon=False)
+            ),
+            OrmCurrencyQuery(),
+            unit_of_work,
+        )
+
+    def test_command_commits_once(
+        self, command: ProductServiceCommand, unit_of_work, catalog, executed_sql
+    ):
+        command.add_purchase(
+            7,
+            [
+                AddPurchaseOptions(
+                    product_id=catalog.burger.id, components=[catalog.queijo.id]
+                ),
+                AddPurchaseOptions(product_id=catalog.bacon.id),
+            ],
+        )
+
+        assert [sql for sql in executed_sql if sql == "BEGIN"] == ["BEGIN"]
+        stats = unit_of_work.stats()["add_purchase"]
+        assert stats["commits"] == 1
+        assert stats["last"] == {"select": 5, "insert": 3}
+        assert stats["statements"] == 8
+
+    def test_state_transition_is_a_single_guarded_update(
+        self, command: ProductServiceCommand, unit_of_work, catalog
+    ):
+        Product.update(is_active=False).where(Product.id == catalog.bacon.id).execute()
+        Product.update(is_active=False, price=None).where(
+            Product.id == catalog.queijo.id
+        ).execute()
+
+        aggregate = command.activate_product(catalog.bacon.id)
+        with pytest.raises(ValueError, match="Produto não possui preço"):
+            command.activate_product(catalog.queijo.id)
+
+        assert aggregate.product.is_active is True
+        stats = unit_of_work.stats()["activate_product"]
+        assert stats["commits"] == 1
+        assert stats["last"] == {"update": 1, "select": 3}
+        assert Product.get_by_id(catalog.queijo.id).is_active is False
+
+    def test_failing_command_rolls_back_every_write(
+        self, unit_of_work: PeeweeUnitOfWork, catalog
+    ):
+        with pytest.raises(RuntimeError):
+            with unit_of_work.begin("rename"):
+                Product.update(name="Renomeado").where(
+                    Product.id == catalog.burger.id
+                ).execute()
+                raise RuntimeError()
+
+        assert Product.get_by_id(catalog.burger.id).name == "Big Lanche"
+        assert unit_of_work.stats() == {}
+
+    def test_on_commit_runs_after_the_outermost_commit(
+        self, unit_of_work: PeeweeUnitOfWork, database
+    ):
+        calls = []
+        with unit_of_work.begin("outer"):
+            with unit_of_work.begin("inner"):
+                unit_of_work.on_commit(lambda: calls.append(database.in_transaction()))
+            assert calls == []
+
+        assert calls == [False]
+        assert list(unit_of_work.stats()) == ["outer"]
+
+    def test_on_commit_is_discarded_on_rollback(self, unit_of_work: PeeweeUnitOfWork):
+        calls = []
+        with pytest.raises(RuntimeError):
+            with unit_of_work.begin("failing"):
+                unit_of_work.on_commit(lambda: calls.append(True))
+                raise RuntimeError()
+
+        assert calls == []
+
+    def test_commit_listeners_run_once_per_outermost_commit(
+        self, unit_of_work: PeeweeUnitOfWork
+    ):
+        commands = []
+        unit_of_work.add_commit_listener(commands.append)
+
+        with unit_of_work.begin("outer"):
+            with unit_of_work.begin("inner"):
+                pass
+        with pytest.raises(RuntimeError):
+            with unit_of_work.begin("failing"):
+                raise RuntimeError()
+
+        assert commands == ["outer"]
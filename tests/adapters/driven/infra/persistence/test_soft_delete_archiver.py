@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+
+from src.adapters.driven.infra import db_router
+from src.adapters.driven.infra.models.archives import (
+    ArchivedProduct,
+    ArchivedPurchaseSelectedProduct,
+    ArchivedSelectedProduct,
+    ArchivedSelectedProductComponent,
+)
+from src.adapters.driven.infra.models.products import Product
+from src.adapters.driven.infra.models.purchase_selected_products import (
+    PurchaseSelectedProducts,
+)
+from src.adapters.driven.infra.models.select_product import SelectedProduct
+from src.adapters.driven.infra.models.select_product_components import (
+    SelectedProductComponent,
+)
+from src.adapters.driven.infra.persistence.soft_delete_archiver import (
+    SoftDeleteArchiver,
+)
+from src.adapters.driven.infra.repositories.orm_produto_repository import (
+    OrmProdutoRepository,
+)
+from src.core.helpers.options.add_purchase_options import AddPurchaseOptions
+
+LONG_AGO = datetime(2020, 1, 1)
+
+
+class TestSoftDeleteArchiver:
+    def test_moves_old_soft_deleted_rows_to_the_archive(self, catalog):
+        repository = OrmProdutoRepository()
+        repository.set_selected_products_and_components(
+            7,
+            [
+                AddPurchaseOptions(
+                    product_id=catalog.burger.id, components=[catalog.queijo.id]
+                )
+            ],
+        )
+        repository.set_selected_products_and_components(
+            7, [AddPurchaseOptions(product_id=catalog.bacon.id)]
+        )
+        old = Product.create(name="Antigo", is_active=False)
+        recent = Product.create(name="Recente", is_active=False)
+        repository.delete(old.id)
+        repository.delete(recent.id)
+        repository.delete(catalog.queijo.id)
+        for model in (
+            PurchaseSelectedProducts,
+            SelectedProduct,
+            SelectedProductComponent,
+        ):
+            model.update(deleted_at=LONG_AGO).where(
+                model.deleted_at.is_null(False)
+            ).execute()
+        Product.update(deleted_at=LONG_AGO).where(
+            Product.id.in_([old.id, catalog.queijo.id])
+        ).execute()
+
+        archived = SoftDeleteArchiver(
+            db_router, retention=timedelta(days=30), batch_size=1
+        ).run()
+
+        assert archived == {
+            "purchase_selected_product": 1,
+            "selected_product_component": 1,
+            "selected_product": 1,
+            "product": 1,
+        }
+        assert [row.name for row in ArchivedProduct.select()] == ["Antigo"]
+        assert ArchivedProduct.get().deleted_at == LONG_AGO
+        assert ArchivedPurchaseSelectedProduct.get().purchase_id == 7
+        assert ArchivedSelectedProduct.get().product == catalog.burger.id
+        assert ArchivedSelectedProductComponent.get().component == catalog.queijo.id
+        # Still referenced by the burger components
+        assert (
+            Product.select_including_deleted()
+            .where(Product.id == catalog.queijo.id)
+            .exists()
+        )
+        assert (
+            Product.select_including_deleted().where(Product.id == recent.id).exists()
+        )
+        assert (
+            not Product.select_including_deleted().where(Product.id == old.id).exists()
+        )
+        assert SelectedProduct.select().count() == 1
+
+    def test_without_old_rows_nothing_moves(self, catalog):
+        archived = SoftDeleteArchiver(
+            db_router, retention=timedelta(days=30), batch_size=100
+        ).run()
+
+        assert set(archived.values()) == {0}
+        assert Product.select().count() == 3
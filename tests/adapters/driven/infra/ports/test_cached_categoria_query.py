@@ -0,0 +1,90 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+import pytest
+
+from src.adapters.driven.infra.ports.cached_categoria_query import (
+    CachedCategoriaQuery,
+)
+from src.core.domain.entities.categoria_entity import CategoriaEntity
+from src.core.helpers.services.in_memory_cache import InMemoryCacheService
+
+
+class TestCachedCategoriaQuery:
+    @pytest.fixture
+    def categories(self):
+        return [
+            CategoriaEntity(
+                id=category_id,
+                name=f"categoria_{category_id}",
+                created_at=datetime(2021, 1, 1),
+                updated_at=datetime(2021, 1, 1),
+            )
+            for category_id in (1, 2)
+        ]
+
+    @pytest.fixture
+    def category_query(self, categories):
+        category_query = MagicMock()
+        category_query.get_all = MagicMock(return_value=categories)
+        return category_query
+
+    @pytest.fixture
+    def cached_query(self, category_query):
+        return CachedCategoriaQuery(
+            category_query, InMemoryCacheService(start_cleaner_deamon=False)
+        )
+
+    def test_get_all_loads_once(self, cached_query, category_query, categories):
+        assert cached_query.get_all() == categories
+        assert cached_query.get_all() == categories
+        category_query.get_all.assert_called_once()
+
+    def test_get_is_served_from_reference_data(self, cached_query, category_query):
+        cached_query.warm_up()
+
+        assert cached_query.get(2).name == "categoria_2"
+        category_query.get.assert_not_called()
+
+    def test_get_unknown_id_falls_back_to_query(self, cached_query, category_query):
+        category_query.get = MagicMock(return_value=None)
+
+        assert cached_query.get(3) is None
+        category_query.get.assert_called_once_with(3)
+
+    def test_get_returns_a_copy_of_the_indexed_category(
+        self, cached_query, category_query
+    ):
+        category = cached_query.get(1)
+        category.name = "alterada"
+
+        assert cached_query.get(1).name == "categoria_1"
+        category_query.get_all.assert_called_once()
+
+    def test_categories_are_reloaded_once_the_ttl_expires(
+        self, category_query, categories, monkeypatch
+    ):
+        now = [100.0]
+        monkeypatch.setattr(
+            "src.adapters.driven.infra.ports.cached_categoria_query.monotonic",
+            lambda: now[0],
+        )
+        cached_query = CachedCategoriaQuery(
+            category_query, InMemoryCacheService(start_cleaner_deamon=False), ttl=60
+        )
+        cached_query.get(1)
+        category_query.get_all.return_value = [
+            categories[0].model_copy(update={"name": "renomeada"})
+        ]
+
+        assert cached_query.get(1).name == "categoria_1"
+        now[0] = 161.0
+        assert cached_query.get(1).name == "renomeada"
+
+    def test_invalidate_reloads_on_the_next_lookup(self, cached_query, category_query):
+        cached_query.get_all()
+        cached_query.invalidate()
+
+        cached_query.get(2)
+        cached_query.get_all()
+
+        assert category_query.get_all.call_count == 2
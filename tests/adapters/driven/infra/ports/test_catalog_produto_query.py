@@ -0,0 +1,107 @@
+import pytest
+
+from src.adapters.driven.infra.models.product_catalog import ProductCatalogEntry
+from src.adapters.driven.infra.models.products import Product
+from src.adapters.driven.infra.persistence.product_catalog_projection import (
+    ProductCatalogProjection,
+)
+from src.adapters.driven.infra.ports.catalog_produto_query import CatalogProductQuery
+from src.adapters.driven.infra.ports.orm_produto_query import OrmProductQuery
+from src.adapters.driven.infra.repositories.orm_produto_repository import (
+    OrmProdutoRepository,
+)
+from src.core.helpers.options.add_purchase_options import AddPurchaseOptions
+from src.core.helpers.options.produto_bulk_options import ProdutoBulkOptions
+from src.core.helpers.options.produto_find_options import ProdutoFindOptions
+
+
+def dumps(aggregates):
+    return sorted(
+        (aggregate.model_dump() for aggregate in aggregates),
+        key=lambda aggregate: aggregate["product"]["id"],
+    )
+
+
+class TestCatalogProductQuery:
+    @pytest.fixture
+    def query(self, catalog):
+        OrmProdutoRepository().set_selected_products_and_components(
+            7, [AddPurchaseOptions(product_id=catalog.burger.id)]
+        )
+        ProductCatalogProjection().refresh()
+        return CatalogProductQuery()
+
+    @pytest.fixture
+    def repository(self, query):
+        return OrmProdutoRepository(query, ProductCatalogProjection())
+
+    def test_reads_match_the_orm_path(self, query, catalog):
+        orm = OrmProductQuery()
+        options = ProdutoFindOptions(category="adic", price_range=(1, 3))
+        ids = [catalog.burger.id, catalog.bacon.id]
+
+        assert dumps(query.get_all()) == dumps(orm.get_all())
+        assert dumps(query.find(options)) == dumps(orm.find(options))
+        assert dumps(query.get_all_ids(ids)) == dumps(orm.get_all_ids(ids))
+        assert query.get(catalog.burger.id) == orm.get(catalog.burger.id)
+        assert query.get(catalog.burger.id).order_count == 1
+        assert query.get(999) is None
+
+    def test_listing_is_a_single_table_read(self, query, executed_sql):
+        executed_sql.clear()
+
+        query.get_all()
+
+        assert len(executed_sql) == 2
+        assert "product_catalog" in executed_sql[0]
+        assert "JOIN" not in executed_sql[0]
+
+    def test_component_writes_refresh_the_products_embedding_them(
+        self, query, repository, catalog
+    ):
+        repository.reprice_in_bulk(ProdutoBulkOptions(ids=[catalog.queijo.id]), 3)
+
+        burger = query.get(catalog.burger.id).product
+        assert burger.components[0].name == "Queijo"
+        assert burger.components[0].price.value == 3
+
+        repository.delete(catalog.queijo.id)
+
+        assert query.get(catalog.queijo.id) is None
+        assert [
+            component.name
+            for component in query.get(catalog.burger.id).product.components
+        ] == ["Bacon"]
+        assert dumps(query.get_all()) == dumps(OrmProductQuery().get_all())
+
+    def test_full_refresh_rebuilds_every_row(self, query, catalog):
+        ProductCatalogEntry.delete().execute()
+
+        assert ProductCatalogProjection().refresh() == 3
+        assert {entry.id for entry in ProductCatalogEntry.select()} == {
+            catalog.queijo.id,
+            catalog.bacon.id,
+            catalog.burger.id,
+        }
+
+    def test_refresh_upserts_a_row_written_concurrently(self, query, catalog):
+        projection = ProductCatalogProjection()
+        load_catalog = projection.product_query.load_catalog
+        burger = ProductCatalogEntry.select().where(
+            ProductCatalogEntry.id == catalog.burger.id
+        )
+        stale = burger.dicts().get()
+        burger_id = catalog.burger.id
+        ProductCatalogEntry.delete_by_id(burger_id)
+
+        def racing_load_catalog(conditions):
+            # Another write committed the row after this refresh started
+            ProductCatalogEntry.insert({**stale, "name": "Antigo"}).execute()
+            return load_catalog(conditions)
+
+        projection.product_query.load_catalog = racing_load_catalog
+        Product.update(name="Lanche Novo").where(Product.id == burger_id).execute()
+
+        assert projection.refresh([burger_id]) == 1
+        assert ProductCatalogEntry.get_by_id(burger_id).name == "Lanche Novo"
+        assert ProductCatalogEntry.select().count() == 3
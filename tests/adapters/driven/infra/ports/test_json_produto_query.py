@@ -0,0 +1,115 @@
+import json
+import os
+from datetime import datetime
+
+from playhouse.db_url import connect
+import pytest
+
+from migration.builder.raw_creation import MODELS
+from src.adapters.driven.infra import db_router
+from src.adapters.driven.infra.models.categories import Category
+from src.adapters.driven.infra.models.currencies import Currency
+from src.adapters.driven.infra.models.products import Product
+from src.adapters.driven.infra.ports.json_produto_query import JsonProductQuery
+from src.adapters.driven.infra.ports.orm_produto_query import OrmProductQuery
+from src.adapters.driven.infra.repositories.orm_produto_repository import (
+    OrmProdutoRepository,
+)
+from src.core.helpers.options.add_purchase_options import AddPurchaseOptions
+from src.core.helpers.options.produto_find_options import ProdutoFindOptions
+
+
+class TestJsonProductQuery:
+    @pytest.fixture
+    def query(self, catalog):
+        OrmProdutoRepository().set_selected_products_and_components(
+            7, [AddPurchaseOptions(product_id=catalog.burger.id)]
+        )
+        return JsonProductQuery()
+
+    def test_listing_body_matches_the_orm_path(self, query):
+        orm = OrmProductQuery()
+        options = ProdutoFindOptions(category="adic", price_range=(1, 3))
+
+        assert query.render_catalog() == orm.render_catalog()
+        assert query.render_catalog(options) == orm.render_catalog(options)
+        assert query.render_catalog(ProdutoFindOptions()) == orm.render_catalog()
+
+    def test_listing_is_rendered_in_one_statement(self, query, executed_sql):
+        executed_sql.clear()
+
+        body = json.loads(query.render_catalog())
+
+        assert len(executed_sql) == 1
+        burger = body[-1]
+        assert burger["order_count"] == 1
+        assert [component["name"] for component in burger["product"]["components"]] == [
+            "Queijo",
+            "Bacon",
+        ]
+
+    def test_missing_relations_render_as_null(self, query, catalog):
+        Product.create(name="Brinde", price=0, is_active=False)
+        Product.update(deleted_at=datetime.now()).where(
+            Product.id == catalog.queijo.id
+        ).execute()
+
+        body = json.loads(query.render_catalog(ProdutoFindOptions(name="brinde")))
+
+        assert body[0]["product"]["category"] is None
+        assert body[0]["product"]["price"] is None
+        assert body[0]["product"]["is_active"] is False
+        assert query.render_catalog(ProdutoFindOptions(name="nenhum")) == b"[]"
+        assert query.render_catalog() == OrmProductQuery().render_catalog()
+
+    def test_prices_are_rounded_as_the_orm_path(self, query):
+        seed_halfway_prices()
+
+        body = query.render_catalog(ProdutoFindOptions(name="meio"))
+
+        assert body == OrmProductQuery().render_catalog(ProdutoFindOptions(name="meio"))
+        assert [item["product"]["price"]["value"] for item in json.loads(body)] == [
+            "2.68",
+            "1.01",
+            "0.13",
+        ]
+
+
+# Prices halfway between cents, whose floats are just below or above the half
+HALFWAY_PRICES = [2.675, 1.005, 0.125]
+
+
+def seed_halfway_prices():
+    currency = Currency.create(symbol="R$", name="Real", code="BRL")
+    category = Category.create(name="Meios", is_component=False)
+    for index, price in enumerate(HALFWAY_PRICES):
+        Product.create(
+            name=f"Meio {index}",
+            price=price,
+            currency=currency,
+            category=category,
+            is_active=True,
+        )
+
+
+@pytest.mark.skipif(
+    not os.getenv("TEST_POSTGRES_URL"), reason="TEST_POSTGRES_URL is not set"
+)
+class TestJsonProductQueryPostgres:
+    @pytest.fixture
+    def postgres(self, monkeypatch):
+        database = connect(os.environ["TEST_POSTGRES_URL"])
+        monkeypatch.setattr(db_router, "primary", database)
+        database.drop_tables(MODELS, safe=True, cascade=True)
+        database.create_tables(MODELS)
+        yield database
+        database.drop_tables(MODELS, cascade=True)
+        database.close()
+
+    def test_listing_body_matches_the_orm_path(self, postgres):
+        seed_halfway_prices()
+        query, orm = JsonProductQuery(), OrmProductQuery()
+        options = ProdutoFindOptions(name="meio 1")
+
+        assert query.render_catalog() == orm.render_catalog()
+        assert query.render_catalog(options) == orm.render_catalog(options)
@@ -0,0 +1,193 @@
+import pytest
+
+from src.adapters.driven.infra.models.product_components import ProductComponent
+from src.adapters.driven.infra.models.products import Product
+from src.adapters.driven.infra.ports.orm_produto_query import OrmProductQuery
+from src.adapters.driven.infra.repositories.orm_produto_repository import (
+    OrmProdutoRepository,
+)
+from src.core.domain.entities.produto_entity import PartialProdutoEntity
+from src.core.helpers.options.add_purchase_options import AddPurchaseOptions
+from src.core.helpers.options.produto_find_options import ProdutoFindOptions
+
+
+class TestOrmProductQuery:
+    def test_get_all_ids_uses_a_fixed_number_of_queries(self, catalog, executed_sql):
+        add_ons = [
+            Product.create(
+                name=f"Adicional {i}",
+                price=1,
+                currency=catalog.currency,
+                category=catalog.adicionais,
+                is_active=True,
+            )
+            for i in range(12)
+        ]
+        ProductComponent.insert_many(
+            [
+                {"product": catalog.burger.id, "component": add_on.id}
+                for add_on in add_ons
+            ]
+        ).execute()
+        OrmProdutoRepository().set_selected_products_and_components(
+            7, [AddPurchaseOptions(product_id=catalog.burger.id)]
+        )
+        executed_sql.clear()
+
+        aggregates = OrmProductQuery().get_all_ids(
+            [catalog.burger.id, *[add_on.id for add_on in add_ons]]
+        )
+
+        assert len(executed_sql) == 3
+        by_id = {aggregate.product.id: aggregate for aggregate in aggregates}
+        burger = by_id[catalog.burger.id]
+        assert burger.order_count == 1
+        assert len(burger.product.components) == 14
+        assert burger.product.category.name == "Lanches"
+        assert burger.product.components[0].category.is_component
+        assert burger.product.components[0].price.currency.code == "BRL"
+        assert by_id[add_ons[0].id].product.components == []
+        assert by_id[add_ons[0].id].order_count == 0
+
+    def test_listing_shares_one_object_per_row(self, catalog):
+        double = Product.create(
+            name="Duplo Lanche",
+            price=35,
+            currency=catalog.currency,
+            category=catalog.lanches,
+            allow_components=True,
+            is_active=True,
+        )
+        ProductComponent.create(product=double, component=catalog.queijo)
+
+        by_id = {
+            aggregate.product.id: aggregate.product
+            for aggregate in OrmProductQuery().get_all()
+        }
+
+        burger, double = by_id[catalog.burger.id], by_id[double.id]
+        assert burger.category is double.category
+        assert burger.price.currency is by_id[catalog.queijo.id].price.currency
+        assert burger.components[0] is double.components[0]
+        assert burger.components[0].name == "Queijo"
+        assert by_id[catalog.queijo.id] is not burger.components[0]
+
+    def test_catalog_converts_to_the_aggregates_of_the_orm_path(
+        self, catalog, executed_sql
+    ):
+        OrmProdutoRepository().set_selected_products_and_components(
+            7, [AddPurchaseOptions(product_id=catalog.burger.id)]
+        )
+        query = OrmProductQuery()
+        executed_sql.clear()
+
+        produto_catalog = query.get_catalog()
+
+        assert len(executed_sql) == 3
+        assert [
+            aggregate.model_dump() for aggregate in produto_catalog.to_aggregates()
+        ] == [aggregate.model_dump() for aggregate in query.get_all()]
+        assert produto_catalog.products[catalog.burger.id].order_count == 1
+        assert len(produto_catalog.categories) == 2
+        assert len(produto_catalog.currencies) == 1
+
+    def test_catalog_search_loads_the_components_left_out(self, catalog):
+        query = OrmProductQuery()
+        options = ProdutoFindOptions(name="big")
+
+        produto_catalog = query.get_catalog(options)
+
+        assert produto_catalog.ids == [catalog.burger.id]
+        assert produto_catalog.products[catalog.burger.id].components == (
+            catalog.queijo.id,
+            catalog.bacon.id,
+        )
+        assert [
+            aggregate.model_dump() for aggregate in produto_catalog.to_aggregates()
+        ] == [aggregate.model_dump() for aggregate in query.find(options)]
+
+    def test_get_all_returns_each_product_once(self, catalog, executed_sql):
+        executed_sql.clear()
+
+        aggregates = OrmProductQuery().get_all()
+
+        assert len(executed_sql) == 3
+        assert sorted(aggregate.product.name for aggregate in aggregates) == [
+            "Bacon",
+            "Big Lanche",
+            "Queijo",
+        ]
+
+    def test_count_orders_and_paginate_order_ids(self, catalog):
+        repository = OrmProdutoRepository()
+        for purchase_id in (3, 1, 2, 5):
+            repository.set_selected_products_and_components(
+                purchase_id, [AddPurchaseOptions(product_id=catalog.burger.id)]
+            )
+        repository.set_selected_products_and_components(
+            5, [AddPurchaseOptions(product_id=catalog.bacon.id)]
+        )
+        query = OrmProductQuery()
+
+        assert query.count_orders([catalog.burger.id, catalog.queijo.id]) == {
+            catalog.burger.id: 3
+        }
+        assert query.get_order_ids(catalog.burger.id, limit=2) == [1, 2]
+        assert query.get_order_ids(catalog.burger.id, after=2, limit=2) == [3]
+        assert query.get(catalog.burger.id).order_count == 3
+
+    def test_get_all_ids_without_ids(self, database, executed_sql):
+        assert OrmProductQuery().get_all_ids([]) == []
+        assert executed_sql == []
+
+    def test_exists_by_name_ignores_case_and_partial_names(self, catalog):
+        query = OrmProductQuery()
+
+        assert query.exists_by_name("big lanche")
+        assert not query.exists_by_name("Big")
+        assert not query.exists_by_name("Big Lanche", exclude_id=catalog.burger.id)
+
+    def test_exists_by_name_skips_deleted_products(self, catalog):
+        OrmProdutoRepository().delete(catalog.bacon.id)
+
+        assert not OrmProductQuery().exists_by_name("Bacon")
+
+    def test_product_names_are_unique_among_live_products(self, catalog):
+        with pytest.raises(ValueError, match="Já existe um produto com esse nome"):
+            OrmProdutoRepository().create(
+                PartialProdutoEntity(name="QUEIJO", allow_components=False)
+            )
+
+    def test_has_orders(self, catalog):
+        query = OrmProductQuery()
+        OrmProdutoRepository().set_selected_products_and_components(
+            7, [AddPurchaseOptions(product_id=catalog.burger.id)]
+        )
+
+        assert query.has_orders(catalog.burger.id)
+        assert not query.has_orders(catalog.queijo.id)
+
+    def test_purchase_is_read_after_its_lines_are_replaced(self, catalog):
+        repository = OrmProdutoRepository()
+        repository.set_selected_products_and_components(
+            7,
+            [
+                AddPurchaseOptions(product_id=catalog.burger.id),
+                AddPurchaseOptions(product_id=catalog.bacon.id),
+            ],
+        )
+        query = OrmProductQuery()
+
+        assert [aggregate.product.id for aggregate in query.get_by_purchase_id(7)] == [
+            catalog.bacon.id,
+            catalog.burger.id,
+        ]
+
+        repository.set_selected_products_and_components(
+            7, [AddPurchaseOptions(product_id=catalog.burger.id)]
+        )
+
+        assert [aggregate.product.id for aggregate in query.get_by_purchase_id(7)] == [
+            catalog.burger.id
+        ]
+        assert query.get_by_purchase_id(8) == []
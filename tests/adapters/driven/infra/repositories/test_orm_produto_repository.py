@@ -0,0 +1,238 @@
+import pytest
+
+from src.adapters.driven.infra.models.product_components import ProductComponent
+from src.adapters.driven.infra.models.products import Product
+from src.adapters.driven.infra.models.purchase_selected_products import (
+    PurchaseSelectedProducts,
+)
+from src.adapters.driven.infra.models.select_product import SelectedProduct
+from src.adapters.driven.infra.models.select_product_components import (
+    SelectedProductComponent,
+)
+from src.adapters.driven.infra.repositories.orm_produto_repository import (
+    OrmProdutoRepository,
+)
+from src.core.domain.entities.produto_entity import PartialProdutoEntity
+from src.core.helpers.exceptions.concurrency_conflict_error import (
+    ConcurrencyConflictError,
+)
+from src.core.helpers.options.add_purchase_options import AddPurchaseOptions
+from src.core.helpers.options.produto_bulk_options import ProdutoBulkOptions
+
+WRITES = ("INSERT", "UPDATE", "DELETE")
+
+
+class TestOrmProdutoRepository:
+    def test_set_selected_products_and_components_in_bulk(self, catalog, executed_sql):
+        products = [
+            AddPurchaseOptions(
+                product_id=catalog.burger.id,
+                components=[catalog.queijo.id, catalog.bacon.id],
+            )
+            for _ in range(10)
+        ]
+
+        selected_product_ids = (
+            OrmProdutoRepository().set_selected_products_and_components(7, products)
+        )
+
+        assert len(selected_product_ids) == 10
+        inserts = [sql for sql in executed_sql if sql.startswith("INSERT")]
+        assert len(inserts) == 3
+        assert [
+            line.product_id
+            for line in PurchaseSelectedProducts.select().where(
+                PurchaseSelectedProducts.purchase_id == 7
+            )
+        ] == selected_product_ids
+        assert SelectedProductComponent.select().count() == 20
+        assert {
+            selected_product.product_id for selected_product in SelectedProduct.select()
+        } == {catalog.burger.id}
+
+    def test_set_selected_products_and_components_without_products(
+        self, database, executed_sql
+    ):
+        assert OrmProdutoRepository().set_selected_products_and_components(7, []) == []
+        assert [sql for sql in executed_sql if sql.startswith(WRITES)] == []
+
+    def test_set_selected_products_and_components_only_writes_the_delta(
+        self, catalog, executed_sql
+    ):
+        repository = OrmProdutoRepository()
+        burger_with_cheese = AddPurchaseOptions(
+            product_id=catalog.burger.id, components=[catalog.queijo.id]
+        )
+        queijo = AddPurchaseOptions(product_id=catalog.queijo.id)
+        bacon = AddPurchaseOptions(product_id=catalog.bacon.id)
+        first_ids = repository.set_selected_products_and_components(
+            7, [burger_with_cheese, queijo, queijo]
+        )
+        executed_sql.clear()
+
+        burger_with_bacon = AddPurchaseOptions(
+            product_id=catalog.burger.id, components=[catalog.bacon.id]
+        )
+        second_ids = repository.set_selected_products_and_components(
+            7, [queijo, burger_with_bacon, bacon]
+        )
+
+        assert second_ids[0] in first_ids[1:]
+        assert second_ids[1] == first_ids[0]
+        assert second_ids[2] not in first_ids
+        writes = [sql for sql in executed_sql if sql.startswith(WRITES)]
+        assert len(writes) == 6
+        assert [
+            line.product_id
+            for line in PurchaseSelectedProducts.select().where(
+                PurchaseSelectedProducts.purchase_id == 7
+            )
+        ] == sorted(second_ids)
+        assert {
+            (component.selected_product_id, component.component_id)
+            for component in SelectedProductComponent.select()
+        } == {(second_ids[1], catalog.bacon.id)}
+        assert Product.select().count() == 3
+
+    def test_set_selected_products_and_components_unchanged_purchase(
+        self, catalog, executed_sql
+    ):
+        repository = OrmProdutoRepository()
+        products = [
+            AddPurchaseOptions(
+                product_id=catalog.burger.id,
+                components=[catalog.queijo.id, catalog.bacon.id],
+            ),
+            AddPurchaseOptions(product_id=catalog.queijo.id),
+        ]
+        first_ids = repository.set_selected_products_and_components(7, products)
+        executed_sql.clear()
+
+        second_ids = repository.set_selected_products_and_components(
+            7, list(reversed(products))
+        )
+
+        assert second_ids == list(reversed(first_ids))
+        assert [sql for sql in executed_sql if sql.startswith(WRITES)] == []
+
+    def test_create_is_a_single_insert_returning(self, catalog, executed_sql):
+        repository = OrmProdutoRepository()
+        bacon = repository.product_query.get_only_entity(catalog.bacon.id)
+        executed_sql.clear()
+
+        result = repository.create(
+            PartialProdutoEntity(
+                name="Cheddar",
+                price=bacon.price,
+                category=bacon.category,
+                components=[],
+            )
+        )
+
+        assert len(executed_sql) == 1
+        assert executed_sql[0].startswith("INSERT") and "RETURNING" in executed_sql[0]
+        assert result.product.id == Product.get(Product.name == "Cheddar").id
+        assert result.product.is_active is False
+        assert result.product.created_at is not None
+        assert result.product.category == bacon.category
+        assert result.product.price == bacon.price
+        assert result.product.components == []
+
+    def test_update_without_component_changes_only_updates_the_row(
+        self, catalog, executed_sql
+    ):
+        repository = OrmProdutoRepository()
+        burger = repository.product_query.get_only_entity(catalog.burger.id)
+        executed_sql.clear()
+
+        burger.name = "Big Lanche Duplo"
+        result = repository.update(burger)
+
+        writes = [sql for sql in executed_sql if sql.startswith(WRITES)]
+        assert len(writes) == 1
+        assert writes[0].startswith("UPDATE") and "RETURNING" in writes[0]
+        assert len(executed_sql) == 3
+        assert result.product.name == "Big Lanche Duplo"
+        assert result.product.category == burger.category
+        assert result.product.price == burger.price
+        assert [component.id for component in result.product.components] == [
+            catalog.queijo.id,
+            catalog.bacon.id,
+        ]
+
+    def test_update_compares_and_swaps_the_version(self, catalog):
+        repository = OrmProdutoRepository()
+        burger = repository.product_query.get_only_entity(catalog.burger.id)
+        stale = burger.model_copy()
+
+        burger.name = "Big Lanche Duplo"
+        result = repository.update(burger)
+        stale.name = "Big Lanche Triplo"
+        with pytest.raises(ConcurrencyConflictError) as conflict:
+            repository.update(stale)
+
+        assert result.product.version == 2
+        assert conflict.value.current.product.name == "Big Lanche Duplo"
+        assert conflict.value.current.product.version == 2
+        assert Product.get_by_id(catalog.burger.id).name == "Big Lanche Duplo"
+
+    def test_bulk_updates_bump_the_version(self, catalog):
+        OrmProdutoRepository().set_active_in_bulk(
+            ProdutoBulkOptions(ids=[catalog.burger.id]), False
+        )
+
+        assert Product.get_by_id(catalog.burger.id).version == 2
+
+    def test_update_applies_only_the_component_delta(self, catalog, executed_sql):
+        repository = OrmProdutoRepository()
+        burger = repository.product_query.get_only_entity(catalog.burger.id)
+        salada = Product.create(
+            name="Salada",
+            price=1.5,
+            currency=catalog.currency,
+            category=catalog.adicionais,
+            is_active=True,
+        )
+        executed_sql.clear()
+
+        burger.components = [
+            burger.components[0],
+            repository.product_query.get_only_entity(salada.id),
+        ]
+        repository.update(burger)
+
+        writes = [sql for sql in executed_sql if sql.startswith(WRITES)]
+        assert [sql.split()[0] for sql in writes] == ["UPDATE", "DELETE", "INSERT"]
+        assert {
+            component.component_id
+            for component in ProductComponent.select().where(
+                ProductComponent.product == catalog.burger.id
+            )
+        } == {catalog.queijo.id, salada.id}
+
+    def test_set_active_in_bulk_is_one_conditional_update(self, catalog, executed_sql):
+        pronto = Product.create(
+            name="Pronto", price=10, currency=catalog.currency, category=catalog.lanches
+        )
+        Product.create(name="Sem preço", category=catalog.lanches)
+        executed_sql.clear()
+
+        changed = OrmProdutoRepository().set_active_in_bulk(
+            ProdutoBulkOptions(category="Lanches"), True
+        )
+
+        assert changed == [pronto.id]
+        writes = [sql for sql in executed_sql if sql.startswith(WRITES)]
+        assert len(writes) == 1 and "RETURNING" in writes[0]
+        assert Product.get_by_id(pronto.id).is_active
+
+    def test_reprice_in_bulk_by_percentage(self, catalog):
+        changed = OrmProdutoRepository().reprice_in_bulk(
+            ProdutoBulkOptions(ids=[catalog.burger.id, catalog.queijo.id]),
+            percentage=10,
+        )
+
+        assert sorted(changed) == [catalog.queijo.id, catalog.burger.id]
+        assert Product.get_by_id(catalog.burger.id).price == 30.69
+        assert Product.get_by_id(catalog.queijo.id).price == 2.75
+        assert Product.get_by_id(catalog.bacon.id).price == 4
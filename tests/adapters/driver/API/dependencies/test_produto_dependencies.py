@@ -0,0 +1,70 @@
+from unittest.mock import MagicMock
+import pytest
+
+from src.adapters.driven.infra.ports.catalog_produto_query import CatalogProductQuery
+from src.adapters.driven.infra.ports.json_produto_query import JsonProductQuery
+from src.adapters.driver.API.dependencies import produto_dependencies
+from src.adapters.driver.API.dependencies.produto_dependencies import (
+    ProdutoContainer,
+    get_product_service_command,
+    get_produto_container,
+    get_produto_service_query,
+)
+
+
+class TestProdutoDependencies:
+    @pytest.fixture(autouse=True)
+    def clear_container(self):
+        get_produto_container.cache_clear()
+        yield
+        get_produto_container.cache_clear()
+
+    def test_container_is_built_once_per_process(self):
+        first = get_produto_container()
+        second = get_produto_container()
+
+        assert first is second
+        assert get_product_service_command(first) is first.product_service_command
+        assert get_produto_service_query(first) is first.product_service_query
+
+    def test_container_shares_adapters_between_services(self):
+        container = get_produto_container()
+
+        command = container.product_service_command
+        query = container.product_service_query
+        assert command.product_query is query.product_query
+        assert container.product_repository.product_query is container.product_query
+
+    def test_container_strategy_is_selected_from_environment(self, monkeypatch):
+        mocked_container = ProdutoContainer(
+            MagicMock(), MagicMock(), MagicMock(), MagicMock()
+        )
+        monkeypatch.setitem(
+            produto_dependencies.container_builders, "mock", lambda: mocked_container
+        )
+        monkeypatch.setenv("PRODUCT_ADAPTER", "mock")
+
+        assert get_produto_container() is mocked_container
+
+    def test_catalog_strategy_reads_from_the_catalog(self, monkeypatch):
+        monkeypatch.setenv("PRODUCT_ADAPTER", "catalog")
+
+        container = get_produto_container()
+
+        assert isinstance(container.product_query, CatalogProductQuery)
+        assert container.product_repository.product_query is container.product_query
+        assert container.product_repository.catalog_projection is not None
+
+    def test_json_strategy_renders_in_the_database(self, monkeypatch):
+        monkeypatch.setenv("PRODUCT_ADAPTER", "json")
+
+        container = get_produto_container()
+
+        assert isinstance(container.product_query, JsonProductQuery)
+        assert container.product_repository.product_query is container.product_query
+
+    def test_unknown_strategy_raises(self, monkeypatch):
+        monkeypatch.setenv("PRODUCT_ADAPTER", "unknown")
+
+        with pytest.raises(NotImplementedError, match="unknown"):
+            get_produto_container()
@@ -0,0 +1,200 @@
+import asyncio
+import threading
+from typing import List
+
+from fastapi.testclient import TestClient
+import pytest
+
+from app import app, STAGE_PREFIX
+from src.adapters.driven.infra import db_router
+from src.adapters.driven.infra.models.products import Product
+from src.adapters.driven.infra.persistence.peewee_unit_of_work import (
+    PeeweeUnitOfWork,
+)
+from src.adapters.driven.infra.ports.orm_categoria_query import OrmCategoriaQuery
+from src.adapters.driven.infra.ports.orm_currency_query import OrmCurrencyQuery
+from src.adapters.driven.infra.ports.orm_produto_query import OrmProductQuery
+from src.adapters.driven.infra.repositories.orm_produto_repository import (
+    OrmProdutoRepository,
+)
+from src.adapters.driver.API import maintenance_router
+from src.adapters.driver.API.catalog_import import (
+    iter_csv_records,
+    iter_lines,
+    iter_ndjson_records,
+    iter_product_batches,
+)
+from src.adapters.driver.API.dependencies.produto_dependencies import (
+    get_product_service_command,
+)
+from src.core.application.services.produto_service_command import ProductServiceCommand
+
+
+async def stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+def collect(async_iterator) -> List:
+    async def consume():
+        return [item async for item in async_iterator]
+
+    return asyncio.run(consume())
+
+
+class TestCatalogImportParsing:
+    def test_lines_split_across_chunks(self):
+        lines = collect(iter_lines(stream(b"a,b\r\nc\xc3", b"\xa3,d\n")))
+
+        assert lines == ["a,b", "cã,d"]
+
+    def test_csv_records(self):
+        body = b'name,value\n"Lanche ""Duplo""\nEspecial",10\n\nQueijo,2.5\nSolto\n"Aberto,1'
+
+        records = collect(iter_csv_records(iter_lines(stream(body))))
+
+        assert records == [
+            (1, {"name": 'Lanche "Duplo"\nEspecial', "value": "10"}),
+            (2, {"name": "Queijo", "value": "2.5"}),
+            (3, "Esperadas 2 colunas, encontradas 1"),
+            (4, "Aspas não fechadas"),
+        ]
+
+    def test_ndjson_records(self):
+        body = b'{"name": "Queijo"}\n\n{"name": \n[1]\n'
+
+        records = collect(iter_ndjson_records(iter_lines(stream(body))))
+
+        assert records[0] == (1, {"name": "Queijo"})
+        assert records[1][0] == 2 and records[1][1].startswith("JSON inválido")
+        assert records[2] == (3, "Cada linha deve ser um objeto JSON")
+
+    def test_batches_convert_rows_to_products(self):
+        body = b"name,value,currency_id,category_id\nQueijo,2.5,1,2\nBacon,x,1,2\nSalada,1,1,2\n"
+
+        batches = collect(iter_product_batches(stream(body), "text/csv", 2))
+
+        assert [len(batch) for batch in batches] == [2, 1]
+        row, queijo = batches[0][0]
+        assert row == 1
+        assert queijo.name == "Queijo"
+        assert queijo.allow_components is False
+        assert queijo.category.id == 2
+        assert batches[0][1][1].startswith("value:")
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError, match="Formato não suportado"):
+            iter_product_batches(stream(b""), "application/json", 10)
+
+
+class TestImportProductsEndpoint:
+    @pytest.fixture
+    def client(self, catalog, monkeypatch):
+        product_query = OrmProductQuery()
+        command = ProductServiceCommand(
+            OrmProdutoRepository(product_query),
+            product_query,
+            OrmCategoriaQuery(),
+            OrmCurrencyQuery(),
+            PeeweeUnitOfWork(db_router),
+        )
+        app.dependency_overrides[get_product_service_command] = lambda: command
+        monkeypatch.setattr(maintenance_router, "IMPORT_BATCH_SIZE", 100)
+        yield TestClient(app, headers={"Authorization": "Bearer token"})
+        app.dependency_overrides.clear()
+
+    def test_import_csv(self, client: TestClient, catalog, executed_sql):
+        lines = ["name,value,currency_id,category_id,allow_components"]
+        lines += [
+            f"Produto {i},{i + 1},{catalog.currency.id},{catalog.lanches.id},true"
+            for i in range(250)
+        ]
+        lines += [
+            f"Queijo,1,{catalog.currency.id},{catalog.adicionais.id},",
+            f"produto  1,1,{catalog.currency.id},{catalog.lanches.id},",
+            f"Sem preço,0,{catalog.currency.id},{catalog.lanches.id},",
+            f"Sem categoria,1,{catalog.currency.id},999,",
+            f"Adicional,1,{catalog.currency.id},{catalog.adicionais.id},true",
+        ]
+
+        response = client.post(
+            f"/{STAGE_PREFIX}/maintenance/import_products",
+            content="\n".join(lines).encode(),
+            headers={"content-type": "text/csv"},
+        )
+
+        report = response.json()
+        assert response.status_code == 200
+        assert report["received"] == 255
+        assert report["created"] == 250
+        assert report["failed"] == 5
+        assert [error["row"] for error in report["errors"]] == [
+            251,
+            252,
+            253,
+            254,
+            255,
+        ]
+        assert report["errors"][0]["error"] == "Já existe um produto com esse nome"
+        assert report["errors"][4]["error"] == (
+            "Um Acompanhamento não permite ter outros acompanhamentos"
+        )
+        assert report["rows_per_second"] > 0
+        inserts = [
+            sql for sql in executed_sql if sql.startswith('INSERT INTO "product"')
+        ]
+        assert len(inserts) == 3
+        assert (
+            Product.select().where(Product.name.startswith("Produto ")).count() == 250
+        )
+        assert (
+            not Product.select()
+            .where(Product.is_active)
+            .where(Product.name.startswith("Produto "))
+            .exists()
+        )
+
+    def test_import_ndjson(self, client: TestClient, catalog):
+        response = client.post(
+            f"/{STAGE_PREFIX}/maintenance/import_products",
+            content=(
+                f'{{"name": "Suco", "value": 8, "currency_id": {catalog.currency.id},'
+                f' "category_id": {catalog.lanches.id}}}\n'
+                '{"name": "Suco"}\n'
+            ).encode(),
+            headers={"content-type": "application/x-ndjson"},
+        )
+
+        report = response.json()
+        assert report["created"] == 1
+        assert report["errors"][0]["row"] == 2
+
+    def test_import_returns_each_thread_connection(
+        self, client: TestClient, catalog, monkeypatch
+    ):
+        closed = []
+        monkeypatch.setattr(
+            maintenance_router, "close_db", lambda: closed.append(threading.get_ident())
+        )
+
+        client.post(
+            f"/{STAGE_PREFIX}/maintenance/import_products",
+            content=(
+                f'{{"name": "Suco", "value": 8, "currency_id": {catalog.currency.id},'
+                f' "category_id": {catalog.lanches.id}}}\n'
+            ).encode(),
+            headers={"content-type": "application/x-ndjson"},
+        )
+
+        # The import start and its one batch
+        assert len(closed) == 2
+        assert threading.get_ident() not in closed
+
+    def test_import_unknown_format(self, client: TestClient):
+        response = client.post(
+            f"/{STAGE_PREFIX}/maintenance/import_products",
+            content=b"[]",
+            headers={"content-type": "application/json"},
+        )
+
+        assert response.status_code == 400
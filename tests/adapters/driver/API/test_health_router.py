@@ -0,0 +1,66 @@
+from unittest.mock import MagicMock
+from fastapi.testclient import TestClient
+from peewee import SqliteDatabase
+import pytest
+
+from app import app, STAGE_PREFIX
+from src.adapters.driven.infra.database.db_router import DatabaseRouter
+from src.adapters.driver.API import health_router
+from src.adapters.driver.API.dependencies.produto_dependencies import (
+    get_produto_container,
+)
+from src.core.domain.base.unit_of_work import UnitOfWork
+from src.core.helpers.services.in_memory_cache import InMemoryCacheService
+
+
+class TestHealthRouter:
+    @pytest.fixture
+    def client(self, monkeypatch, tmp_path):
+        cache = InMemoryCacheService(start_cleaner_deamon=False)
+        cache.set("categories", [])
+        cache.get("categories")
+        app.dependency_overrides[get_produto_container] = lambda: MagicMock(
+            caches={"categories": cache}, unit_of_work=UnitOfWork()
+        )
+        monkeypatch.setattr(
+            health_router,
+            "db_router",
+            DatabaseRouter(SqliteDatabase(str(tmp_path / "primary.db"))),
+        )
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_liveness(self, client: TestClient):
+        response = client.get(f"/{STAGE_PREFIX}/health/live")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "alive"}
+
+    def test_readiness_reports_diagnostics(self, client: TestClient):
+        response = client.get(f"/{STAGE_PREFIX}/health/ready")
+
+        body = response.json()
+        assert response.status_code == 200
+        assert body["checks"] == {
+            "database": True,
+            "event_loop": True,
+            "background_threads": True,
+        }
+        assert body["database"]["primary"]["latency_ms"] >= 0
+        assert body["caches"]["categories"]["hit_ratio"] == 1
+        assert body["commands"] == {}
+
+    def test_readiness_fails_when_database_is_unreachable(
+        self, client: TestClient, monkeypatch, tmp_path
+    ):
+        monkeypatch.setattr(
+            health_router,
+            "db_router",
+            DatabaseRouter(SqliteDatabase(str(tmp_path / "missing" / "primary.db"))),
+        )
+
+        response = client.get(f"/{STAGE_PREFIX}/health/ready")
+
+        assert response.status_code == 503
+        assert response.json()["checks"]["database"] is False
+        assert response.json()["database"]["primary"]["reachable"] is False
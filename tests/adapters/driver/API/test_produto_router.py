@@ -0,0 +1,101 @@
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+import pytest
+
+from app import app, STAGE_PREFIX
+from src.adapters.driver.API.dependencies.produto_dependencies import (
+    build_json_container,
+    build_orm_container,
+    get_produto_container,
+)
+
+
+class TestProdutoRouter:
+    @pytest.fixture
+    def container(self, database):
+        return build_orm_container()
+
+    @pytest.fixture
+    def client(self, container):
+        app.dependency_overrides[get_produto_container] = lambda: container
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_index_matches_the_standard_encoder(self, client, container, catalog):
+        response = client.get(f"/{STAGE_PREFIX}/produto/index")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        expected = container.product_service_query.index(None)
+        assert response.json() == jsonable_encoder(expected)
+
+    def test_index_rendered_in_the_database_is_served_as_is(self, client, catalog):
+        orm = client.get(f"/{STAGE_PREFIX}/produto/index")
+        app.dependency_overrides[get_produto_container] = build_json_container
+
+        rendered = client.get(f"/{STAGE_PREFIX}/produto/index")
+
+        assert rendered.content == orm.content
+        assert rendered.headers["etag"] == orm.headers["etag"]
+
+    def test_index_hit_reuses_the_rendered_body(self, client, catalog, executed_sql):
+        first = client.get(f"/{STAGE_PREFIX}/produto/index")
+        queries = len(executed_sql)
+        second = client.get(f"/{STAGE_PREFIX}/produto/index")
+
+        assert second.content == first.content
+        assert len(executed_sql) == queries
+
+    def test_product_write_discards_the_rendered_body(self, client, container, catalog):
+        client.get(f"/{STAGE_PREFIX}/produto/index")
+
+        container.product_service_command.deactivate_product(catalog.bacon.id)
+
+        states = {
+            item["product"]["name"]: item["product"]["is_active"]
+            for item in client.get(f"/{STAGE_PREFIX}/produto/index").json()
+        }
+        assert states["Bacon"] is False
+
+    def test_filtered_index_shares_the_entry_of_equivalent_searches(
+        self, client, catalog, executed_sql
+    ):
+        first = client.get(
+            f"/{STAGE_PREFIX}/produto/index",
+            params={"name": "BACON", "max_price": 5},
+        )
+        queries = len(executed_sql)
+        second = client.get(
+            f"/{STAGE_PREFIX}/produto/index",
+            params={"name": "bacon", "min_price": 0, "max_price": 5.0},
+        )
+
+        assert [item["product"]["name"] for item in first.json()] == ["Bacon"]
+        assert second.content == first.content
+        assert len(executed_sql) == queries
+
+    def test_gzip_and_etag_are_served_from_the_entry(self, client, catalog):
+        url = f"/{STAGE_PREFIX}/produto/{catalog.burger.id}"
+        plain = client.get(url, headers={"Accept-Encoding": "identity"})
+        gzipped = client.get(url, headers={"Accept-Encoding": "gzip"})
+        not_modified = client.get(url, headers={"If-None-Match": plain.headers["etag"]})
+
+        assert "content-encoding" not in plain.headers
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert gzipped.content == plain.content
+        assert gzipped.headers["etag"] == plain.headers["etag"]
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+
+    def test_name_filter_without_price_range(self, client, catalog):
+        response = client.get(f"/{STAGE_PREFIX}/produto/index", params={"name": "que"})
+
+        assert [item["product"]["name"] for item in response.json()] == ["Queijo"]
+
+    def test_price_range_filter_without_name(self, client, catalog):
+        response = client.get(f"/{STAGE_PREFIX}/produto/index", params={"max_price": 5})
+
+        assert [item["product"]["name"] for item in response.json()] == [
+            "Queijo",
+            "Bacon",
+        ]
@@ -0,0 +1,11 @@
+import os
+
+# The infra package builds its database handles at import time, no connection is opened.
+for key, value in {
+    "DB_NAME": "test",
+    "DB_USER": "test",
+    "DB_PASSWORD": "test",
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+}.items():
+    os.environ.setdefault(key, value)
@@ -0,0 +1,92 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+import pytest
+
+from src.core.application.services.produto_import import ProdutoImport
+from src.core.domain.entities.categoria_entity import (
+    CategoriaEntity,
+    PartialCategoriaEntity,
+)
+from src.core.domain.entities.currency_entity import (
+    CurrencyEntity,
+    PartialCurrencyEntity,
+)
+from src.core.domain.entities.produto_entity import PartialProdutoEntity
+from src.core.domain.value_objects.preco_value_object import PrecoValueObject
+
+
+class TestProdutoImport:
+    @pytest.fixture
+    def command(self):
+        command = MagicMock()
+        command.product_query.get_all_names = MagicMock(return_value={"X-Burger"})
+        command.category_query.get_all = MagicMock(
+            return_value=[
+                CategoriaEntity(
+                    id=1,
+                    name="Lanches",
+                    created_at=datetime(2021, 1, 1),
+                    updated_at=datetime(2021, 1, 1),
+                )
+            ]
+        )
+        command.currency_query.get_all = MagicMock(
+            return_value=[
+                CurrencyEntity(
+                    id=1,
+                    symbol="R$",
+                    name="Real",
+                    code="BRL",
+                    created_at=datetime(2021, 1, 1),
+                    updated_at=datetime(2021, 1, 1),
+                )
+            ]
+        )
+        return command
+
+    def produto(self, name: str, value: float = 10, currency_id: int = 1):
+        return PartialProdutoEntity(
+            name=name,
+            price=PrecoValueObject(
+                value=value, currency=PartialCurrencyEntity(id=currency_id)
+            ),
+            category=PartialCategoriaEntity(id=1),
+        )
+
+    def test_rows_are_checked_against_the_name_index(self, command):
+        catalog_import = ProdutoImport(command)
+
+        catalog_import.add_batch(
+            [
+                (1, self.produto("x-burger ")),
+                (2, self.produto("X-Salada")),
+                (3, self.produto("x-salada")),
+                (4, self.produto("X-Bacon", currency_id=2)),
+                (5, "value: Field required"),
+            ]
+        )
+        report = catalog_import.finish()
+
+        created = command.create_products.call_args.args[0]
+        assert [produto.name for produto in created] == ["X-Salada"]
+        assert report.created == 1
+        assert [(error.row, error.error) for error in report.errors] == [
+            (1, "Já existe um produto com esse nome"),
+            (3, "Já existe um produto com esse nome"),
+            (4, "Moeda não encontrada"),
+            (5, "value: Field required"),
+        ]
+
+    def test_failed_batch_is_reported_per_row(self, command):
+        command.create_products = MagicMock(side_effect=RuntimeError("conexão"))
+        catalog_import = ProdutoImport(command)
+
+        catalog_import.add_batch([(1, self.produto("X-Salada"))])
+        catalog_import.add_batch([(2, self.produto("X-Salada"))])
+        report = catalog_import.finish()
+
+        assert report.created == 0
+        assert [error.error for error in report.errors] == [
+            "Falha ao inserir o lote: conexão",
+            "Falha ao inserir o lote: conexão",
+        ]
@@ -6,17 +6,30 @@ import pytest
 
 from src.core.domain.aggregates.produto_aggregate import ProdutoAggregate
 from src.core.domain.entities.produto_entity import PartialProdutoEntity, ProdutoEntity
-from src.core.domain.entities.categoria_entity import CategoriaEntity
-from src.core.domain.entities.currency_entity import CurrencyEntity
+from src.core.domain.entities.categoria_entity import (
+    CategoriaEntity,
+    PartialCategoriaEntity,
+)
+from src.core.domain.entities.currency_entity import (
+    CurrencyEntity,
+    PartialCurrencyEntity,
+)
 from src.core.domain.entities.produto_escolhido_entity import (
     PartialProdutoEscolhidoEntity,
 )
 from src.core.domain.value_objects.preco_value_object import PrecoValueObject
+from src.core.domain.value_objects.produto_state_value_object import (
+    ProdutoStateValueObject,
+)
 
 from src.core.application.services.produto_service_command import ProductServiceCommand
+from src.core.helpers.exceptions.concurrency_conflict_error import (
+    ConcurrencyConflictError,
+)
 from src.core.helpers.exceptions.incorrect_product_error import IncorrectProductError
 from src.core.helpers.exceptions.item_not_found_error import ItemNotFoundError
 from src.core.helpers.options.add_purchase_options import AddPurchaseOptions
+from src.core.helpers.options.produto_bulk_options import ProdutoBulkOptions
 
 
 class TestProductServiceCommand:
@@ -98,10 +111,10 @@ class TestProductServiceCommand:
         product_service.product_repository.create = MagicMock(
             return_value=expected_result
         )
-        product_service.product_query.find = MagicMock(return_value=[])
+        product_service.product_query.exists_by_name = MagicMock(return_value=False)
 
         result = product_service.create_product(product)
-        product_service.product_query.find.assert_called_once()
+        product_service.product_query.exists_by_name.assert_called_once_with("produto")
         product_service.product_repository.create.assert_called_once()
         assert result == expected_result
 
@@ -118,10 +131,10 @@ class TestProductServiceCommand:
         product_service.product_repository.create = MagicMock(
             return_value=expected_result
         )
-        product_service.product_query.find = MagicMock(return_value=[])
+        product_service.product_query.exists_by_name = MagicMock(return_value=False)
 
         result = product_service.create_product(product)
-        product_service.product_query.find.assert_called_once()
+        product_service.product_query.exists_by_name.assert_called_once_with("produto")
         product_service.product_repository.create.assert_called_once()
         assert result == expected_result
 
@@ -134,334 +147,372 @@ class TestProductServiceCommand:
             price=preco,
             is_active=False,
         )
-        product_service.product_query.find = MagicMock(return_value=[product])
+        product_service.product_query.exists_by_name = MagicMock(return_value=True)
 
         with pytest.raises(ValueError, match="Já existe um produto com esse nome"):
             product_service.create_product(product)
-        product_service.product_query.find.assert_called_once()
+        product_service.product_query.exists_by_name.assert_called_once()
         product_service.product_repository.create.assert_not_called()
 
-    def test_activate_product_successfully(
-        self,
-        product_service: ProductServiceCommand,
-        preco: PrecoValueObject,
+    def test_create_product_block_for_missing_category(
+        self, product_service: ProductServiceCommand, preco: PrecoValueObject
     ):
-        product = ProdutoEntity(
-            id=1,
+        product = PartialProdutoEntity(
             name="produto",
-            description="produto_test_mock",
             price=preco,
-            category=CategoriaEntity(
-                name="categoria",
-                id=1,
-                created_at=datetime(2021, 1, 1),
-                updated_at=datetime(2021, 1, 1),
-            ),
-            is_active=False,
-            created_at=datetime(2021, 1, 1),
-            updated_at=datetime(2021, 1, 1),
-            components=[PartialProdutoEntity(id=2), PartialProdutoEntity(id=3)],
-            allow_components=True,
+            category=PartialCategoriaEntity(id=9),
         )
+        product_service.product_query.exists_by_name = MagicMock(return_value=False)
+        product_service.category_query.get = MagicMock(return_value=None)
+
+        with pytest.raises(ValueError, match="Categoria não encontrada"):
+            product_service.create_product(product)
+        product_service.product_repository.create.assert_not_called()
+
+    def test_create_product_block_for_missing_currency(
+        self, product_service: ProductServiceCommand, preco: PrecoValueObject
+    ):
+        product = PartialProdutoEntity(name="produto", price=preco)
+        product_service.product_query.exists_by_name = MagicMock(return_value=False)
+        product_service.currency_query.get = MagicMock(return_value=None)
+
+        with pytest.raises(ValueError, match="Moeda não encontrada"):
+            product_service.create_product(product)
+        product_service.product_repository.create.assert_not_called()
+
+    def test_activate_product_successfully(
+        self,
+        product_service: ProductServiceCommand,
+    ):
         expected_result = "mocked_product_aggregate"
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=product)
-        )
-        product_service.product_repository.update = MagicMock(
-            return_value=expected_result
+        product_service.product_repository.set_active_in_bulk = MagicMock(
+            return_value=[1]
         )
-        result = product_service.activate_product(product.id)
+        product_service.product_query.get = MagicMock(return_value=expected_result)
+        result = product_service.activate_product(1)
         assert result == expected_result
-        product_service.product_query.get.assert_called_once()
-        product_service.product_repository.update.assert_called_once_with(product)
-        assert product.is_active is True
+        product_service.product_repository.set_active_in_bulk.assert_called_once_with(
+            ProdutoBulkOptions(ids=[1]), True
+        )
+        product_service.product_query.find_states.assert_not_called()
+        product_service.product_query.get.assert_called_once_with(1)
 
     def test_activate_product_blocked_because_no_product_found(
         self,
         product_service: ProductServiceCommand,
     ):
-        product_service.product_query.get = MagicMock(return_value=None)
-        product_service.product_repository.update = MagicMock(return_value=None)
+        product_service.product_repository.set_active_in_bulk = MagicMock(
+            return_value=[]
+        )
+        product_service.product_query.find_states = MagicMock(return_value=[])
         with pytest.raises(ValueError, match="Produto não encontrado"):
             product_service.activate_product(1)
-        product_service.product_query.get.assert_called_once()
-        product_service.product_repository.update.assert_not_called()
+        product_service.product_query.get.assert_not_called()
 
     def test_activate_product_blocked_because_already_active(
         self,
         product_service: ProductServiceCommand,
-        preco: PrecoValueObject,
     ):
-        product = ProdutoEntity(
-            id=1,
-            name="produto",
-            description="produto_test_mock",
-            price=preco,
-            category=CategoriaEntity(
-                name="categoria",
-                id=1,
-                created_at=datetime(2021, 1, 1),
-                updated_at=datetime(2021, 1, 1),
-            ),
-            is_active=True,
-            created_at=datetime(2021, 1, 1),
-            updated_at=datetime(2021, 1, 1),
-            components=[PartialProdutoEntity(id=2), PartialProdutoEntity(id=3)],
+        product_service.product_repository.set_active_in_bulk = MagicMock(
+            return_value=[]
         )
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=product)
+        product_service.product_query.find_states = MagicMock(
+            return_value=[
+                ProdutoStateValueObject(
+                    id=1,
+                    is_active=True,
+                    has_category=True,
+                    has_price=True,
+                    has_currency=True,
+                )
+            ]
         )
-        product_service.product_repository.update = MagicMock(return_value=None)
         with pytest.raises(ValueError, match="Produto já está ativo"):
             product_service.activate_product(1)
-        product_service.product_query.get.assert_called_once()
-        product_service.product_repository.update.assert_not_called()
+        product_service.product_query.find_states.assert_called_once_with(
+            ProdutoBulkOptions(ids=[1])
+        )
+        product_service.product_query.get.assert_not_called()
 
     def test_activate_product_blocked_because_no_category(
         self,
         product_service: ProductServiceCommand,
-        preco: PrecoValueObject,
     ):
-        product = ProdutoEntity(
-            id=1,
-            name="produto",
-            description="produto_test_mock",
-            price=preco,
-            category=None,
-            is_active=False,
-            created_at=datetime(2021, 1, 1),
-            updated_at=datetime(2021, 1, 1),
-            components=[PartialProdutoEntity(id=2), PartialProdutoEntity(id=3)],
+        product_service.product_repository.set_active_in_bulk = MagicMock(
+            return_value=[]
         )
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=product)
+        product_service.product_query.find_states = MagicMock(
+            return_value=[
+                ProdutoStateValueObject(
+                    id=1,
+                    is_active=False,
+                    has_category=False,
+                    has_price=True,
+                    has_currency=True,
+                )
+            ]
         )
-        product_service.product_repository.update = MagicMock(return_value=None)
         with pytest.raises(ValueError, match="Produto não possui categoria"):
             product_service.activate_product(1)
-        product_service.product_query.get.assert_called_once()
-        product_service.product_repository.update.assert_not_called()
+        product_service.product_query.find_states.assert_called_once_with(
+            ProdutoBulkOptions(ids=[1])
+        )
+        product_service.product_query.get.assert_not_called()
 
     def test_activate_product_blocked_because_no_price(
         self,
         product_service: ProductServiceCommand,
     ):
-        product = ProdutoEntity(
-            id=1,
-            name="produto",
-            description="produto_test_mock",
-            price=None,
-            category=CategoriaEntity(
-                name="categoria",
-                id=1,
-                created_at=datetime(2021, 1, 1),
-                updated_at=datetime(2021, 1, 1),
-            ),
-            is_active=False,
-            created_at=datetime(2021, 1, 1),
-            updated_at=datetime(2021, 1, 1),
-            components=[PartialProdutoEntity(id=2), PartialProdutoEntity(id=3)],
+        product_service.product_repository.set_active_in_bulk = MagicMock(
+            return_value=[]
         )
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=product)
+        product_service.product_query.find_states = MagicMock(
+            return_value=[
+                ProdutoStateValueObject(
+                    id=1,
+                    is_active=False,
+                    has_category=True,
+                    has_price=False,
+                    has_currency=False,
+                )
+            ]
         )
-        product_service.product_repository.update = MagicMock(return_value=None)
         with pytest.raises(ValueError, match="Produto não possui preço"):
             product_service.activate_product(1)
-        product_service.product_query.get.assert_called_once()
-        product_service.product_repository.update.assert_not_called()
+        product_service.product_query.find_states.assert_called_once_with(
+            ProdutoBulkOptions(ids=[1])
+        )
+        product_service.product_query.get.assert_not_called()
 
     def test_deactivate_product_successfully(
         self,
         product_service: ProductServiceCommand,
     ):
-        product = ProdutoEntity(
-            id=1,
-            name="produto",
-            description="produto_test_mock",
-            price=None,
-            category=CategoriaEntity(
-                name="categoria",
-                id=1,
-                created_at=datetime(2021, 1, 1),
-                updated_at=datetime(2021, 1, 1),
-            ),
-            is_active=True,
-            created_at=datetime(2021, 1, 1),
-            updated_at=datetime(2021, 1, 1),
-            components=[PartialProdutoEntity(id=2), PartialProdutoEntity(id=3)],
-        )
         expect_result = "mocked_product_aggregate"
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=product)
-        )
-        product_service.product_repository.update = MagicMock(
-            return_value=expect_result
+        product_service.product_repository.set_active_in_bulk = MagicMock(
+            return_value=[1]
         )
+        product_service.product_query.get = MagicMock(return_value=expect_result)
         result = product_service.deactivate_product(1)
-        product_service.product_query.get.assert_called_once()
-        product_service.product_repository.update.assert_called_once_with(product)
+        product_service.product_repository.set_active_in_bulk.assert_called_once_with(
+            ProdutoBulkOptions(ids=[1]), False
+        )
+        product_service.product_query.find_states.assert_not_called()
         assert result == expect_result
-        assert product.is_active is False
 
     def test_deactivate_product_block_because_already_inactive(
         self,
         product_service: ProductServiceCommand,
     ):
-        product = ProdutoEntity(
-            id=1,
-            name="produto",
-            description="produto_test_mock",
-            price=None,
-            category=CategoriaEntity(
-                name="categoria",
-                id=1,
-                created_at=datetime(2021, 1, 1),
-                updated_at=datetime(2021, 1, 1),
-            ),
-            is_active=False,
-            created_at=datetime(2021, 1, 1),
-            updated_at=datetime(2021, 1, 1),
-            components=[PartialProdutoEntity(id=2), PartialProdutoEntity(id=3)],
+        product_service.product_repository.set_active_in_bulk = MagicMock(
+            return_value=[]
         )
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=product)
+        product_service.product_query.find_states = MagicMock(
+            return_value=[
+                ProdutoStateValueObject(
+                    id=1,
+                    is_active=False,
+                    has_category=True,
+                    has_price=True,
+                    has_currency=True,
+                )
+            ]
         )
-        product_service.product_repository.update = MagicMock(return_value=None)
         with pytest.raises(ValueError, match="Produto já está inativo"):
             product_service.deactivate_product(1)
-        product_service.product_query.get.assert_called_once()
-        product_service.product_repository.update.assert_not_called()
-        assert product.is_active is False
+        product_service.product_query.find_states.assert_called_once_with(
+            ProdutoBulkOptions(ids=[1])
+        )
+        product_service.product_query.get.assert_not_called()
+
+    def test_activate_products_reports_rejections(
+        self, product_service: ProductServiceCommand
+    ):
+        # arrange
+        product_service.product_repository.set_active_in_bulk = MagicMock(
+            return_value=[1]
+        )
+        product_service.product_query.find_states = MagicMock(
+            return_value=[
+                ProdutoStateValueObject(
+                    id=1,
+                    is_active=True,
+                    has_category=True,
+                    has_price=True,
+                    has_currency=True,
+                ),
+                ProdutoStateValueObject(
+                    id=2,
+                    is_active=True,
+                    has_category=True,
+                    has_price=True,
+                    has_currency=True,
+                ),
+                ProdutoStateValueObject(
+                    id=3,
+                    is_active=False,
+                    has_category=True,
+                    has_price=False,
+                    has_currency=False,
+                ),
+            ]
+        )
+        options = ProdutoBulkOptions(ids=[1, 2, 3, 4])
+
+        # act
+        result = product_service.activate_products(options)
+
+        # assert
+        assert result.changed == [1]
+        assert [(item.id, item.reason) for item in result.rejected] == [
+            (2, "Produto já está ativo"),
+            (3, "Produto não possui preço"),
+            (4, "Produto não encontrado"),
+        ]
+        product_service.product_repository.set_active_in_bulk.assert_called_once_with(
+            options, True
+        )
+
+    def test_deactivate_products_skips_states_when_every_id_changed(
+        self, product_service: ProductServiceCommand
+    ):
+        # arrange
+        product_service.product_repository.set_active_in_bulk = MagicMock(
+            return_value=[2, 1]
+        )
+        product_service.product_query.find_states = MagicMock()
+
+        # act
+        result = product_service.deactivate_products(ProdutoBulkOptions(ids=[1, 2]))
+
+        # assert
+        assert result.changed == [1, 2]
+        assert result.rejected == []
+        product_service.product_query.find_states.assert_not_called()
+
+    def test_bulk_transitions_require_a_target(
+        self, product_service: ProductServiceCommand
+    ):
+        with pytest.raises(ValueError, match="Informe os ids ou um filtro"):
+            product_service.activate_products(
+                ProdutoBulkOptions(price_range=(None, None))
+            )
+        product_service.product_repository.set_active_in_bulk.assert_not_called()
+
+    def test_reprice_products_validates_the_change(
+        self, product_service: ProductServiceCommand
+    ):
+        options = ProdutoBulkOptions(category="Lanches")
+        with pytest.raises(ValueError, match="novo preço ou o percentual"):
+            product_service.reprice_products(options)
+        with pytest.raises(ValueError, match="novo preço ou o percentual"):
+            product_service.reprice_products(options, value=10, percentage=5)
+        with pytest.raises(ValueError, match="maior que zero"):
+            product_service.reprice_products(options, value=0)
+        with pytest.raises(ValueError, match="-100%"):
+            product_service.reprice_products(options, percentage=-100)
+        product_service.product_repository.reprice_in_bulk.assert_not_called()
 
     def test_delete_product_successfully(
         self,
         product_service: ProductServiceCommand,
     ):
-        product = ProdutoAggregate(
-            product=ProdutoEntity(
-                id=1,
-                name="produto",
-                description="produto_test_mock",
-                price=None,
-                category=CategoriaEntity(
-                    name="categoria",
+        product_service.product_query.find_states = MagicMock(
+            return_value=[
+                ProdutoStateValueObject(
                     id=1,
-                    created_at=datetime(2021, 1, 1),
-                    updated_at=datetime(2021, 1, 1),
-                ),
-                is_active=False,
-                created_at=datetime(2021, 1, 1),
-                updated_at=datetime(2021, 1, 1),
-                components=[PartialProdutoEntity(id=2), PartialProdutoEntity(id=3)],
-            ),
-            orders=[],
-        )
-        product_service.product_repository.get_by_product_id = MagicMock(
-            return_value=product
+                    is_active=False,
+                    has_category=True,
+                    has_price=False,
+                    has_currency=False,
+                )
+            ]
         )
+        product_service.product_query.has_orders = MagicMock(return_value=False)
         product_service.product_repository.delete = MagicMock(return_value=None)
         product_service.delete_product(1)
-        product_service.product_repository.get_by_product_id.assert_called_once()
+        product_service.product_query.find_states.assert_called_once_with(
+            ProdutoBulkOptions(ids=[1])
+        )
+        product_service.product_query.has_orders.assert_called_once_with(1)
         product_service.product_repository.delete.assert_called_once()
 
     def test_delete_product_fail_because_of_associated_orders(
         self,
         product_service: ProductServiceCommand,
     ):
-        product = ProdutoAggregate(
-            product=ProdutoEntity(
-                id=1,
-                name="produto",
-                description="produto_test_mock",
-                price=None,
-                category=CategoriaEntity(
-                    name="categoria",
+        product_service.product_query.find_states = MagicMock(
+            return_value=[
+                ProdutoStateValueObject(
                     id=1,
-                    created_at=datetime(2021, 1, 1),
-                    updated_at=datetime(2021, 1, 1),
-                ),
-                is_active=False,
-                created_at=datetime(2021, 1, 1),
-                updated_at=datetime(2021, 1, 1),
-                components=[PartialProdutoEntity(id=2), PartialProdutoEntity(id=3)],
-            ),
-            orders=[1],
-        )
-        product_service.product_repository.get_by_product_id = MagicMock(
-            return_value=product
+                    is_active=False,
+                    has_category=True,
+                    has_price=False,
+                    has_currency=False,
+                )
+            ]
         )
+        product_service.product_query.has_orders = MagicMock(return_value=True)
         product_service.product_repository.delete = MagicMock(return_value=None)
         with pytest.raises(
             ValueError, match="Produto possui pedidos associados, impossível deletar!"
         ):
             product_service.delete_product(1)
-            product_service.product_repository.get_by_product_id.assert_called_once()
-            product_service.product_repository.delete.assert_not_called()
+        product_service.product_repository.delete.assert_not_called()
 
     def test_delete_product_fail_because_product_is_active(
         self,
         product_service: ProductServiceCommand,
     ):
-        product = ProdutoAggregate(
-            product=ProdutoEntity(
-                id=1,
-                name="produto",
-                description="produto_test_mock",
-                price=None,
-                category=CategoriaEntity(
-                    name="categoria",
+        product_service.product_query.find_states = MagicMock(
+            return_value=[
+                ProdutoStateValueObject(
                     id=1,
-                    created_at=datetime(2021, 1, 1),
-                    updated_at=datetime(2021, 1, 1),
-                ),
-                is_active=True,
-                created_at=datetime(2021, 1, 1),
-                updated_at=datetime(2021, 1, 1),
-                components=[PartialProdutoEntity(id=2), PartialProdutoEntity(id=3)],
-            ),
-            orders=[],
-        )
-        product_service.product_repository.get_by_product_id = MagicMock(
-            return_value=product
+                    is_active=True,
+                    has_category=True,
+                    has_price=False,
+                    has_currency=False,
+                )
+            ]
         )
+        product_service.product_query.has_orders = MagicMock(return_value=False)
         product_service.product_repository.delete = MagicMock(return_value=None)
         with pytest.raises(ValueError, match="Produto ativo, impossível deletar!"):
             product_service.delete_product(1)
-            product_service.product_repository.get_by_product_id.assert_called_once()
-            product_service.product_repository.delete.assert_not_called()
+        product_service.product_query.has_orders.assert_not_called()
+        product_service.product_repository.delete.assert_not_called()
 
     def test_delete_product_fail_because_product_not_found(
         self,
         product_service: ProductServiceCommand,
     ):
-        product_service.product_repository.get_by_product_id = MagicMock(
-            return_value=None
-        )
+        product_service.product_query.find_states = MagicMock(return_value=[])
         product_service.product_repository.delete = MagicMock(return_value=None)
         with pytest.raises(ValueError, match="Produto não encontrado"):
             product_service.delete_product(1)
-            product_service.product_repository.get_by_product_id.assert_called_once()
-            product_service.product_repository.delete.assert_not_called()
+        product_service.product_repository.delete.assert_not_called()
 
     def test_update_product_successfully_change_name(
         self, product_service: ProductServiceCommand, produto_entity: ProdutoEntity
     ):
         # arrange
         produto = produto_entity
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=produto)
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[ProdutoAggregate(product=produto)]
         )
         input_product = deepcopy(produto)
         input_product.name = "produto_novo"
         input_product.allow_components = True
-        product_service.product_repository.update = MagicMock(return_value=None)
-        product_service.product_query.find = MagicMock(return_value=[])
+        product_service.product_repository.update = MagicMock()
+        product_service.product_query.exists_by_name = MagicMock(return_value=False)
         # act
         product_service.update_product(input_product)
 
         # assert
-        product_service.product_query.get.assert_called_once()
+        product_service.product_query.get_all_ids.assert_called_once()
+        product_service.product_query.exists_by_name.assert_called_once_with(
+            "produto_novo", exclude_id=produto.id
+        )
         product_service.product_repository.update.assert_called_once()
 
     def test_update_product_successfully_change_category(
@@ -469,8 +520,8 @@ class TestProductServiceCommand:
     ):
         # arrange
         produto = produto_entity
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=produto)
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[ProdutoAggregate(product=produto)]
         )
         input_product = deepcopy(produto)
         input_product.category = CategoriaEntity(
@@ -480,13 +531,13 @@ class TestProductServiceCommand:
             updated_at=datetime(2021, 1, 1),
         )
         input_product.allow_components = True
-        product_service.product_repository.update = MagicMock(return_value=None)
+        product_service.product_repository.update = MagicMock()
 
         # act
         product_service.update_product(input_product)
 
         # assert
-        product_service.product_query.get.assert_called_once()
+        product_service.product_query.get_all_ids.assert_called_once()
         product_service.product_repository.update.assert_called_once()
 
     def test_update_product_successfully_change_price(
@@ -494,8 +545,8 @@ class TestProductServiceCommand:
     ):
         # arrange
         produto = produto_entity
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=produto)
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[ProdutoAggregate(product=produto)]
         )
         input_product = deepcopy(produto)
         input_product.price = PrecoValueObject(
@@ -510,33 +561,83 @@ class TestProductServiceCommand:
             ),
         )
         input_product.allow_components = True
-        product_service.product_repository.update = MagicMock(return_value=None)
+        product_service.product_repository.update = MagicMock()
 
         # act
         product_service.update_product(input_product)
 
         # assert
-        product_service.product_query.get.assert_called_once()
+        product_service.product_query.get_all_ids.assert_called_once()
         product_service.product_repository.update.assert_called_once()
 
+    def test_update_product_resolves_a_changed_currency(
+        self, product_service: ProductServiceCommand, produto_entity: ProdutoEntity
+    ):
+        produto = produto_entity
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[ProdutoAggregate(product=produto)]
+        )
+        dollar = CurrencyEntity(
+            id=2,
+            symbol="US$",
+            name="Dólar",
+            code="USD",
+            created_at=datetime(2021, 1, 1),
+            updated_at=datetime(2021, 1, 1),
+        )
+        product_service.currency_query.get = MagicMock(return_value=dollar)
+        input_product = deepcopy(produto)
+        input_product.price = PrecoValueObject(
+            value=12, currency=PartialCurrencyEntity(id=2)
+        )
+        input_product.allow_components = True
+        product_service.product_repository.update = MagicMock(
+            side_effect=lambda product: ProdutoAggregate(product=product)
+        )
+
+        result = product_service.update_product(input_product)
+
+        product_service.currency_query.get.assert_called_once_with(2)
+        assert result.product.price.currency.code == "USD"
+        assert result.product.price.currency.symbol == "US$"
+
+    def test_update_product_fails_when_the_new_currency_is_not_found(
+        self, product_service: ProductServiceCommand, produto_entity: ProdutoEntity
+    ):
+        produto = produto_entity
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[ProdutoAggregate(product=produto)]
+        )
+        product_service.currency_query.get = MagicMock(return_value=None)
+        input_product = deepcopy(produto)
+        input_product.price = PrecoValueObject(
+            value=12, currency=PartialCurrencyEntity(id=2)
+        )
+        input_product.allow_components = True
+        product_service.product_repository.update = MagicMock()
+
+        with pytest.raises(ValueError, match="Moeda não encontrada"):
+            product_service.update_product(input_product)
+        product_service.product_repository.update.assert_not_called()
+
     def test_update_product_succefully_change_allow_components_to_false(
         self, product_service: ProductServiceCommand, produto_entity: ProdutoEntity
     ):
         # arrange
         produto = produto_entity
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=produto)
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[ProdutoAggregate(product=produto)]
         )
         input_product = deepcopy(produto)
         input_product.allow_components = False
         input_product.components = []
-        product_service.product_repository.update = MagicMock(return_value=None)
+        product_service.product_repository.update = MagicMock()
 
         # act
         product_service.update_product(input_product)
 
         # assert
-        product_service.product_query.get.assert_called_once()
+        product_service.product_query.get_all_ids.assert_called_once()
         product_service.product_repository.update.assert_called_once()
 
     def test_update_product_succefully_change_allow_components_to_true(
@@ -544,18 +645,18 @@ class TestProductServiceCommand:
     ):
         # arrange
         produto = produto_entity
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=produto)
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[ProdutoAggregate(product=produto)]
         )
         input_product = deepcopy(produto)
         input_product.allow_components = True
-        product_service.product_repository.update = MagicMock(return_value=None)
+        product_service.product_repository.update = MagicMock()
 
         # act
         product_service.update_product(input_product)
 
         # assert
-        product_service.product_query.get.assert_called_once()
+        product_service.product_query.get_all_ids.assert_called_once()
         product_service.product_repository.update.assert_called_once()
 
     def test_update_product_fail_because_product_not_found(
@@ -563,17 +664,17 @@ class TestProductServiceCommand:
     ):
         # arrange
         produto = produto_entity
-        product_service.product_query.get = MagicMock(return_value=None)
+        product_service.product_query.get_all_ids = MagicMock(return_value=[])
         input_product = deepcopy(produto)
         input_product.name = "produto_novo"
-        product_service.product_repository.update = MagicMock(return_value=None)
+        product_service.product_repository.update = MagicMock()
 
         # act
         with pytest.raises(ValueError, match="Produto não encontrado"):
             product_service.update_product(input_product)
 
         # assert
-        product_service.product_query.get.assert_called_once()
+        product_service.product_query.get_all_ids.assert_called_once()
         product_service.product_repository.update.assert_not_called()
 
     def test_update_product_fail_because_name_already_exists(
@@ -583,19 +684,60 @@ class TestProductServiceCommand:
         produto = produto_entity
         input_product = deepcopy(produto)
         input_product.name = "produto_novo"
-        product_service.product_repository.update = MagicMock(return_value=None)
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=produto)
+        product_service.product_repository.update = MagicMock()
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[ProdutoAggregate(product=produto)]
         )
+        product_service.product_query.exists_by_name = MagicMock(return_value=True)
 
         # act
         with pytest.raises(ValueError, match="Já existe um produto com esse nome"):
             product_service.update_product(input_product)
 
         # assert
-        product_service.product_query.get.assert_called_once()
+        product_service.product_query.get_all_ids.assert_called_once()
+        product_service.product_repository.update.assert_not_called()
+
+    def test_update_product_fail_because_version_is_stale(
+        self, product_service: ProductServiceCommand, produto_entity: ProdutoEntity
+    ):
+        # arrange
+        produto = produto_entity
+        produto.version = 3
+        current = ProdutoAggregate(product=produto)
+        input_product = deepcopy(produto)
+        input_product.version = 2
+        product_service.product_repository.update = MagicMock()
+        product_service.product_query.get_all_ids = MagicMock(return_value=[current])
+
+        # act
+        with pytest.raises(ConcurrencyConflictError) as conflict:
+            product_service.update_product(input_product)
+
+        # assert
+        assert conflict.value.current is current
         product_service.product_repository.update.assert_not_called()
 
+    def test_update_product_without_version_uses_the_loaded_one(
+        self, product_service: ProductServiceCommand, produto_entity: ProdutoEntity
+    ):
+        # arrange
+        produto = produto_entity
+        produto.version = 3
+        input_product = deepcopy(produto)
+        input_product.allow_components = True
+        input_product.version = None
+        product_service.product_repository.update = MagicMock()
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[ProdutoAggregate(product=produto)]
+        )
+
+        # act
+        product_service.update_product(input_product)
+
+        # assert
+        assert product_service.product_repository.update.call_args[0][0].version == 3
+
     def test_update_product_fail_because_category_does_not_exists(
         self, product_service: ProductServiceCommand, produto_entity: ProdutoEntity
     ):
@@ -608,9 +750,9 @@ class TestProductServiceCommand:
             created_at=datetime(2021, 1, 1),
             updated_at=datetime(2021, 1, 1),
         )
-        product_service.product_repository.update = MagicMock(return_value=None)
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=produto)
+        product_service.product_repository.update = MagicMock()
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[ProdutoAggregate(product=produto)]
         )
         product_service.category_query.get = MagicMock(return_value=None)
         # act
@@ -618,7 +760,7 @@ class TestProductServiceCommand:
             product_service.update_product(input_product)
 
         # assert
-        product_service.product_query.get.assert_called_once()
+        product_service.product_query.get_all_ids.assert_called_once()
         product_service.product_repository.update.assert_not_called()
 
     def test_update_product_fail_because_price_is_invalid(
@@ -638,9 +780,9 @@ class TestProductServiceCommand:
                 updated_at=datetime(2021, 1, 1),
             ),
         )
-        product_service.product_repository.update = MagicMock(return_value=None)
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=produto)
+        product_service.product_repository.update = MagicMock()
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[ProdutoAggregate(product=produto)]
         )
 
         # act
@@ -669,8 +811,8 @@ class TestProductServiceCommand:
     ):
         # arrange
         produto = produto_entity
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=produto)
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[ProdutoAggregate(product=produto)]
         )
         input_product = deepcopy(produto)
         input_product.allow_components = True
@@ -681,7 +823,7 @@ class TestProductServiceCommand:
             created_at=datetime(2021, 1, 1),
             updated_at=datetime(2021, 1, 1),
         )
-        product_service.product_repository.update = MagicMock(return_value=None)
+        product_service.product_repository.update = MagicMock()
 
         # act
         with pytest.raises(
@@ -692,13 +834,50 @@ class TestProductServiceCommand:
         # assert
         product_service.product_repository.update.assert_not_called()
 
+    def test_update_product_fail_because_unchanged_category_is_component_and_is_trying_to_allow_components(
+        self, product_service: ProductServiceCommand, produto_entity: ProdutoEntity
+    ):
+        # arrange
+        produto = produto_entity
+        produto.allow_components = False
+        produto.components = []
+        produto.category = CategoriaEntity(
+            name="acompanhamento",
+            is_component=True,
+            id=2,
+            created_at=datetime(2021, 1, 1),
+            updated_at=datetime(2021, 1, 1),
+        )
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[ProdutoAggregate(product=produto)]
+        )
+        input_product = PartialProdutoEntity(
+            id=1,
+            name=produto.name,
+            allow_components=True,
+            price=PrecoValueObject(value=12, currency=PartialCurrencyEntity(id=1)),
+            category=PartialCategoriaEntity(id=2),
+            components=[],
+        )
+        product_service.product_repository.update = MagicMock()
+
+        # act
+        with pytest.raises(
+            ValueError, match="Um Acompanhamento não permite ter outros acompanhamentos"
+        ):
+            product_service.update_product(input_product)
+
+        # assert
+        product_service.category_query.get.assert_not_called()
+        product_service.product_repository.update.assert_not_called()
+
     def test_update_product_fail_because_does_not_allow_components_and_is_trying_add_components(
         self, product_service: ProductServiceCommand, produto_entity: ProdutoEntity
     ):
         # arrange
         produto = produto_entity
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=produto)
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[ProdutoAggregate(product=produto)]
         )
         input_product = deepcopy(produto)
         input_product.allow_components = False
@@ -713,7 +892,7 @@ class TestProductServiceCommand:
             PartialProdutoEntity(id=2),
             PartialProdutoEntity(id=3),
         ]
-        product_service.product_repository.update = MagicMock(return_value=None)
+        product_service.product_repository.update = MagicMock()
 
         # act
         with pytest.raises(
@@ -731,6 +910,7 @@ class TestProductServiceCommand:
         # arrange
         produto = produto_entity
         component_mock = deepcopy(produto)
+        component_mock.id = 4
         component_mock.category = CategoriaEntity(
             is_component=False,
             name="not_acompanhamento_mock",
@@ -738,11 +918,11 @@ class TestProductServiceCommand:
             created_at=datetime(2021, 1, 1),
             updated_at=datetime(2021, 1, 1),
         )
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=produto),
-        )
-        product_service.product_query.get_only_entity = MagicMock(
-            return_value=component_mock
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[
+                ProdutoAggregate(product=produto),
+                ProdutoAggregate(product=component_mock),
+            ]
         )
         input_product = deepcopy(produto)
         input_product.allow_components = True
@@ -753,12 +933,15 @@ class TestProductServiceCommand:
             created_at=datetime(2021, 1, 1),
             updated_at=datetime(2021, 1, 1),
         )
+        product_service.category_query.get = MagicMock(
+            return_value=input_product.category
+        )
         input_product.components = [
             PartialProdutoEntity(id=2),
             PartialProdutoEntity(id=3),
             PartialProdutoEntity(id=4),
         ]
-        product_service.product_repository.update = MagicMock(return_value=None)
+        product_service.product_repository.update = MagicMock()
 
         # act
         with pytest.raises(
@@ -784,15 +967,17 @@ class TestProductServiceCommand:
             created_at=datetime(2021, 1, 1),
             updated_at=datetime(2021, 1, 1),
         )
+        product_service.category_query.get = MagicMock(
+            return_value=input_product.category
+        )
         input_product.components = [
             PartialProdutoEntity(id=2),
             PartialProdutoEntity(id=1),
         ]
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=produto),
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[ProdutoAggregate(product=produto)]
         )
-        product_service.product_query.get_only_entity = MagicMock(return_value=produto)
-        product_service.product_repository.update = MagicMock(return_value=None)
+        product_service.product_repository.update = MagicMock()
 
         # act
         with pytest.raises(
@@ -818,11 +1003,11 @@ class TestProductServiceCommand:
             created_at=datetime(2021, 1, 1),
             updated_at=datetime(2021, 1, 1),
         )
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=produto),
-        )
-        product_service.product_query.get_only_entity = MagicMock(
-            return_value=component_mock
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[
+                ProdutoAggregate(product=produto),
+                ProdutoAggregate(product=component_mock),
+            ]
         )
         input_product = deepcopy(produto)
         input_product.allow_components = True
@@ -833,11 +1018,14 @@ class TestProductServiceCommand:
             created_at=datetime(2021, 1, 1),
             updated_at=datetime(2021, 1, 1),
         )
+        product_service.category_query.get = MagicMock(
+            return_value=input_product.category
+        )
         input_product.components = [
             PartialProdutoEntity(id=2),
             PartialProdutoEntity(id=2),
         ]
-        product_service.product_repository.update = MagicMock(return_value=None)
+        product_service.product_repository.update = MagicMock()
 
         # act
         with pytest.raises(
@@ -863,11 +1051,11 @@ class TestProductServiceCommand:
             created_at=datetime(2021, 1, 1),
             updated_at=datetime(2021, 1, 1),
         )
-        product_service.product_query.get = MagicMock(
-            return_value=ProdutoAggregate(product=produto),
-        )
-        product_service.product_query.get_only_entity = MagicMock(
-            return_value=component_mock
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[
+                ProdutoAggregate(product=produto),
+                ProdutoAggregate(product=component_mock),
+            ]
         )
         input_product = deepcopy(produto)
         input_product.allow_components = True
@@ -878,11 +1066,14 @@ class TestProductServiceCommand:
             created_at=datetime(2021, 1, 1),
             updated_at=datetime(2021, 1, 1),
         )
+        product_service.category_query.get = MagicMock(
+            return_value=input_product.category
+        )
         input_product.components = [
             PartialProdutoEntity(id=2),
             PartialProdutoEntity(id=3),
         ]
-        product_service.product_repository.update = MagicMock(return_value=None)
+        product_service.product_repository.update = MagicMock()
 
         # act
         product_service.update_product(input_product)
@@ -890,6 +1081,50 @@ class TestProductServiceCommand:
         # assert
         product_service.product_repository.update.assert_called()
 
+    def test_update_product_reuses_loaded_references_and_order_count(
+        self, product_service: ProductServiceCommand, produto_entity: ProdutoEntity
+    ):
+        # arrange
+        produto = produto_entity
+        produto.allow_components = True
+        produto.components = []
+        component_mock = deepcopy(produto)
+        component_mock.id = 3
+        component_mock.category = CategoriaEntity(
+            is_component=True,
+            name="acompanhamento_mock",
+            id=2,
+            created_at=datetime(2021, 1, 1),
+            updated_at=datetime(2021, 1, 1),
+        )
+        product_service.product_query.get_all_ids = MagicMock(
+            return_value=[
+                ProdutoAggregate(product=produto, order_count=2),
+                ProdutoAggregate(product=component_mock),
+            ]
+        )
+        input_product = PartialProdutoEntity(
+            id=1,
+            name="produto",
+            allow_components=True,
+            price=PrecoValueObject(value=12, currency=PartialCurrencyEntity(id=1)),
+            category=PartialCategoriaEntity(id=1),
+            components=[PartialProdutoEntity(id=3)],
+        )
+        product_service.product_repository.update = MagicMock(
+            side_effect=lambda product: ProdutoAggregate(product=product)
+        )
+
+        # act
+        result = product_service.update_product(input_product)
+
+        # assert
+        assert result.order_count == 2
+        assert result.product.category is produto.category
+        assert result.product.price.currency is produto.price.currency
+        assert result.product.components == [component_mock]
+        assert result.product.components[0].name == "produto"
+
     def test_get_all_by_purchase_has_products(
         self, product_service: ProductServiceCommand, produto_entity: ProdutoEntity
     ):
@@ -1052,7 +1287,8 @@ class TestProductServiceCommand:
         main_product.components = [PartialProdutoEntity(id=2)]
         component_product = deepcopy(produto_entity)
         component_product.id = 2
-        set_product = ProdutoAggregate(product=main_product, orders=[1])
+        set_product = ProdutoAggregate(product=main_product, order_count=1)
+        product_service.product_query.count_orders = MagicMock(return_value={1: 1})
 
         product_service.product_query.get_all_ids = MagicMock(
             return_value=[
@@ -1060,10 +1296,9 @@ class TestProductServiceCommand:
                 ProdutoAggregate(product=component_product),
             ]
         )
-        product_service.product_query.get_by_purchase_id = MagicMock(return_value=None)
         product_service.product_repository.delete = MagicMock(return_value=None)
-        product_service.product_repository.set_selected_product_and_components = (
-            MagicMock(return_value=set_product)
+        product_service.product_repository.set_selected_products_and_components = (
+            MagicMock(return_value=[10])
         )
 
         options = [AddPurchaseOptions(product_id=1, components=[2])]
@@ -1077,7 +1312,9 @@ class TestProductServiceCommand:
 
         product_service.product_query.get_all_ids.assert_called_once()
         product_service.product_repository.delete.assert_not_called()
-        product_service.product_repository.set_selected_product_and_components.assert_called_once()
+        product_service.product_repository.set_selected_products_and_components.assert_called_once_with(
+            1, options
+        )
 
     def test_add_purchase_success_change_component_from_product(
         self, product_service: ProductServiceCommand, produto_entity: ProdutoEntity
@@ -1091,7 +1328,8 @@ class TestProductServiceCommand:
         ]
         component_product = deepcopy(produto_entity)
         component_product.id = 2
-        set_product = ProdutoAggregate(product=main_product, orders=[1])
+        set_product = ProdutoAggregate(product=main_product, order_count=1)
+        product_service.product_query.count_orders = MagicMock(return_value={1: 1})
 
         product_service.product_query.get_all_ids = MagicMock(
             return_value=[
@@ -1099,12 +1337,9 @@ class TestProductServiceCommand:
                 ProdutoAggregate(product=component_product),
             ]
         )
-        product_service.product_query.get_by_purchase_id = MagicMock(
-            return_value=[ProdutoAggregate(product=main_product)]
-        )
         product_service.product_repository.delete = MagicMock(return_value=None)
-        product_service.product_repository.set_selected_product_and_components = (
-            MagicMock(return_value=set_product)
+        product_service.product_repository.set_selected_products_and_components = (
+            MagicMock(return_value=[10])
         )
 
         options = [AddPurchaseOptions(product_id=1, components=[2])]
@@ -1117,8 +1352,10 @@ class TestProductServiceCommand:
         assert result[0] == set_product
 
         product_service.product_query.get_all_ids.assert_called_once()
-        product_service.product_repository.delete.assert_called_once()
-        product_service.product_repository.set_selected_product_and_components.assert_called_once()
+        product_service.product_repository.delete.assert_not_called()
+        product_service.product_repository.set_selected_products_and_components.assert_called_once_with(
+            1, options
+        )
 
     def test_add_purchase_success_add_component_to_product(
         self, product_service: ProductServiceCommand, produto_entity: ProdutoEntity
@@ -1134,7 +1371,8 @@ class TestProductServiceCommand:
         component_product.id = 2
         second_component_product = deepcopy(produto_entity)
         second_component_product.id = 3
-        set_product = ProdutoAggregate(product=main_product, orders=[1])
+        set_product = ProdutoAggregate(product=main_product, order_count=1)
+        product_service.product_query.count_orders = MagicMock(return_value={1: 1})
 
         product_service.product_query.get_all_ids = MagicMock(
             return_value=[
@@ -1143,12 +1381,9 @@ class TestProductServiceCommand:
                 ProdutoAggregate(product=second_component_product),
             ]
         )
-        product_service.product_query.get_by_purchase_id = MagicMock(
-            return_value=[ProdutoAggregate(product=main_product)]
-        )
         product_service.product_repository.delete = MagicMock(return_value=None)
-        product_service.product_repository.set_selected_product_and_components = (
-            MagicMock(return_value=set_product)
+        product_service.product_repository.set_selected_products_and_components = (
+            MagicMock(return_value=[10])
         )
 
         options = [AddPurchaseOptions(product_id=1, components=[2, 3])]
@@ -1161,8 +1396,10 @@ class TestProductServiceCommand:
         assert result[0] == set_product
 
         product_service.product_query.get_all_ids.assert_called_once()
-        product_service.product_repository.delete.assert_called_once()
-        product_service.product_repository.set_selected_product_and_components.assert_called_once()
+        product_service.product_repository.delete.assert_not_called()
+        product_service.product_repository.set_selected_products_and_components.assert_called_once_with(
+            1, options
+        )
 
     def test_add_purchase_success_remove_component_from_product(
         self, product_service: ProductServiceCommand, produto_entity: ProdutoEntity
@@ -1177,7 +1414,8 @@ class TestProductServiceCommand:
         component_product = deepcopy(produto_entity)
         component_product.id = 2
 
-        set_product = ProdutoAggregate(product=main_product, orders=[1])
+        set_product = ProdutoAggregate(product=main_product, order_count=1)
+        product_service.product_query.count_orders = MagicMock(return_value={1: 1})
 
         product_service.product_query.get_all_ids = MagicMock(
             return_value=[
@@ -1185,12 +1423,9 @@ class TestProductServiceCommand:
                 ProdutoAggregate(product=component_product),
             ]
         )
-        product_service.product_query.get_by_purchase_id = MagicMock(
-            return_value=[ProdutoAggregate(product=main_product)]
-        )
         product_service.product_repository.delete = MagicMock(return_value=None)
-        product_service.product_repository.set_selected_product_and_components = (
-            MagicMock(return_value=set_product)
+        product_service.product_repository.set_selected_products_and_components = (
+            MagicMock(return_value=[10])
         )
 
         options = [AddPurchaseOptions(product_id=1, components=[2])]
@@ -1203,8 +1438,10 @@ class TestProductServiceCommand:
         assert result[0] == set_product
 
         product_service.product_query.get_all_ids.assert_called_once()
-        product_service.product_repository.delete.assert_called_once()
-        product_service.product_repository.set_selected_product_and_components.assert_called_once()
+        product_service.product_repository.delete.assert_not_called()
+        product_service.product_repository.set_selected_products_and_components.assert_called_once_with(
+            1, options
+        )
 
     def test_add_purchase_success_remove_product_from_purchase(
         self, product_service: ProductServiceCommand, produto_entity: ProdutoEntity
@@ -1221,19 +1458,17 @@ class TestProductServiceCommand:
         component_product = deepcopy(produto_entity)
         component_product.id = 2
 
-        set_product = ProdutoAggregate(product=secondary_product, orders=[1])
+        set_product = ProdutoAggregate(product=secondary_product, order_count=1)
+        product_service.product_query.count_orders = MagicMock(return_value={4: 1})
 
         product_service.product_query.get_all_ids = MagicMock(
             return_value=[
                 ProdutoAggregate(product=secondary_product),
             ]
         )
-        product_service.product_query.get_by_purchase_id = MagicMock(
-            return_value=[ProdutoAggregate(product=main_product)]
-        )
         product_service.product_repository.delete = MagicMock(return_value=None)
-        product_service.product_repository.set_selected_product_and_components = (
-            MagicMock(return_value=set_product)
+        product_service.product_repository.set_selected_products_and_components = (
+            MagicMock(return_value=[10])
         )
 
         options = [AddPurchaseOptions(product_id=4)]
@@ -1246,5 +1481,7 @@ class TestProductServiceCommand:
         assert result[0] == set_product
 
         product_service.product_query.get_all_ids.assert_called_once()
-        product_service.product_repository.delete.assert_called_once()
-        product_service.product_repository.set_selected_product_and_components.assert_called_once()
+        product_service.product_repository.delete.assert_not_called()
+        product_service.product_repository.set_selected_products_and_components.assert_called_once_with(
+            1, options
+        )
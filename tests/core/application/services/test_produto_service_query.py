@@ -0,0 +1,43 @@
+from unittest.mock import MagicMock
+import pytest
+
+from src.core.application.services.produto_service_query import ProdutoServiceQuery
+
+
+class TestProdutoServiceQuery:
+    @pytest.fixture
+    def product_query(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def product_service(self, product_query):
+        return ProdutoServiceQuery(
+            product_query=product_query,
+            category_query=MagicMock(),
+            currency_query=MagicMock(),
+        )
+
+    def test_orders_returns_the_cursor_of_a_full_page(
+        self, product_service: ProdutoServiceQuery, product_query
+    ):
+        product_query.get_order_ids = MagicMock(return_value=[4, 9])
+        product_query.count_orders = MagicMock(return_value={1: 5})
+
+        page = product_service.orders(1, after=2, limit=2)
+
+        product_query.get_order_ids.assert_called_once_with(1, 2, 2)
+        assert page.order_count == 5
+        assert page.orders == [4, 9]
+        assert page.next_after == 9
+
+    def test_orders_last_page_has_no_cursor(
+        self, product_service: ProdutoServiceQuery, product_query
+    ):
+        product_query.get_order_ids = MagicMock(return_value=[])
+        product_query.count_orders = MagicMock(return_value={})
+
+        page = product_service.orders(1)
+
+        assert page.order_count == 0
+        assert page.orders == []
+        assert page.next_after is None
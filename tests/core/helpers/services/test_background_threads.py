@@ -0,0 +1,42 @@
+import threading
+
+from src.core.helpers.services.background_threads import BackgroundThreads
+
+
+class TestBackgroundThreads:
+    def test_long_running_thread_must_be_alive(self):
+        registry = BackgroundThreads()
+        stop_event = threading.Event()
+        thread = threading.Thread(target=stop_event.wait, daemon=True)
+        thread.start()
+        registry.register("user_sync", thread, long_running=True)
+
+        assert registry.status()["user_sync"] == {
+            "alive": 1,
+            "long_running": True,
+            "healthy": True,
+        }
+
+        stop_event.set()
+        thread.join()
+        assert registry.status()["user_sync"]["healthy"] is False
+
+    def test_finished_short_lived_threads_are_dropped(self):
+        registry = BackgroundThreads()
+        thread = threading.Thread(target=lambda: None)
+        thread.start()
+        thread.join()
+        registry.register("notifier", thread)
+
+        assert registry.status()["notifier"] == {
+            "alive": 0,
+            "long_running": False,
+            "healthy": True,
+        }
+
+    def test_unregister(self):
+        registry = BackgroundThreads()
+        registry.register("user_sync", threading.Thread(), long_running=True)
+        registry.unregister("user_sync")
+
+        assert registry.status() == {}
@@ -0,0 +1,22 @@
+import asyncio
+import time
+
+from src.core.helpers.services.event_loop_lag_monitor import EventLoopLagMonitor
+
+
+class TestEventLoopLagMonitor:
+    def test_blocking_call_is_reported_as_lag(self):
+        monitor = EventLoopLagMonitor(interval=0.01)
+
+        async def block_loop():
+            monitor.start()
+            await asyncio.sleep(0.02)
+            time.sleep(0.1)
+            await asyncio.sleep(0.02)
+            running = monitor.running
+            await monitor.stop()
+            return running
+
+        assert asyncio.run(block_loop()) is True
+        assert monitor.max_lag_ms >= 50
+        assert monitor.status()["running"] is False
@@ -0,0 +1,45 @@
+from peewee import IntegrityError, SqliteDatabase
+import pytest
+
+from migration.builder import raw_creation
+from src.adapters.driven.infra import db_router
+from src.adapters.driven.infra.models.products import Product
+
+
+class TestRawCreation:
+    @pytest.fixture
+    def database(self, monkeypatch, tmp_path):
+        database = SqliteDatabase(str(tmp_path / "primary.db"))
+        monkeypatch.setattr(db_router, "primary", database)
+        yield database
+        database.close()
+
+    def test_creates_the_tables_twice(self, database):
+        raw_creation.create_tables()
+        raw_creation.create_tables()
+
+        assert database.table_exists(Product._meta.table_name)
+
+    def test_renames_names_differing_only_in_case_before_the_unique_index(
+        self, database
+    ):
+        raw_creation.create_tables()
+        database.execute_sql("DROP INDEX product_name_unique")
+        fritas = Product.create(name="Fritas")
+        shouted = Product.create(name="FRITAS")
+        deleted = Product.create(name="fritas", deleted_at=Product.created_at.default())
+        bacon = Product.create(name="bacon")
+
+        raw_creation.create_tables()
+
+        names = {
+            product.id: product.name for product in Product.select_including_deleted()
+        }
+        assert names == {
+            fritas.id: "Fritas",
+            shouted.id: f"FRITAS ({shouted.id})",
+            deleted.id: "fritas",
+            bacon.id: "bacon",
+        }
+        with pytest.raises(IntegrityError):
+            Product.create(name="fritas")
@@ -0,0 +1,30 @@
+from peewee import SqliteDatabase
+import pytest
+
+pytest.importorskip("faker")
+
+from migration.builder.raw_creation import create_tables
+from migration.seeder.seeder import seed_data
+from src.adapters.driven.infra import db_router
+from src.adapters.driven.infra.models.categories import Category
+from src.adapters.driven.infra.models.products import Product
+
+
+class TestSeeder:
+    @pytest.fixture
+    def database(self, monkeypatch, tmp_path):
+        database = SqliteDatabase(str(tmp_path / "primary.db"))
+        monkeypatch.setattr(db_router, "primary", database)
+        create_tables()
+        yield database
+        database.close()
+
+    def test_seeding_again_is_skipped(self, database):
+        seed_data()
+        products, categories = Product.select().count(), Category.select().count()
+
+        seed_data()
+
+        assert products > 0
+        assert Product.select().count() == products
+        assert Category.select().count() == categories
@@ -0,0 +1,36 @@
+from catalog_memory import MemoryFootprint, build_catalog, build_report, measure
+
+
+class TestCatalogMemory:
+    def test_catalog_lists_every_product_with_its_components(self):
+        catalog = build_catalog(5, components_per_product=2)
+
+        aggregates = catalog.to_aggregates()
+
+        assert catalog.ids == [1, 2, 3, 4, 5]
+        assert [len(aggregate.product.components) for aggregate in aggregates] == [
+            0,
+            0,
+            2,
+            2,
+            2,
+        ]
+        assert (
+            aggregates[2].product.components[0] is aggregates[3].product.components[0]
+        )
+
+    def test_catalog_is_smaller_than_the_aggregates(self):
+        catalog, aggregates = measure(200)
+
+        assert 0 < catalog.bytes < aggregates.bytes
+
+    def test_report_compares_with_the_aggregates(self):
+        report = build_report(
+            [
+                MemoryFootprint("catalog", 1000, 250_000),
+                MemoryFootprint("aggregates", 1000, 1_000_000),
+            ]
+        )
+
+        assert "250  25%" in report
+        assert "1000  100%" in report
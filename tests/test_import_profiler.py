@@ -0,0 +1,26 @@
+from import_profiler import ImportTiming, build_report, parse_import_times
+
+IMPORT_TIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     loguru._defaults
+import time:       300 |        420 |   loguru
+import time:      1000 |       1420 | app
+"""
+
+
+class TestImportProfiler:
+    def test_parse_import_times(self):
+        timings = parse_import_times(IMPORT_TIME_OUTPUT)
+
+        assert timings == [
+            ImportTiming("loguru._defaults", 120, 120, 2),
+            ImportTiming("loguru", 300, 420, 1),
+            ImportTiming("app", 1000, 1420, 0),
+        ]
+
+    def test_report_sums_top_level_imports(self):
+        report = build_report(parse_import_times(IMPORT_TIME_OUTPUT), 2048, top=2)
+
+        assert "Modules imported: 3" in report
+        assert "Total import time: 1.4 ms" in report
+        assert "Peak RSS: 2.0 MB" in report
+        assert "loguru._defaults" not in report
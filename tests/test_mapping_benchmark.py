@@ -0,0 +1,49 @@
+from mapping_benchmark import (
+    MappingTiming,
+    identity_mapped,
+    build_report,
+    build_rows,
+    measure,
+    trusted_from_db_to_domain,
+    validated_from_db_to_domain,
+)
+
+
+class TestMappingBenchmark:
+    def test_trusted_mapping_matches_the_validated_one(self):
+        for produto, components in build_rows(3):
+            trusted = trusted_from_db_to_domain(produto, components)
+            validated = validated_from_db_to_domain(produto, components)
+
+            assert trusted.model_dump_json() == validated.model_dump_json()
+            assert trusted.model_dump() == validated.model_dump()
+
+    def test_identity_map_shares_the_objects_of_one_result_set(self):
+        mapper = identity_mapped()
+        first, second = [mapper(*row) for row in build_rows(2)]
+
+        assert first.category is second.category
+        assert first.price.currency is second.price.currency
+        assert first.components[0] is second.components[0]
+        assert identity_mapped()(*build_rows(1)[0]).category is not first.category
+
+    def test_measure_maps_every_row(self):
+        calls = []
+
+        timing = measure(
+            "noop", lambda: lambda *row: calls.append(row), build_rows(4), 2
+        )
+
+        assert timing.rows == 4
+        assert len(calls) == 8
+
+    def test_report_compares_with_the_first_mapper(self):
+        report = build_report(
+            [
+                MappingTiming("validated", 1000, 0.05),
+                MappingTiming("trusted", 1000, 0.02),
+            ]
+        )
+
+        assert "50.00  x1.00" in report
+        assert "20.00  x2.50" in report
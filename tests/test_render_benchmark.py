@@ -0,0 +1,28 @@
+from peewee import SqliteDatabase
+
+from render_benchmark import QUERIES, RenderTiming, build_report, measure, seed
+
+
+class TestRenderBenchmark:
+    def test_every_query_renders_the_seeded_menu(self):
+        database = SqliteDatabase(":memory:")
+        seed(database, 5, components_per_product=2)
+
+        timings = [
+            measure(name, query(), database, 1) for name, query in QUERIES.items()
+        ]
+
+        assert [timing.products for timing in timings] == [5, 5]
+        assert timings[0].bytes == timings[1].bytes
+        database.close()
+
+    def test_report_compares_with_the_first_query(self):
+        report = build_report(
+            [
+                RenderTiming("orm", 1000, 2048, 0.05),
+                RenderTiming("json", 1000, 2048, 0.02),
+            ]
+        )
+
+        assert "2.0        50.0  x1.00" in report
+        assert "2.0        20.0  x2.50" in report
@@ -0,0 +1,124 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from server import build_options, cgroup_cpu_limit, worker_count
+
+
+class TestServer:
+    @pytest.fixture
+    def cgroup_v1(self, tmp_path):
+        quota = tmp_path / "cpu.cfs_quota_us"
+        period = tmp_path / "cpu.cfs_period_us"
+        period.write_text("100000\n")
+        return quota, period
+
+    def test_cgroup_v2_quota(self, tmp_path):
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("250000 100000\n")
+
+        assert cgroup_cpu_limit(str(cpu_max)) == 2.5
+
+    def test_cgroup_v2_unlimited(self, tmp_path):
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("max 100000\n")
+
+        assert cgroup_cpu_limit(str(cpu_max)) is None
+
+    def test_cgroup_v1_quota(self, tmp_path, cgroup_v1):
+        quota, period = cgroup_v1
+        quota.write_text("50000\n")
+
+        assert (
+            cgroup_cpu_limit(str(tmp_path / "missing"), str(quota), str(period)) == 0.5
+        )
+
+    def test_cgroup_v1_unlimited(self, tmp_path, cgroup_v1):
+        quota, period = cgroup_v1
+        quota.write_text("-1\n")
+
+        assert (
+            cgroup_cpu_limit(str(tmp_path / "missing"), str(quota), str(period)) is None
+        )
+
+    def test_worker_count_follows_cpu_quota(self, monkeypatch):
+        monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+        monkeypatch.setattr("server.cgroup_cpu_limit", lambda: 0.5)
+        monkeypatch.setattr("os.cpu_count", lambda: 8)
+
+        assert worker_count() == 1
+
+        monkeypatch.setattr("server.cgroup_cpu_limit", lambda: 2.5)
+        assert worker_count() == 3
+
+    def test_worker_count_is_capped_by_available_cpus(self, monkeypatch):
+        monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+        monkeypatch.setattr("server.cgroup_cpu_limit", lambda: None)
+        monkeypatch.setattr("os.cpu_count", lambda: 4)
+
+        assert worker_count() == 4
+
+    def test_worker_count_from_environment(self, monkeypatch):
+        monkeypatch.setenv("WEB_CONCURRENCY", "6")
+
+        assert worker_count() == 6
+
+    def test_options_preload_and_recycle_workers(self, monkeypatch):
+        monkeypatch.setenv("WORKER_MAX_REQUESTS", "500")
+
+        options = build_options()
+
+        assert options["preload_app"] is True
+        assert options["max_requests"] == 500
+        assert options["worker_class"] == "uvicorn_worker.UvicornWorker"
+
+    def test_database_is_prepared_once_before_the_warm_up(self, monkeypatch):
+        import app as app_module
+        from server import load_app
+        from src.adapters.driven.infra.database import db
+
+        calls = []
+        container = MagicMock()
+        container.warm_up.side_effect = lambda: calls.append("warm_up")
+        monkeypatch.setattr(app_module, "prepare_db", lambda: calls.append("prepare"))
+        monkeypatch.setattr(db, "start_db", lambda: None)
+        monkeypatch.setattr(db, "dispose_db", lambda: None)
+        monkeypatch.setattr(
+            "src.adapters.driver.API.dependencies.produto_dependencies"
+            ".get_produto_container",
+            lambda: container,
+        )
+        monkeypatch.setattr("gc.freeze", lambda: None)
+        monkeypatch.setattr(app_module.app.state, "db_prepared", False, raising=False)
+
+        assert load_app() is app_module.app
+        assert calls == ["prepare", "warm_up"]
+        assert app_module.app.state.db_prepared is True
+
+    def test_pool_is_emptied_before_forking(self, monkeypatch, tmp_path):
+        import app as app_module
+        from playhouse.pool import PooledSqliteDatabase
+
+        from server import load_app
+        from src.adapters.driven.infra.database import db
+        from src.adapters.driven.infra.database.db_router import DatabaseRouter
+
+        router = DatabaseRouter(PooledSqliteDatabase(str(tmp_path / "pool.db")))
+        container = MagicMock()
+        container.warm_up.side_effect = lambda: router.primary.execute_sql("SELECT 1")
+        monkeypatch.setattr(db, "db_router", router)
+        monkeypatch.setattr(db, "start_db", lambda: router.primary.connect())
+        monkeypatch.setattr(app_module, "prepare_db", lambda: None)
+        monkeypatch.setattr(
+            "src.adapters.driver.API.dependencies.produto_dependencies"
+            ".get_produto_container",
+            lambda: container,
+        )
+        monkeypatch.setattr("gc.freeze", lambda: None)
+        monkeypatch.setattr(app_module.app.state, "db_prepared", False, raising=False)
+
+        load_app()
+
+        assert router.primary.is_closed()
+        assert router.primary._connections == []
+        assert router.primary._in_use == {}